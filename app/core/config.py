@@ -1,4 +1,8 @@
 import os
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict
 from dotenv import load_dotenv
 import logging
 
@@ -8,6 +12,30 @@ load_dotenv()
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 이벤트 이름과 테이블 이름에 허용되는 문자 (SQL 인젝션 및 URL 경로 문제 방지)
+SAFE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+
+@dataclass(frozen=True)
+class EventSettings:
+    """이벤트(네임스페이스)별 설정: 항목 테이블, 모니터 수, 임계값, 표시 시간"""
+    name: str
+    table_name: str
+    archive_table_name: str
+    changefeed_table_name: str
+    dedup_table_name: str
+    monitor_count: int
+    old_data_threshold_minutes: float
+    item_display_duration: float
+    no_new_items_display_duration: float
+    # 적응형 표시 시간: 대기 항목이 없으면 max, adaptive_backlog_high 개 이상이면 min (min == max 이면 고정)
+    min_item_display_duration: float
+    max_item_display_duration: float
+    adaptive_backlog_high: int
+
+    @property
+    def adaptive_display(self) -> bool:
+        return self.min_item_display_duration < self.max_item_display_duration
+
 class Settings:
     # 데이터베이스 설정
     DB_HOST: str = os.getenv("DB_HOST", "localhost")
@@ -15,32 +43,304 @@ class Settings:
     DB_USER: str = os.getenv("DB_USER", "root")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "password")
     DB_NAME: str = os.getenv("DB_NAME", "monitor_db")
+    DB_POOL_MINSIZE: int = int(os.getenv("DB_POOL_MINSIZE", "1"))
+    DB_POOL_MAXSIZE: int = int(os.getenv("DB_POOL_MAXSIZE", "10"))
+    # 읽기 전용 복제본 설정 (DB_REPLICA_HOST 가 비어 있으면 모든 조회를 주 DB로 보냄)
+    DB_REPLICA_HOST: str = os.getenv("DB_REPLICA_HOST", "")
+    DB_REPLICA_PORT: int = int(os.getenv("DB_REPLICA_PORT", str(DB_PORT)))
+    DB_REPLICA_USER: str = os.getenv("DB_REPLICA_USER", DB_USER)
+    DB_REPLICA_PASSWORD: str = os.getenv("DB_REPLICA_PASSWORD", DB_PASSWORD)
+    DB_REPLICA_POOL_MAXSIZE: int = int(os.getenv("DB_REPLICA_POOL_MAXSIZE", "10"))
+    # 복제본에 반영된 최대 no 를 다시 확인하는 간격(초)
+    REPLICA_WATERMARK_TTL_SECONDS: float = float(os.getenv("REPLICA_WATERMARK_TTL_SECONDS", "1"))
+    # 모니터에 항목을 할당한 뒤 해당 모니터의 조회를 주 DB로 보내는 시간(초) - 복제 지연보다 길게 설정
+    REPLICA_STICKY_SECONDS: float = float(os.getenv("REPLICA_STICKY_SECONDS", "2"))
+    # 수집(ingest) 요청과 백그라운드 작업이 몰려도 모니터 표시 경로가 사용할 수 있도록 예약하는 연결 수
+    DB_DISPLAY_RESERVED_CONNECTIONS: int = int(os.getenv("DB_DISPLAY_RESERVED_CONNECTIONS", "4"))
+
+    # DB 작업별 마감 시간(초): 클라이언트 측 취소와 서버 측 max_statement_time 으로 함께 적용
+    # 모니터 표시 경로의 조회는 짧게, 워커의 잠금 조회/할당은 잠금 대기를 고려해 길게 설정
+    DB_QUERY_TIMEOUT_SECONDS: float = float(os.getenv("DB_QUERY_TIMEOUT_SECONDS", "5"))
+    DB_DISPLAY_QUERY_TIMEOUT_SECONDS: float = float(os.getenv("DB_DISPLAY_QUERY_TIMEOUT_SECONDS", "2"))
+    DB_WORKER_QUERY_TIMEOUT_SECONDS: float = float(os.getenv("DB_WORKER_QUERY_TIMEOUT_SECONDS", "10"))
+    # 작업 이름별 개별 마감 시간 (JSON, 예: {"get_items_to_process": 20, "get_new_items_for_monitor": 1})
+    DB_OPERATION_TIMEOUTS_JSON: str = os.getenv("DB_OPERATION_TIMEOUTS", "")
+    # 서버 측 문장 제한(SET STATEMENT max_statement_time=N FOR ...) 사용 여부 - MariaDB 10.1 이상 필요
+    DB_SERVER_STATEMENT_TIMEOUT_ENABLED: bool = os.getenv("DB_SERVER_STATEMENT_TIMEOUT_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    # DB 차단기 설정: 연결 단절/마감 시간 초과가 연속 N번 나면 DB 요청을 멈추고,
+    # 지수적으로 늘어나는 대기 시간(BASE~MAX)마다 시험 요청 하나만 보내 복구를 확인 (그동안 모니터는 메모리 큐로 표시)
+    DB_BREAKER_ENABLED: bool = os.getenv("DB_BREAKER_ENABLED", "true").lower() in ("1", "true", "yes")
+    DB_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("DB_BREAKER_FAILURE_THRESHOLD", "5"))
+    DB_BREAKER_BASE_BACKOFF_SECONDS: float = float(os.getenv("DB_BREAKER_BASE_BACKOFF_SECONDS", "1"))
+    DB_BREAKER_MAX_BACKOFF_SECONDS: float = float(os.getenv("DB_BREAKER_MAX_BACKOFF_SECONDS", "30"))
+
+    # 수집 요청 허용 제어 설정 (토큰 버킷 + DB 연결 대기열)
+    INGEST_RATE_PER_SECOND: float = float(os.getenv("INGEST_RATE_PER_SECOND", "20"))
+    INGEST_BURST: float = float(os.getenv("INGEST_BURST", "40"))
+    # 클라이언트(IP)별 제한은 기본 비활성화: 프록시 뒤에 있거나 여러 손님이 키오스크를 함께 쓰면
+    # 모든 요청이 같은 IP로 보여 행사장 전체가 한 버킷에 묶이기 때문 (TRUSTED_PROXY_HOSTS 설정 후 사용 권장)
+    INGEST_CLIENT_LIMIT_ENABLED: bool = os.getenv("INGEST_CLIENT_LIMIT_ENABLED", "false").lower() in ("1", "true", "yes")
+    INGEST_CLIENT_RATE_PER_SECOND: float = float(os.getenv("INGEST_CLIENT_RATE_PER_SECOND", "5"))
+    INGEST_CLIENT_BURST: float = float(os.getenv("INGEST_CLIENT_BURST", "20"))
+    # X-Forwarded-For 를 신뢰할 프록시 주소 (쉼표 구분, "*" 이면 모든 주소) - 비어 있으면 헤더를 무시하고 연결 주소 사용
+    TRUSTED_PROXY_HOSTS: str = os.getenv("TRUSTED_PROXY_HOSTS", "")
+    INGEST_MAX_WAITING: int = int(os.getenv("INGEST_MAX_WAITING", "20"))
+    INGEST_SLOT_TIMEOUT_SECONDS: float = float(os.getenv("INGEST_SLOT_TIMEOUT_SECONDS", "2"))
+    # 중복 제출 병합: 정규화한 텍스트가 같은 요청이 이 시간(초) 안에 다시 오면 새로 저장하지 않고 기존 no 반환
+    # 여러 프로세스 간에는 {테이블}_dedup 테이블의 기본 키로 보장
+    DEDUP_ENABLED: bool = os.getenv("DEDUP_ENABLED", "false").lower() in ("1", "true", "yes")
+    DEDUP_WINDOW_SECONDS: int = int(os.getenv("DEDUP_WINDOW_SECONDS", "10"))
 
     # 테이블 설정
     ITEMS_TABLE_NAME: str = os.getenv("ITEMS_TABLE_NAME", "event")
 
+    # 보관(아카이브) 설정: 표시가 끝난 지 오래된 행을 이력 테이블로 옮겨 운영 테이블을 작게 유지
+    ARCHIVE_ENABLED: bool = os.getenv("ARCHIVE_ENABLED", "false").lower() in ("1", "true", "yes")
+    ARCHIVE_TABLE_NAME: str = os.getenv("ARCHIVE_TABLE_NAME", f"{ITEMS_TABLE_NAME}_history")
+    ARCHIVE_RETENTION_MINUTES: float = float(os.getenv("ARCHIVE_RETENTION_MINUTES", "1440"))
+    ARCHIVE_BATCH_SIZE: int = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+    ARCHIVE_INTERVAL_SECONDS: int = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", "300"))
+
     # 시간대 설정
     SERVER_TIMEZONE: str = os.getenv("SERVER_TIMEZONE", "Asia/Seoul")
 
+    # 할당 변경 피드 설정: 할당과 같은 트랜잭션에서 {테이블}_changefeed 에 (seq, 항목 no, 모니터 ID)를 기록하고
+    # 각 프로세스는 마지막 seq 이후만 읽어 새 할당이 있는 모니터만 큐를 다시 조회
+    CHANGEFEED_ENABLED: bool = os.getenv("CHANGEFEED_ENABLED", "false").lower() in ("1", "true", "yes")
+    CHANGEFEED_POLL_INTERVAL_SECONDS: float = float(os.getenv("CHANGEFEED_POLL_INTERVAL_SECONDS", "1"))
+    CHANGEFEED_BATCH_SIZE: int = int(os.getenv("CHANGEFEED_BATCH_SIZE", "500"))
+    CHANGEFEED_RETENTION_MINUTES: float = float(os.getenv("CHANGEFEED_RETENTION_MINUTES", "60"))
+    # seq 는 삽입 시 정해지지만 커밋 순서는 다를 수 있으므로, 건너뛴 seq 를 이 시간(초) 동안 다시 확인
+    # (워커 쿼리 마감 시간보다 길게 두어 늦게 커밋되는 할당도 놓치지 않도록 함)
+    CHANGEFEED_GAP_GRACE_SECONDS: float = float(os.getenv("CHANGEFEED_GAP_GRACE_SECONDS", "15"))
+    # 피드를 놓치더라도 큐가 계속 멈춰 있지 않도록 모니터 큐를 이 간격(초)마다 한 번은 DB에서 다시 읽음
+    CHANGEFEED_SAFETY_REFRESH_SECONDS: float = float(os.getenv("CHANGEFEED_SAFETY_REFRESH_SECONDS", "30"))
+
     # 워커 설정
     CHECK_INTERVAL_SECONDS: int = int(os.getenv("CHECK_INTERVAL_SECONDS", "10"))
     OLD_DATA_THRESHOLD_MINUTES: float = float(os.getenv("OLD_DATA_THRESHOLD_MINUTES", "5"))
+    # 여러 프로세스/컨테이너 중 DB 잠금(GET_LOCK)을 얻은 하나만 할당 작업을 수행
+    WORKER_LEADER_LOCK_ENABLED: bool = os.getenv("WORKER_LEADER_LOCK_ENABLED", "true").lower() in ("1", "true", "yes")
+    WORKER_LOCK_NAME: str = os.getenv("WORKER_LOCK_NAME", f"monitor_assign_worker_{ITEMS_TABLE_NAME}")
 
     # 모니터 설정
     MONITOR_COUNT: int = int(os.getenv("MONITOR_COUNT", "3"))
-    
+    ITEM_DISPLAY_DURATION: float = float(os.getenv("ITEM_DISPLAY_DURATION", "20"))  # 각 항목이 표시되는 시간(초)
+    NO_NEW_ITEMS_DISPLAY_DURATION: float = float(os.getenv("NO_NEW_ITEMS_DISPLAY_DURATION", "5"))  # 새 항목이 없을 때 표시 시간(초)
+    # 적응형 표시 시간 범위(초): 모니터 대기 항목이 많을수록 MIN 쪽으로 줄이고, 한가하면 MAX 로 늘림
+    # 둘 다 설정하지 않으면 ITEM_DISPLAY_DURATION 고정
+    ITEM_DISPLAY_DURATION_MIN: float = float(os.getenv("ITEM_DISPLAY_DURATION_MIN", str(ITEM_DISPLAY_DURATION)))
+    ITEM_DISPLAY_DURATION_MAX: float = float(os.getenv("ITEM_DISPLAY_DURATION_MAX", str(ITEM_DISPLAY_DURATION)))
+    # 이 수 이상의 항목이 대기 중이면 최소 표시 시간 적용
+    ADAPTIVE_BACKLOG_HIGH: int = int(os.getenv("ADAPTIVE_BACKLOG_HIGH", "20"))
+    # 모니터 화면의 텍스트 영역(#text-content) 너비(px) - 서버에서 글자 크기를 계산할 때 사용
+    LAYOUT_TEXT_AREA_WIDTH_PX: float = float(os.getenv("LAYOUT_TEXT_AREA_WIDTH_PX", "1152"))
+
+    # 이벤트(네임스페이스) 설정
+    # 위의 단일 테이블/모니터 설정은 기본 이벤트(DEFAULT_EVENT_NAME)가 되며,
+    # EVENTS 에 JSON 목록으로 이벤트를 추가하면 하나의 서버에서 함께 운영합니다.
+    # 예: [{"name": "hall_b", "table": "event_hall_b", "monitor_count": 2, "item_display_duration": 15}]
+    DEFAULT_EVENT_NAME: str = os.getenv("DEFAULT_EVENT_NAME", "default")
+    EVENTS_JSON: str = os.getenv("EVENTS", "")
+
+    # SSE 연결 설정 (프로세스 단위 제한)
+    SSE_MAX_CONNECTIONS: int = int(os.getenv("SSE_MAX_CONNECTIONS", "100"))
+    SSE_MAX_CONNECTIONS_PER_MONITOR: int = int(os.getenv("SSE_MAX_CONNECTIONS_PER_MONITOR", "5"))
+    # 재연결 시 Last-Event-ID 로 이어받을 수 있도록 모니터별로 보관하는 최근 프레임 수
+    SSE_REPLAY_BUFFER_SIZE: int = int(os.getenv("SSE_REPLAY_BUFFER_SIZE", "30"))
+
+    # 푸시 전송 설정: SSE 연결을 유지할 수 없는 모니터에 표시 차례가 된 항목을 HTML로 렌더링해 POST
+    # PUSH_MONITOR_URLS 는 모니터 키(기본 이벤트는 "1", 다른 이벤트는 "hall_b/1")별 URL의 JSON 객체
+    # 예: {"1": "http://tablet-1.local/receive", "hall_b/1": "http://localhost:8000/mock_monitor_endpoint/"}
+    PUSH_DELIVERY_ENABLED: bool = os.getenv("PUSH_DELIVERY_ENABLED", "false").lower() in ("1", "true", "yes")
+    PUSH_MONITOR_URLS_JSON: str = os.getenv("PUSH_MONITOR_URLS", "")
+    # 공유 keep-alive 연결 풀 크기이자 모든 엔드포인트를 합한 동시 요청 수 상한
+    # (엔드포인트마다 한 번에 하나씩, 재시도가 끝난 뒤 다음 항목을 보내므로 모니터별 도착 순서가 보장됨)
+    PUSH_MAX_CONNECTIONS: int = int(os.getenv("PUSH_MAX_CONNECTIONS", "20"))
+    PUSH_TIMEOUT_SECONDS: float = float(os.getenv("PUSH_TIMEOUT_SECONDS", "5"))
+    # 실패 시 재시도 횟수와 첫 재시도 대기 시간(초) - 재시도마다 두 배, 0~대기 시간 사이 무작위(지터)
+    PUSH_MAX_RETRIES: int = int(os.getenv("PUSH_MAX_RETRIES", "3"))
+    PUSH_RETRY_BASE_SECONDS: float = float(os.getenv("PUSH_RETRY_BASE_SECONDS", "0.5"))
+    # 엔드포인트별 전송 대기열 크기 (가득 차면 새 전송은 버리고 dropped 로 기록)
+    PUSH_QUEUE_SIZE: int = int(os.getenv("PUSH_QUEUE_SIZE", "1000"))
+
+    # 프로파일링 설정 (기본 비활성화 - 운영 중 재배포 없이 켜서 병목을 찾을 때 사용)
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+    # 이벤트 루프 지연 측정 간격(초)과 스택을 기록할 지연 임계값(밀리초)
+    LOOP_LAG_CHECK_INTERVAL_SECONDS: float = float(os.getenv("LOOP_LAG_CHECK_INTERVAL_SECONDS", "0.5"))
+    LOOP_LAG_THRESHOLD_MS: float = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "200"))
+    PROFILE_MAX_SECONDS: float = float(os.getenv("PROFILE_MAX_SECONDS", "30"))
+    # 관리자 엔드포인트 토큰 (설정하면 X-Admin-Token 헤더가 일치해야 함)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+
     def __init__(self):
+        # 이벤트 설정 구성
+        self.EVENTS: Dict[str, EventSettings] = self._load_events()
+        self.DEFAULT_EVENT: EventSettings = self.EVENTS[self.DEFAULT_EVENT_NAME]
+        # DB 작업별 개별 마감 시간
+        self.DB_OPERATION_TIMEOUTS: Dict[str, float] = self._load_operation_timeouts()
+        # 모니터별 푸시 전송 URL
+        self.PUSH_MONITOR_URLS: Dict[str, str] = self._load_push_monitor_urls()
         # 설정 유효성 검사
         self._validate_settings()
         # 설정 로깅
         self._log_settings()
     
+    def _load_events(self) -> Dict[str, EventSettings]:
+        """기본 이벤트와 EVENTS 환경 변수에 정의된 이벤트 설정을 구성합니다."""
+        events = {
+            self.DEFAULT_EVENT_NAME: EventSettings(
+                name=self.DEFAULT_EVENT_NAME,
+                table_name=self.ITEMS_TABLE_NAME,
+                archive_table_name=self.ARCHIVE_TABLE_NAME,
+                changefeed_table_name=f"{self.ITEMS_TABLE_NAME}_changefeed",
+                dedup_table_name=f"{self.ITEMS_TABLE_NAME}_dedup",
+                monitor_count=self.MONITOR_COUNT,
+                old_data_threshold_minutes=self.OLD_DATA_THRESHOLD_MINUTES,
+                item_display_duration=self.ITEM_DISPLAY_DURATION,
+                no_new_items_display_duration=self.NO_NEW_ITEMS_DISPLAY_DURATION,
+                min_item_display_duration=self.ITEM_DISPLAY_DURATION_MIN,
+                max_item_display_duration=self.ITEM_DISPLAY_DURATION_MAX,
+                adaptive_backlog_high=self.ADAPTIVE_BACKLOG_HIGH,
+            )
+        }
+        if not self.EVENTS_JSON:
+            return events
+
+        try:
+            event_configs = json.loads(self.EVENTS_JSON)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"EVENTS is not valid JSON: {e}")
+
+        for config in event_configs:
+            if "name" not in config or "table" not in config:
+                raise ValueError("Each entry in EVENTS must have 'name' and 'table'.")
+            item_display_duration = float(config.get("item_display_duration", self.ITEM_DISPLAY_DURATION))
+            events[config["name"]] = EventSettings(
+                name=config["name"],
+                table_name=config["table"],
+                archive_table_name=config.get("archive_table", f"{config['table']}_history"),
+                changefeed_table_name=f"{config['table']}_changefeed",
+                dedup_table_name=f"{config['table']}_dedup",
+                monitor_count=int(config.get("monitor_count", self.MONITOR_COUNT)),
+                old_data_threshold_minutes=float(config.get("old_data_threshold_minutes", self.OLD_DATA_THRESHOLD_MINUTES)),
+                item_display_duration=item_display_duration,
+                no_new_items_display_duration=float(config.get("no_new_items_display_duration", self.NO_NEW_ITEMS_DISPLAY_DURATION)),
+                min_item_display_duration=float(config.get("min_item_display_duration", item_display_duration)),
+                max_item_display_duration=float(config.get("max_item_display_duration", item_display_duration)),
+                adaptive_backlog_high=int(config.get("adaptive_backlog_high", self.ADAPTIVE_BACKLOG_HIGH)),
+            )
+        return events
+
+    def _load_operation_timeouts(self) -> Dict[str, float]:
+        """DB_OPERATION_TIMEOUTS 환경 변수의 작업별 마감 시간을 읽습니다."""
+        if not self.DB_OPERATION_TIMEOUTS_JSON:
+            return {}
+        try:
+            timeouts = json.loads(self.DB_OPERATION_TIMEOUTS_JSON)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"DB_OPERATION_TIMEOUTS is not valid JSON: {e}")
+        if not isinstance(timeouts, dict):
+            raise ValueError("DB_OPERATION_TIMEOUTS must be a JSON object of operation name to seconds.")
+        return {operation: float(seconds) for operation, seconds in timeouts.items()}
+
+    def _load_push_monitor_urls(self) -> Dict[str, str]:
+        """PUSH_MONITOR_URLS 환경 변수의 모니터별 전송 URL을 읽습니다."""
+        if not self.PUSH_MONITOR_URLS_JSON:
+            return {}
+        try:
+            urls = json.loads(self.PUSH_MONITOR_URLS_JSON)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"PUSH_MONITOR_URLS is not valid JSON: {e}")
+        if not isinstance(urls, dict):
+            raise ValueError("PUSH_MONITOR_URLS must be a JSON object of monitor key to URL.")
+        return {str(monitor_key): url for monitor_key, url in urls.items()}
+
     def _validate_settings(self):
         """설정값 유효성 검사"""
         # 모니터 수가 1보다 작으면 오류 발생
         if self.MONITOR_COUNT < 1:
             raise ValueError("MONITOR_COUNT must be at least 1.")
-        
+
+        # 이벤트별 설정 검사 (테이블 이름은 여기서 한 번만 검증)
+        table_names = set()
+        for event in self.EVENTS.values():
+            for name in (event.name, event.table_name, event.archive_table_name, event.changefeed_table_name, event.dedup_table_name):
+                if not SAFE_NAME_PATTERN.match(name):
+                    raise ValueError(f"'{name}' in event '{event.name}' is not safe. Only letters, digits and underscores are allowed.")
+            if event.table_name in table_names:
+                raise ValueError(f"Table '{event.table_name}' is used by more than one event.")
+            table_names.add(event.table_name)
+            if event.monitor_count < 1:
+                raise ValueError(f"monitor_count of event '{event.name}' must be at least 1.")
+            if not (0 < event.min_item_display_duration <= event.max_item_display_duration):
+                raise ValueError(f"Display duration bounds of event '{event.name}' must satisfy 0 < min <= max.")
+            if event.adaptive_backlog_high < 1:
+                raise ValueError(f"adaptive_backlog_high of event '{event.name}' must be at least 1.")
+
+        # 연결 풀 크기 검사 (예약 연결을 제외하고 수집 경로에 최소 1개는 남아야 함)
+        if self.DB_POOL_MAXSIZE < 1 or self.DB_POOL_MINSIZE > self.DB_POOL_MAXSIZE:
+            raise ValueError("DB_POOL_MAXSIZE must be at least 1 and not smaller than DB_POOL_MINSIZE.")
+        if self.DB_DISPLAY_RESERVED_CONNECTIONS >= self.DB_POOL_MAXSIZE:
+            logger.warning(f"DB_DISPLAY_RESERVED_CONNECTIONS ({self.DB_DISPLAY_RESERVED_CONNECTIONS}) leaves no pool slot for ingest and background jobs; they will share 1 slot.")
+
+        # DB 마감 시간 검사
+        deadlines = [self.DB_QUERY_TIMEOUT_SECONDS, self.DB_DISPLAY_QUERY_TIMEOUT_SECONDS,
+                     self.DB_WORKER_QUERY_TIMEOUT_SECONDS, *self.DB_OPERATION_TIMEOUTS.values()]
+        if any(seconds <= 0 for seconds in deadlines):
+            raise ValueError("DB query timeouts must be positive.")
+
+        # DB 차단기 설정 검사
+        if self.DB_BREAKER_FAILURE_THRESHOLD < 1:
+            raise ValueError("DB_BREAKER_FAILURE_THRESHOLD must be at least 1.")
+        if not (0 < self.DB_BREAKER_BASE_BACKOFF_SECONDS <= self.DB_BREAKER_MAX_BACKOFF_SECONDS):
+            raise ValueError("DB breaker backoff must satisfy 0 < DB_BREAKER_BASE_BACKOFF_SECONDS <= DB_BREAKER_MAX_BACKOFF_SECONDS.")
+
+        # 푸시 전송 설정 검사
+        if self.PUSH_MAX_CONNECTIONS < 1 or self.PUSH_QUEUE_SIZE < 1:
+            raise ValueError("PUSH_MAX_CONNECTIONS and PUSH_QUEUE_SIZE must be at least 1.")
+        if self.PUSH_TIMEOUT_SECONDS <= 0 or self.PUSH_RETRY_BASE_SECONDS <= 0 or self.PUSH_MAX_RETRIES < 0:
+            raise ValueError("PUSH_TIMEOUT_SECONDS and PUSH_RETRY_BASE_SECONDS must be positive and PUSH_MAX_RETRIES not negative.")
+        if self.PUSH_DELIVERY_ENABLED and not self.PUSH_MONITOR_URLS:
+            logger.warning("PUSH_DELIVERY_ENABLED is set but PUSH_MONITOR_URLS is empty; no items will be pushed.")
+
+        # 토큰 버킷 설정 검사
+        if self.INGEST_RATE_PER_SECOND <= 0 or self.INGEST_CLIENT_RATE_PER_SECOND <= 0:
+            raise ValueError("INGEST_RATE_PER_SECOND and INGEST_CLIENT_RATE_PER_SECOND must be positive.")
+        if self.INGEST_BURST < 1 or self.INGEST_CLIENT_BURST < 1:
+            raise ValueError("INGEST_BURST and INGEST_CLIENT_BURST must be at least 1.")
+
+        # SSE 연결 제한이 1보다 작으면 오류 발생
+        if self.SSE_MAX_CONNECTIONS < 1 or self.SSE_MAX_CONNECTIONS_PER_MONITOR < 1:
+            raise ValueError("SSE_MAX_CONNECTIONS and SSE_MAX_CONNECTIONS_PER_MONITOR must be at least 1.")
+        if self.SSE_REPLAY_BUFFER_SIZE < 1:
+            raise ValueError("SSE_REPLAY_BUFFER_SIZE must be at least 1.")
+
+        # 프로파일링 측정 간격/임계값 검사
+        if self.PROFILING_ENABLED and (self.LOOP_LAG_CHECK_INTERVAL_SECONDS <= 0 or self.LOOP_LAG_THRESHOLD_MS <= 0):
+            raise ValueError("LOOP_LAG_CHECK_INTERVAL_SECONDS and LOOP_LAG_THRESHOLD_MS must be positive.")
+        if self.PROFILING_ENABLED and not self.ADMIN_TOKEN:
+            logger.warning("PROFILING_ENABLED is set without ADMIN_TOKEN; /admin endpoints are not protected.")
+
+        # 중복 제출 병합 설정 검사
+        if self.DEDUP_WINDOW_SECONDS < 1:
+            raise ValueError("DEDUP_WINDOW_SECONDS must be at least 1.")
+
+        # 변경 피드 설정 검사
+        if self.CHANGEFEED_POLL_INTERVAL_SECONDS <= 0 or self.CHANGEFEED_BATCH_SIZE < 1:
+            raise ValueError("CHANGEFEED_POLL_INTERVAL_SECONDS must be positive and CHANGEFEED_BATCH_SIZE at least 1.")
+        if self.CHANGEFEED_GAP_GRACE_SECONDS < 0 or self.CHANGEFEED_SAFETY_REFRESH_SECONDS <= 0:
+            raise ValueError("CHANGEFEED_GAP_GRACE_SECONDS must not be negative and CHANGEFEED_SAFETY_REFRESH_SECONDS must be positive.")
+
+        # 아카이브 배치 크기가 1보다 작으면 오류 발생
+        if self.ARCHIVE_BATCH_SIZE < 1:
+            raise ValueError("ARCHIVE_BATCH_SIZE must be at least 1.")
+
+        # 보관 기간이 데이터 임계값보다 짧으면 아직 표시되지 않은 항목이 옮겨질 수 있으므로 경고
+        if self.ARCHIVE_ENABLED and self.ARCHIVE_RETENTION_MINUTES < self.OLD_DATA_THRESHOLD_MINUTES * 2:
+            logger.warning(f"ARCHIVE_RETENTION_MINUTES is set to {self.ARCHIVE_RETENTION_MINUTES}, which might archive items before they are displayed.")
+
         # 체크 간격이 너무 짧으면 경고
         if self.CHECK_INTERVAL_SECONDS < 5:
             logger.warning(f"CHECK_INTERVAL_SECONDS is set to {self.CHECK_INTERVAL_SECONDS}, which might be too short.")
@@ -53,10 +353,36 @@ class Settings:
         """현재 설정 로깅"""
         logger.info("=== 애플리케이션 설정 ===")
         logger.info(f"데이터베이스: {self.DB_NAME} @ {self.DB_HOST}:{self.DB_PORT}")
+        if self.DB_REPLICA_HOST:
+            logger.info(f"읽기 복제본: {self.DB_REPLICA_HOST}:{self.DB_REPLICA_PORT} (할당 후 {self.REPLICA_STICKY_SECONDS}초간 주 DB 조회)")
+        logger.info(f"연결 풀: {self.DB_POOL_MINSIZE}~{self.DB_POOL_MAXSIZE}개 (표시 경로 예약 {self.DB_DISPLAY_RESERVED_CONNECTIONS}개)")
+        logger.info(f"DB 마감 시간: 표시 {self.DB_DISPLAY_QUERY_TIMEOUT_SECONDS}초, 워커 {self.DB_WORKER_QUERY_TIMEOUT_SECONDS}초, 기타 {self.DB_QUERY_TIMEOUT_SECONDS}초"
+                    f"{' (서버 측 max_statement_time 적용)' if self.DB_SERVER_STATEMENT_TIMEOUT_ENABLED else ''}")
+        if self.DB_BREAKER_ENABLED:
+            logger.info(f"DB 차단기: 연속 {self.DB_BREAKER_FAILURE_THRESHOLD}회 실패 시 차단, 시험 간격 {self.DB_BREAKER_BASE_BACKOFF_SECONDS}~{self.DB_BREAKER_MAX_BACKOFF_SECONDS}초")
+        client_limit = f"클라이언트당 초당 {self.INGEST_CLIENT_RATE_PER_SECOND}건" if self.INGEST_CLIENT_LIMIT_ENABLED else "클라이언트별 제한 없음"
+        logger.info(f"수집 제한: 전체 초당 {self.INGEST_RATE_PER_SECOND}건, {client_limit}")
         logger.info(f"테이블: {self.ITEMS_TABLE_NAME}")
+        if self.DEDUP_ENABLED:
+            logger.info(f"중복 제출 병합: {self.DEDUP_WINDOW_SECONDS}초 이내 같은 텍스트")
+        if self.ARCHIVE_ENABLED:
+            logger.info(f"아카이브: {self.ARCHIVE_TABLE_NAME} (보관 기간 {self.ARCHIVE_RETENTION_MINUTES}분, 배치 {self.ARCHIVE_BATCH_SIZE}개)")
+        if self.CHANGEFEED_ENABLED:
+            logger.info(f"할당 변경 피드: 사용 ({self.CHANGEFEED_POLL_INTERVAL_SECONDS}초 간격, 보관 {self.CHANGEFEED_RETENTION_MINUTES}분, 누락 seq 재확인 {self.CHANGEFEED_GAP_GRACE_SECONDS}초, 큐 강제 갱신 {self.CHANGEFEED_SAFETY_REFRESH_SECONDS}초)")
         logger.info(f"시간대: {self.SERVER_TIMEZONE}")
         logger.info(f"모니터 수: {self.MONITOR_COUNT}")
+        if len(self.EVENTS) > 1:
+            for event in self.EVENTS.values():
+                logger.info(f"이벤트 '{event.name}': 테이블 {event.table_name}, 모니터 {event.monitor_count}개, 표시 {event.item_display_duration}초")
+        if self.DEFAULT_EVENT.adaptive_display:
+            logger.info(f"적응형 표시 시간: {self.ITEM_DISPLAY_DURATION_MIN}~{self.ITEM_DISPLAY_DURATION_MAX}초 (대기 {self.ADAPTIVE_BACKLOG_HIGH}개 이상이면 최소)")
+        if self.PUSH_DELIVERY_ENABLED:
+            logger.info(f"푸시 전송: 모니터 {len(self.PUSH_MONITOR_URLS)}개, 연결 풀 {self.PUSH_MAX_CONNECTIONS}개, 엔드포인트당 순서대로 1건씩, 재시도 {self.PUSH_MAX_RETRIES}회")
+        logger.info(f"SSE 연결 제한: 전체 {self.SSE_MAX_CONNECTIONS}개, 모니터당 {self.SSE_MAX_CONNECTIONS_PER_MONITOR}개")
+        if self.PROFILING_ENABLED:
+            logger.info(f"프로파일링: 사용 (루프 지연 임계값 {self.LOOP_LAG_THRESHOLD_MS}ms)")
         logger.info(f"체크 간격: {self.CHECK_INTERVAL_SECONDS}초")
+        logger.info(f"워커 리더 잠금: {self.WORKER_LOCK_NAME if self.WORKER_LEADER_LOCK_ENABLED else '사용 안 함'}")
         logger.info(f"데이터 임계값: {self.OLD_DATA_THRESHOLD_MINUTES}분")
         logger.info("=====================")
 
@@ -1,13 +1,82 @@
 import aiomysql
+import asyncio
 import logging
 import datetime
 import re
-from .core.config import settings
+import time
+from typing import Dict, Optional
+from .core.config import settings, EventSettings
+from .internal import counters
+from .internal.records import ItemRecord
+from .internal.circuit_breaker import DB_BREAKER, REPLICA_BREAKER, HALF_OPEN, CircuitBreaker, CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
 # 연결 풀 변수
 DB_POOL = None
+# 읽기 전용 복제본 연결 풀 변수 (DB_REPLICA_HOST 가 설정된 경우에만 생성)
+REPLICA_POOL = None
+# 복제본 지연 추적: 테이블별로 복제본에 반영된 것으로 확인된 최대 no 와 확인 시각
+REPLICA_WATERMARKS: Dict[str, int] = {}
+REPLICA_WATERMARK_CHECKED_AT: Dict[str, float] = {}
+# (테이블, 모니터)별로 이 프로세스가 주 DB에서 마지막으로 항목을 할당한 시각 (read-your-writes 판단용)
+LAST_ASSIGNMENT_AT: Dict[tuple, float] = {}
+# 워커 리더 잠금을 유지하는 전용 연결 (잠금을 잡고 있는 동안 풀 슬롯을 차지하지 않도록 풀 밖에서 관리)
+LEADER_LOCK_CONN = None
+
+# DB 작업별 마감 시간 분류 (settings.DB_OPERATION_TIMEOUTS 에 작업 이름이 있으면 그 값을 우선 사용)
+# 모니터 표시 경로: SSE 루프마다 호출되므로 짧게 끊어 한 연결의 지연이 모든 화면으로 번지지 않게 함
+DISPLAY_OPERATIONS = frozenset({
+    "get_new_items_for_monitor",
+    "get_assigned_items_queue",
+    "get_latest_processed_item_by_monitor_id",
+    "get_latest_two_processed_items_by_monitor_id",
+})
+# 워커 경로: FOR UPDATE 잠금 대기가 있으므로 길게
+WORKER_OPERATIONS = frozenset({
+    "get_items_to_process",
+    "mark_item_processed_and_assign_monitor",
+})
+# 서버 측 max_statement_time 초과 오류 코드 (MariaDB ER_STATEMENT_TIMEOUT)
+ER_STATEMENT_TIMEOUT = 1969
+# 교착 상태로 트랜잭션이 롤백되었을 때의 오류 코드 (ER_LOCK_DEADLOCK)
+ER_LOCK_DEADLOCK = 1213
+# 중복 병합 삽입이 교착으로 롤백되었을 때 시도하는 최대 횟수 (처음 시도 포함)
+DEDUP_DEADLOCK_ATTEMPTS = 2
+# max_statement_time 에 넘기는 최소값(초)
+MIN_STATEMENT_TIME_SECONDS = 0.001
+# 서버가 먼저 문장을 중단할 수 있도록 클라이언트 측 취소에 더하는 여유 시간(초)
+CLIENT_TIMEOUT_GRACE_SECONDS = 0.5
+# DB 장애로 보고 차단기에 기록하는 클라이언트 오류 코드
+# (CR_CONN_HOST_ERROR, CR_SERVER_GONE_ERROR, CR_SERVER_LOST, CR_SERVER_LOST_EXTENDED)
+CONNECTION_ERROR_CODES = frozenset({2003, 2006, 2013, 2055})
+
+
+class QueryTimeoutError(TimeoutError):
+    """DB 작업이 마감 시간 안에 끝나지 않아 취소되었을 때 발생합니다."""
+
+
+class OperationDeadline:
+    """
+    DB 작업 하나의 마감 시각. 연결 대기와 그 작업의 모든 쿼리가 같은 시간 예산을 나눠 씁니다.
+    쿼리마다 남은 시간만 허용하므로 쿼리가 여러 개여도 작업 전체가 마감 시간을 넘지 않습니다.
+    breaker 는 마지막으로 연결을 가져온 풀의 차단기로, 쿼리 결과를 그 차단기에 기록합니다.
+    """
+    __slots__ = ("operation", "timeout", "expires_at", "breaker")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.timeout = get_operation_timeout(operation)
+        self.expires_at = time.monotonic() + self.timeout
+        self.breaker = DB_BREAKER
+
+    def remaining(self, phase: str) -> float:
+        """남은 시간(초)을 반환합니다. 이미 마감 시간이 지났으면 QueryTimeoutError 를 발생시킵니다."""
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            counters.record_query_timeout(self.operation, phase)
+            raise QueryTimeoutError(f"{self.operation}: {self.timeout}s deadline exceeded before {phase}")
+        return remaining
 
 # 테이블 이름 안전성 검증 함수 추가
 def validate_table_name(table_name: str) -> bool:
@@ -18,16 +87,31 @@ def validate_table_name(table_name: str) -> bool:
     pattern = re.compile(r'^[a-zA-Z0-9_]+$')
     return bool(pattern.match(table_name))
 
+# 이벤트 설정 가져오는 함수 추가
+def resolve_event(event: Optional[EventSettings] = None) -> EventSettings:
+    """이벤트가 지정되지 않으면 기본 이벤트 설정을 반환합니다."""
+    return event or settings.DEFAULT_EVENT
+
 # 테이블 이름 가져오는 함수 추가
-def get_safe_table_name() -> str:
+def get_safe_table_name(event: Optional[EventSettings] = None) -> str:
     """
-    설정에서 안전한 테이블 이름을 가져옵니다.
-    테이블 이름이 안전하지 않으면 예외를 발생시킵니다.
+    이벤트의 항목 테이블 이름을 가져옵니다.
+    테이블 이름은 설정 로드 시 한 번 검증되므로 쿼리마다 다시 검증하지 않습니다.
     """
-    table_name = settings.ITEMS_TABLE_NAME
-    if not validate_table_name(table_name):
-        raise ValueError(f"테이블 이름 '{table_name}'은(는) 안전하지 않습니다. 알파벳, 숫자, 언더스코어만 허용됩니다.")
-    return table_name
+    return resolve_event(event).table_name
+
+# 아카이브(이력) 테이블 이름 가져오는 함수 추가
+def get_safe_archive_table_name(event: Optional[EventSettings] = None) -> str:
+    """이벤트의 아카이브 테이블 이름을 가져옵니다 (설정 로드 시 검증됨)."""
+    return resolve_event(event).archive_table_name
+
+def get_safe_changefeed_table_name(event: Optional[EventSettings] = None) -> str:
+    """이벤트의 할당 변경 피드 테이블 이름을 가져옵니다 (설정 로드 시 검증됨)."""
+    return resolve_event(event).changefeed_table_name
+
+def get_safe_dedup_table_name(event: Optional[EventSettings] = None) -> str:
+    """이벤트의 중복 제출 병합 테이블 이름을 가져옵니다 (설정 로드 시 검증됨)."""
+    return resolve_event(event).dedup_table_name
 
 # ... (create_db_pool, close_db_pool, get_db_connection 함수는 동일) ...
 async def create_db_pool():
@@ -44,118 +128,380 @@ async def create_db_pool():
                 autocommit=False,
                 charset='utf8mb4',
                 cursorclass=aiomysql.cursors.DictCursor,
-                minsize=1,
-                maxsize=10,
+                minsize=settings.DB_POOL_MINSIZE,
+                maxsize=settings.DB_POOL_MAXSIZE,
             )
             logger.info("MariaDB connection pool created successfully.")
         except Exception as e:
             logger.error(f"Failed to create MariaDB connection pool: {e}")
             raise
+    await create_replica_pool()
+
+async def create_replica_pool():
+    """읽기 전용 복제본 연결 풀을 생성합니다. 실패하면 모든 조회를 주 DB로 보냅니다."""
+    global REPLICA_POOL
+    if REPLICA_POOL is None and settings.DB_REPLICA_HOST:
+        try:
+            REPLICA_POOL = await aiomysql.create_pool(
+                host=settings.DB_REPLICA_HOST,
+                port=settings.DB_REPLICA_PORT,
+                user=settings.DB_REPLICA_USER,
+                password=settings.DB_REPLICA_PASSWORD,
+                db=settings.DB_NAME,
+                autocommit=True,
+                charset='utf8mb4',
+                cursorclass=aiomysql.cursors.DictCursor,
+                minsize=settings.DB_POOL_MINSIZE,
+                maxsize=settings.DB_REPLICA_POOL_MAXSIZE,
+            )
+            logger.info(f"MariaDB replica pool created successfully ({settings.DB_REPLICA_HOST}).")
+        except Exception as e:
+            logger.error(f"Failed to create MariaDB replica pool, reads will use the primary: {e}")
+            REPLICA_POOL = None
 
 async def close_db_pool():
     """데이터베이스 연결 풀을 종료합니다."""
-    global DB_POOL
+    global DB_POOL, REPLICA_POOL, LEADER_LOCK_CONN
+    if LEADER_LOCK_CONN:
+        LEADER_LOCK_CONN.close()
+        LEADER_LOCK_CONN = None
+    if REPLICA_POOL:
+        REPLICA_POOL.close()
+        await REPLICA_POOL.wait_closed()
+        REPLICA_POOL = None
+        logger.info("MariaDB replica pool closed.")
     if DB_POOL:
         DB_POOL.close()
         await DB_POOL.wait_closed()
         DB_POOL = None
         logger.info("MariaDB pool closed.")
 
-async def get_db_connection():
-    """연결 풀에서 연결을 가져와 반환합니다."""
+async def get_db_connection(deadline: OperationDeadline):
+    """
+    연결 풀에서 연결을 가져와 반환합니다.
+    풀이 가득 찼으면 작업의 마감 시간까지만 기다립니다.
+    DB 차단기가 열려 있으면 DB에 접속하지 않고 CircuitOpenError 를 발생시킵니다.
+    """
+    check_db_breaker()
     if DB_POOL is None:
          await create_db_pool() # 안전 장치 (lifespan에서 먼저 호출되어야 함)
-    conn = await DB_POOL.acquire()
-    return conn
+    return await acquire_with_deadline(DB_POOL, deadline)
+
+def check_db_breaker(breaker: CircuitBreaker = DB_BREAKER):
+    """차단기가 요청을 허용하지 않으면 CircuitOpenError 를 발생시킵니다."""
+    if settings.DB_BREAKER_ENABLED and not breaker.allow_request():
+        raise CircuitOpenError(breaker.name, breaker.retry_after())
+
+def is_outage_error(error: Exception) -> bool:
+    """연결 단절이나 마감 시간 초과처럼 DB 장애로 볼 오류인지 반환합니다 (잠금 충돌, 제약 위반 등은 제외)."""
+    if isinstance(error, (QueryTimeoutError, aiomysql.InterfaceError, ConnectionError)):
+        return True
+    return isinstance(error, aiomysql.OperationalError) and bool(error.args) and error.args[0] in CONNECTION_ERROR_CODES
+
+def record_db_failure(error: Exception, breaker: CircuitBreaker = DB_BREAKER):
+    """DB 장애로 볼 오류면 차단기에 실패로 기록합니다."""
+    if is_outage_error(error):
+        breaker.record_failure(error)
+
+def get_operation_timeout(operation: str) -> float:
+    """작업 이름에 해당하는 마감 시간(초)을 반환합니다."""
+    if operation in settings.DB_OPERATION_TIMEOUTS:
+        return settings.DB_OPERATION_TIMEOUTS[operation]
+    if operation in DISPLAY_OPERATIONS:
+        return settings.DB_DISPLAY_QUERY_TIMEOUT_SECONDS
+    if operation in WORKER_OPERATIONS:
+        return settings.DB_WORKER_QUERY_TIMEOUT_SECONDS
+    return settings.DB_QUERY_TIMEOUT_SECONDS
+
+async def acquire_with_deadline(pool, deadline: OperationDeadline, breaker: CircuitBreaker = DB_BREAKER):
+    """
+    작업의 마감 시간 안에 풀에서 연결을 가져옵니다. 시간 안에 빈 연결이 없으면 QueryTimeoutError 를 발생시킵니다.
+    새 연결을 만들지 못한 경우는 풀의 차단기에 기록하고, 이후 쿼리 결과도 같은 차단기에 기록되도록 합니다.
+    """
+    deadline.breaker = breaker
+    timeout = deadline.remaining("acquire")
+    try:
+        return await asyncio.wait_for(pool.acquire(), timeout)
+    except asyncio.TimeoutError:
+        counters.record_query_timeout(deadline.operation, "acquire")
+        error = QueryTimeoutError(f"{deadline.operation}: no pool connection available within {deadline.timeout}s")
+        # 평소의 풀 대기 초과는 이 프로세스 안의 경합일 수 있으므로 기록하지 않지만,
+        # 시험 요청이 연결을 얻지 못한 경우는 실패로 기록해 반열림 상태를 끝냄
+        if breaker.state == HALF_OPEN:
+            breaker.record_failure(error)
+        raise error
+    except Exception as e:
+        record_db_failure(e, breaker)
+        raise
+
+async def execute_with_deadline(cur, deadline: OperationDeadline, query: str, args=None):
+    """
+    작업의 남은 마감 시간 안에 쿼리를 실행합니다.
+    서버 측에서는 max_statement_time 으로 문장(잠금 대기 포함)을 중단하고,
+    연결이 멈춰 응답이 오지 않으면 클라이언트 측에서 취소한 뒤 연결을 닫아 풀 슬롯을 돌려받습니다.
+    """
+    operation = deadline.operation
+    timeout = deadline.remaining("query")
+    if settings.DB_SERVER_STATEMENT_TIMEOUT_ENABLED:
+        # 0 은 제한 없음이므로 소수점 셋째 자리에서 0 이 되지 않도록 최소 1ms 로 맞춤
+        query = f"SET STATEMENT max_statement_time={max(timeout, MIN_STATEMENT_TIME_SECONDS):.3f} FOR {query.strip()}"
+    try:
+        result = await asyncio.wait_for(cur.execute(query, args), timeout + CLIENT_TIMEOUT_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        counters.record_query_timeout(operation, "query")
+        # 응답 도중 취소된 연결은 프로토콜 상태를 알 수 없으므로 닫음 (release 시 풀에서 제거되고 새 연결로 채워짐)
+        cur.connection.close()
+        error = QueryTimeoutError(f"{operation}: query cancelled after the {deadline.timeout}s deadline")
+        deadline.breaker.record_failure(error)
+        raise error
+    except aiomysql.MySQLError as e:
+        if e.args and e.args[0] == ER_STATEMENT_TIMEOUT:
+            counters.record_query_timeout(operation, "query")
+            error = QueryTimeoutError(f"{operation}: max_statement_time exceeded the {deadline.timeout}s deadline")
+            deadline.breaker.record_failure(error)
+            raise error from e
+        if is_outage_error(e):
+            deadline.breaker.record_failure(e)
+        else:
+            # 잠금 충돌, 제약 위반 등은 서버가 응답한 것이므로 연결은 정상
+            deadline.breaker.record_success()
+        raise
+    deadline.breaker.record_success()
+    return result
+
+async def rollback_quietly(conn):
+    """오류 처리 중 롤백합니다. 마감 시간 초과로 닫힌 연결은 건너뜁니다."""
+    if conn is None or conn.closed:
+        return
+    try:
+        await conn.rollback()
+    except Exception as rollback_error:
+        logger.error(f"Error during rollback: {rollback_error}")
+
+def note_assignment_write(table_name: str, monitor_id: str):
+    """모니터에 항목이 할당되었음을 기록합니다. 직후 해당 모니터의 조회는 잠시 주 DB로 보냅니다."""
+    LAST_ASSIGNMENT_AT[(table_name, monitor_id)] = time.monotonic()
+
+async def refresh_replica_watermark(table_name: str, deadline: OperationDeadline):
+    """
+    복제본에 반영된 테이블의 최대 no 값을 갱신합니다 (REPLICA_WATERMARK_TTL_SECONDS 마다 최대 1회).
+    호출한 조회 작업의 마감 시간 안에서 실행됩니다.
+    """
+    now = time.monotonic()
+    if now - REPLICA_WATERMARK_CHECKED_AT.get(table_name, 0) < settings.REPLICA_WATERMARK_TTL_SECONDS:
+        return
+    # 동시에 여러 조회가 갱신을 시도하지 않도록 확인 시각을 먼저 기록
+    REPLICA_WATERMARK_CHECKED_AT[table_name] = now
+
+    conn = None
+    try:
+        conn = await acquire_with_deadline(REPLICA_POOL, deadline, REPLICA_BREAKER)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"SELECT MAX(no) AS latest_no FROM {table_name}")
+            result = await cur.fetchone()
+            REPLICA_WATERMARKS[table_name] = (result['latest_no'] or 0) if result else 0
+    except Exception as e:
+        logger.warning(f"Error checking replica watermark for {table_name}: {e}")
+        REPLICA_WATERMARKS[table_name] = 0  # 확인할 수 없으면 다음 갱신 전까지 주 DB 사용
+    finally:
+        if conn: await REPLICA_POOL.release(conn)
+
+async def get_read_connection(deadline: OperationDeadline, min_no: int = 0, monitor_id: str = None, event: Optional[EventSettings] = None):
+    """
+    조회 전용 연결을 (풀, 연결) 형태로 반환합니다.
+    복제본이 설정되어 있고 아래 조건을 만족하면 복제본 연결을, 아니면 주 DB 연결을 반환합니다.
+    - 이 프로세스가 최근 REPLICA_STICKY_SECONDS 안에 해당 모니터에 항목을 할당하지 않았을 것 (read-your-writes)
+    - 호출자의 커서(min_no)가 복제본에 반영된 최대 no 보다 앞서 있지 않을 것
+    연결 대기(복제본 확인 포함)는 작업의 마감 시간을 함께 씁니다.
+    복제본과 주 DB는 차단기가 따로 있어, 복제본 차단기가 열려 있으면 주 DB로 조회하고
+    주 DB 차단기가 열려 있으면 CircuitOpenError 를 발생시킵니다.
+    """
+    table_name = get_safe_table_name(event)
+    recently_assigned = (monitor_id is not None and
+                         time.monotonic() - LAST_ASSIGNMENT_AT.get((table_name, monitor_id), 0) < settings.REPLICA_STICKY_SECONDS)
+    if REPLICA_POOL is not None and not recently_assigned and (not settings.DB_BREAKER_ENABLED or REPLICA_BREAKER.allow_request()):
+        if min_no > REPLICA_WATERMARKS.get(table_name, 0):
+            await refresh_replica_watermark(table_name, deadline)
+        if min_no <= REPLICA_WATERMARKS.get(table_name, 0):
+            try:
+                return REPLICA_POOL, await acquire_with_deadline(REPLICA_POOL, deadline, REPLICA_BREAKER)
+            except Exception as e:
+                logger.warning(f"Replica connection failed, falling back to primary: {e}")
+
+    check_db_breaker()
+    if DB_POOL is None:
+        await create_db_pool()
+    return DB_POOL, await acquire_with_deadline(DB_POOL, deadline)
 
 
 # --- insert_item_db 함수 수정: no 인자 제거, 쿼리에서 no 컬럼 생략, LAST_INSERT_ID 가져오기 ---
-async def insert_item_db(text: str):
+async def _insert_item_row(cur, deadline: OperationDeadline, table_name: str, text: str) -> int:
+    """항목 행을 삽입하고 자동 생성된 no 를 반환합니다 (커밋은 호출한 쪽에서)."""
+    # no 컬럼을 INSERT 목록에서 제거, f-string 대신 %s 사용
+    query = """
+        INSERT INTO {} (text, adr, state)
+        VALUES (%s, %s, %s)
+    """.format(table_name) # f-string 대신 format 메소드 사용
+    
+    await execute_with_deadline(cur, deadline, query, (text, None, 0)) # no 값 제거
+
+    # 삽입된 row의 자동 생성된 PK (no) 값 가져오기
+    await execute_with_deadline(cur, deadline, "SELECT LAST_INSERT_ID()")
+    result = await cur.fetchone()
+    return result['LAST_INSERT_ID()'] # 결과에서 값 추출
+
+async def insert_item_db(text: str, event: Optional[EventSettings] = None):
     """새로운 데이터를 DB에 추가합니다 (no 자동 생성, adr 나중, update_time 트리거)."""
+    deadline = OperationDeadline("insert_item_db")
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
+        conn = await get_db_connection(deadline)
         async with conn.cursor() as cur:
-            # no 컬럼을 INSERT 목록에서 제거, f-string 대신 %s 사용
-            query = """
-                INSERT INTO {} (text, adr, state)
-                VALUES (%s, %s, %s)
-            """.format(table_name) # f-string 대신 format 메소드 사용
-            
-            await cur.execute(query, (text, None, 0)) # no 값 제거
-
-            # 삽입된 row의 자동 생성된 PK (no) 값 가져오기
-            await cur.execute("SELECT LAST_INSERT_ID()")
-            result = await cur.fetchone()
-            inserted_id = result['LAST_INSERT_ID()'] # 결과에서 값 추출
+            inserted_id = await _insert_item_row(cur, deadline, table_name, text)
             await conn.commit() # 커밋은 마지막에 한 번만
+            counters.record_insert(resolve_event(event).name, inserted_id)
 
             logger.info(f"Inserted item with auto-generated no: {inserted_id}")
             return inserted_id # 삽입된 no 값 반환
     except Exception as e:
         logger.error(f"Error inserting item: {e}")
-        if conn: await conn.rollback() # 오류 시 롤백
+        await rollback_quietly(conn) # 오류 시 롤백
         raise
     finally:
         if conn: await DB_POOL.release(conn) # 연결 풀에 반환
 
 
+# --- insert_item_deduplicated_db 함수 추가 ---
+async def insert_item_deduplicated_db(text: str, text_hash: str, window_seconds: int, event: Optional[EventSettings] = None):
+    """
+    같은 텍스트 해시가 window_seconds 이내에 저장된 적이 없을 때만 항목을 추가합니다.
+    해시별 행을 가진 중복 테이블의 기본 키로 여러 프로세스가 동시에 같은 텍스트를 넣어도 하나만 저장됩니다.
+
+    Returns:
+        (항목 no, 중복 여부) - 중복이면 기존 항목의 no
+    """
+    deadline = OperationDeadline("insert_item_deduplicated_db")
+    conn = None
+    try:
+        table_name = get_safe_table_name(event)
+        dedup_table_name = get_safe_dedup_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            # INSERT IGNORE 가 중복 키에서 건 공유 잠금을 FOR UPDATE 가 배타 잠금으로 올리는 사이에
+            # 같은 해시를 넣는 다른 트랜잭션과 교착될 수 있으므로, 교착으로 롤백되면 같은 마감 시간 안에서 한 번 다시 시도
+            for attempt in range(DEDUP_DEADLOCK_ATTEMPTS):
+                try:
+                    return await _insert_item_deduplicated_tx(conn, cur, deadline, table_name, dedup_table_name, text, text_hash, window_seconds, event)
+                except aiomysql.MySQLError as e:
+                    if not (e.args and e.args[0] == ER_LOCK_DEADLOCK) or attempt + 1 == DEDUP_DEADLOCK_ATTEMPTS:
+                        raise
+                    logger.warning(f"Deadlock while inserting deduplicated item (hash {text_hash[:12]}); retrying")
+                    await rollback_quietly(conn)
+    except Exception as e:
+        logger.error(f"Error inserting item with deduplication: {e}")
+        await rollback_quietly(conn)
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+async def _insert_item_deduplicated_tx(conn, cur, deadline: OperationDeadline, table_name: str, dedup_table_name: str,
+                                       text: str, text_hash: str, window_seconds: int, event: Optional[EventSettings]):
+    """insert_item_deduplicated_db 의 트랜잭션 한 번을 실행합니다."""
+    await conn.begin()
+
+    # 해시 행을 먼저 선점 (같은 해시를 넣는 다른 트랜잭션은 커밋될 때까지 대기 후 무시됨)
+    await execute_with_deadline(
+        cur, deadline,
+        f"INSERT IGNORE INTO {dedup_table_name} (text_hash, item_no, created_at) VALUES (%s, 0, NOW())",
+        (text_hash,),
+    )
+    claimed = cur.rowcount == 1
+
+    if not claimed:
+        await execute_with_deadline(cur, deadline, f"""
+            SELECT item_no, created_at >= NOW() - INTERVAL %s SECOND AS fresh
+            FROM {dedup_table_name}
+            WHERE text_hash = %s
+            FOR UPDATE
+        """, (window_seconds, text_hash))
+        existing = await cur.fetchone()
+        if existing and existing['fresh'] and existing['item_no']:
+            await conn.rollback()
+            logger.info(f"Duplicate submission coalesced into item {existing['item_no']}")
+            return existing['item_no'], True
+
+    # 새 항목 저장 후 해시 행이 새 항목을 가리키도록 갱신 (기간이 지난 행은 재사용)
+    inserted_id = await _insert_item_row(cur, deadline, table_name, text)
+    await execute_with_deadline(
+        cur, deadline,
+        f"UPDATE {dedup_table_name} SET item_no = %s, created_at = NOW() WHERE text_hash = %s",
+        (inserted_id, text_hash),
+    )
+    await conn.commit()
+    counters.record_insert(resolve_event(event).name, inserted_id)
+
+    logger.info(f"Inserted item with auto-generated no: {inserted_id}")
+    return inserted_id, False
+
 # --- get_items_to_process 함수 수정 없음 (adr은 조회해도 되지만 사용 안함) ---
-async def get_items_to_process(threshold_time: datetime.datetime):
+async def get_items_to_process(threshold_time: datetime.datetime, event: Optional[EventSettings] = None):
     """state=0 이고 update_time 이 임계값보다 오래된 데이터를 조회합니다."""
+    deadline = OperationDeadline("get_items_to_process")
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
-        async with conn.cursor() as cur:
+        conn = await get_db_connection(deadline)
+        async with conn.cursor(aiomysql.cursors.Cursor) as cur:
             # 트랜잭션 시작 - FOR UPDATE를 사용하여 다른 프로세스가 동일한 행을 선택하지 않도록 함
             await conn.begin()
             
             query = """
-                SELECT no, text, adr, update_time -- update_time 컬럼 추가
+                SELECT {columns}
                 FROM {} 
                 WHERE state = 0 AND update_time < %s
                 ORDER BY update_time ASC
                 FOR UPDATE
-            """.format(table_name)
+            """.format(table_name, columns=ItemRecord.COLUMNS)
             
-            await cur.execute(query, (threshold_time,))
+            await execute_with_deadline(cur, deadline, query, (threshold_time,))
             items = await cur.fetchall()
             
             # 항목을 즉시 처리 중으로 표시 (임시 상태 -1)
             # 이렇게 하면 다른 워커가 동일한 항목을 처리하지 않음
             if items:
-                item_ids = [item['no'] for item in items]
+                item_ids = [row[0] for row in items]
                 placeholders = ', '.join(['%s'] * len(item_ids))
                 update_query = f"""
                     UPDATE {table_name}
                     SET state = -1
                     WHERE no IN ({placeholders}) AND state = 0
                 """
-                await cur.execute(update_query, item_ids)
+                await execute_with_deadline(cur, deadline, update_query, item_ids)
                 
                 # 실제로 업데이트된 항목만 가져오기
-                await cur.execute(f"""
-                    SELECT no, text, adr, update_time
+                await execute_with_deadline(cur, deadline, f"""
+                    SELECT {ItemRecord.COLUMNS}
                     FROM {table_name}
                     WHERE no IN ({placeholders}) AND state = -1
+                    ORDER BY update_time ASC
                 """, item_ids)
                 items = await cur.fetchall()
             
             await conn.commit()
-            return items
+            if items:
+                counters.record_claimed(resolve_event(event).name, len(items))
+            return [ItemRecord.from_row(row) for row in items]
+    except CircuitOpenError:
+        return []  # DB 차단 중에는 조용히 다음 주기로 넘김
     except Exception as e:
         logger.error(f"Error fetching items to process: {e}")
-        if conn:
-            try:
-                await conn.rollback()
-            except Exception as rollback_error:
-                logger.error(f"Error during rollback: {rollback_error}")
+        await rollback_quietly(conn)
         return []  # 오류 발생 시 빈 리스트 반환
     finally:
         if conn: 
@@ -165,21 +511,22 @@ async def get_items_to_process(threshold_time: datetime.datetime):
                 logger.error(f"Error releasing connection: {release_error}")
 
 # --- mark_item_processed_and_assign_monitor 함수 수정: item_no 타입 확인 ---
-async def mark_item_processed_and_assign_monitor(item_no: int, assigned_monitor_id: str): # item_no를 int로 받음
+async def mark_item_processed_and_assign_monitor(item_no: int, assigned_monitor_id: str, event: Optional[EventSettings] = None): # item_no를 int로 받음
     """데이터 처리 완료 후 state, get_time, adr(모니터 ID)을 업데이트합니다."""
+    deadline = OperationDeadline("mark_item_processed_and_assign_monitor")
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
+        conn = await get_db_connection(deadline)
         async with conn.cursor() as cur:
             # 트랜잭션 시작
             await conn.begin()
             
             # 먼저 현재 상태 확인 (이미 처리된 항목인지 확인)
             check_query = f"SELECT state FROM {table_name} WHERE no = %s FOR UPDATE"
-            await cur.execute(check_query, (item_no,))
+            await execute_with_deadline(cur, deadline, check_query, (item_no,))
             result = await cur.fetchone()
             
             if not result:
@@ -202,7 +549,7 @@ async def mark_item_processed_and_assign_monitor(item_no: int, assigned_monitor_
                 WHERE no = %s AND (state = 0 OR state = -1)
             """.format(table_name)
             
-            await cur.execute(query, (now, assigned_monitor_id, item_no)) # item_no는 이제 int
+            await execute_with_deadline(cur, deadline, query, (now, assigned_monitor_id, item_no)) # item_no는 이제 int
             
             # 실제로 업데이트된 행 수 확인
             rows_affected = cur.rowcount
@@ -212,130 +559,144 @@ async def mark_item_processed_and_assign_monitor(item_no: int, assigned_monitor_
                 await conn.rollback()
                 return False
             
+            # 같은 트랜잭션에서 변경 피드에 할당 기록 추가 (커밋되지 않은 할당은 피드에도 나타나지 않음)
+            if settings.CHANGEFEED_ENABLED:
+                changefeed_table_name = get_safe_changefeed_table_name(event)
+                await execute_with_deadline(
+                    cur, deadline,
+                    f"INSERT INTO {changefeed_table_name} (item_no, monitor_id) VALUES (%s, %s)",
+                    (item_no, assigned_monitor_id),
+                )
+            
             await conn.commit()
+            note_assignment_write(table_name, assigned_monitor_id)
+            counters.record_assigned(resolve_event(event).name, assigned_monitor_id, current_state)
             logger.info(f"Marked item '{item_no}' as processed and assigned to monitor {assigned_monitor_id}.")
             return True
             
     except Exception as e:
         logger.error(f"Error updating item state for '{item_no}': {e}")
-        if conn: 
-            try:
-                await conn.rollback()
-            except Exception as rollback_error:
-                logger.error(f"Error during rollback: {rollback_error}")
+        await rollback_quietly(conn)
         raise
     finally:
         if conn: await DB_POOL.release(conn)
 
 # --- get_latest_processed_item_by_monitor_id 함수 수정: 반환 타입 주의 ---
-async def get_latest_processed_item_by_monitor_id(monitor_id: str):
+async def get_latest_processed_item_by_monitor_id(monitor_id: str, event: Optional[EventSettings] = None):
     """특정 모니터 ID에 할당된 state=1인 최신 데이터를 조회합니다."""
+    deadline = OperationDeadline("get_latest_processed_item_by_monitor_id")
+    pool = None
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
-        async with conn.cursor() as cur:
-            # no 컬럼이 이제 INT일 것입니다. 조회 결과 딕셔너리의 item['no']는 INT 타입
+        pool, conn = await get_read_connection(deadline, monitor_id=monitor_id, event=event)
+        async with conn.cursor(aiomysql.cursors.Cursor) as cur:
             query = """
-                SELECT no, text, update_time, get_time, adr, state
+                SELECT {columns}
                 FROM {} 
                 WHERE state = 1 AND adr = %s
                 ORDER BY get_time DESC
                 LIMIT 1
-            """.format(table_name)
+            """.format(table_name, columns=ItemRecord.COLUMNS)
             
-            await cur.execute(query, (monitor_id,))
-            item = await cur.fetchone()
-            return item # 결과가 없으면 None 반환, item['no']는 int
+            await execute_with_deadline(cur, deadline, query, (monitor_id,))
+            row = await cur.fetchone()
+            return ItemRecord.from_row(row) if row else None # 결과가 없으면 None 반환
     except Exception as e:
         logger.error(f"Error fetching latest item for monitor {monitor_id}: {e}")
         raise
     finally:
-        if conn: await DB_POOL.release(conn)
+        if conn: await pool.release(conn)
 
 # --- get_all_items_db 함수는 동일 ---
-async def get_all_items_db():
+async def get_all_items_db(event: Optional[EventSettings] = None):
      """DB의 모든 데이터를 조회합니다."""
+     deadline = OperationDeadline("get_all_items_db")
+     pool = None
      conn = None
      try:
          # 안전한 테이블 이름 가져오기
-         table_name = get_safe_table_name()
+         table_name = get_safe_table_name(event)
          
-         conn = await get_db_connection()
-         async with conn.cursor() as cur:
+         pool, conn = await get_read_connection(deadline, event=event)
+         async with conn.cursor(aiomysql.cursors.Cursor) as cur:
              query = """
-                 SELECT no, text, update_time, get_time, adr, state 
+                 SELECT {columns}
                  FROM {} 
                  ORDER BY update_time DESC
-             """.format(table_name)
+             """.format(table_name, columns=ItemRecord.COLUMNS)
              
-             await cur.execute(query)
-             items = await cur.fetchall() # 각 item 딕셔너리의 'no' 값은 int
-             return items
+             await execute_with_deadline(cur, deadline, query)
+             rows = await cur.fetchall()
+             return [ItemRecord.from_row(row) for row in rows]
      except Exception as e:
         logger.error(f"Error fetching all items: {e}")
         raise
      finally:
-        if conn: await DB_POOL.release(conn)
+        if conn: await pool.release(conn)
 
 # --- get_latest_two_processed_items_by_monitor_id 함수 추가 ---
-async def get_latest_two_processed_items_by_monitor_id(monitor_id: str):
+async def get_latest_two_processed_items_by_monitor_id(monitor_id: str, event: Optional[EventSettings] = None):
     """특정 모니터 ID에 할당된 state=1인 최신 데이터 2개를 조회합니다."""
+    deadline = OperationDeadline("get_latest_two_processed_items_by_monitor_id")
+    pool = None
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
-        async with conn.cursor() as cur:
+        pool, conn = await get_read_connection(deadline, monitor_id=monitor_id, event=event)
+        async with conn.cursor(aiomysql.cursors.Cursor) as cur:
             query = """
-                SELECT no, text, update_time, get_time, adr, state
+                SELECT {columns}
                 FROM {} 
                 WHERE state = 1 AND adr = %s
                 ORDER BY get_time DESC
                 LIMIT 2
-            """.format(table_name)
+            """.format(table_name, columns=ItemRecord.COLUMNS)
             
-            await cur.execute(query, (monitor_id,))
-            items = await cur.fetchall()
+            await execute_with_deadline(cur, deadline, query, (monitor_id,))
+            items = [ItemRecord.from_row(row) for row in await cur.fetchall()]
             return items # 결과가 없으면 빈 리스트 반환
     except Exception as e:
         logger.error(f"Error fetching latest two items for monitor {monitor_id}: {e}")
         raise
     finally:
-        if conn: await DB_POOL.release(conn)
+        if conn: await pool.release(conn)
 
 # --- get_assigned_items_queue 함수 추가 ---
-async def get_assigned_items_queue(monitor_id: str, limit: int = 10):
+async def get_assigned_items_queue(monitor_id: str, limit: int = 10, event: Optional[EventSettings] = None):
     """특정 모니터 ID에 할당된 state=1인 데이터를 get_time 순서대로 조회합니다."""
+    deadline = OperationDeadline("get_assigned_items_queue")
+    pool = None
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
-        async with conn.cursor() as cur:
+        pool, conn = await get_read_connection(deadline, monitor_id=monitor_id, event=event)
+        async with conn.cursor(aiomysql.cursors.Cursor) as cur:
             query = """
-                SELECT no, text, update_time, get_time, adr, state
+                SELECT {columns}
                 FROM {} 
                 WHERE state = 1 AND adr = %s
                 ORDER BY get_time ASC
                 LIMIT %s
-            """.format(table_name)
+            """.format(table_name, columns=ItemRecord.COLUMNS)
             
-            await cur.execute(query, (monitor_id, limit))
-            items = await cur.fetchall()
+            await execute_with_deadline(cur, deadline, query, (monitor_id, limit))
+            items = [ItemRecord.from_row(row) for row in await cur.fetchall()]
             return items # 결과가 없으면 빈 리스트 반환
     except Exception as e:
         logger.error(f"Error fetching item queue for monitor {monitor_id}: {e}")
         raise
     finally:
-        if conn: await DB_POOL.release(conn)
+        if conn: await pool.release(conn)
 
 # --- get_new_items_for_monitor 함수 수정 ---
-async def get_new_items_for_monitor(monitor_id: str, last_displayed_item_no: int = 0, limit: int = 10, should_log: bool = False):
+async def get_new_items_for_monitor(monitor_id: str, last_displayed_item_no: int = 0, limit: int = 10, should_log: bool = False, event: Optional[EventSettings] = None):
     """
     마지막으로 표시된 항목 이후의 새 항목들을 가져옵니다.
     이전에 표시된 항목의 번호(no)보다 큰 항목들만 반환합니다.
@@ -346,78 +707,73 @@ async def get_new_items_for_monitor(monitor_id: str, last_displayed_item_no: int
         limit: 최대 항목 수
         should_log: 로그 출력 여부
     """
+    deadline = OperationDeadline("get_new_items_for_monitor")
+    pool = None
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
-        async with conn.cursor() as cur:
-            # 디버깅: 데이터베이스의 모든 항목 개수 확인
+        pool, conn = await get_read_connection(deadline, min_no=last_displayed_item_no, monitor_id=monitor_id, event=event)
+        async with conn.cursor(aiomysql.cursors.Cursor) as cur:
+            # 디버깅: 집계 쿼리 대신 프로세스 내 카운터 값으로 로그 출력
             if should_log:
-                query_count = f"SELECT COUNT(*) as total FROM {table_name} WHERE state = 1 AND adr = %s"
-                await cur.execute(query_count, (monitor_id,))
-                count_result = await cur.fetchone()
-                total_items = count_result['total'] if count_result else 0
-                
-                # 디버깅: 조건을 만족하는 항목 개수 확인
-                query_count_after = f"SELECT COUNT(*) as matching FROM {table_name} WHERE state = 1 AND adr = %s AND no > %s"
-                await cur.execute(query_count_after, (monitor_id, last_displayed_item_no))
-                count_after = await cur.fetchone()
-                matching_items = count_after['matching'] if count_after else 0
-                
-                # 로그 출력
-                logger.info(f"DB 조회: 모니터 {monitor_id} - 총 {total_items}개 항목 중 {matching_items}개가 no > {last_displayed_item_no} 조건 만족")
+                backlog = counters.get_monitor_backlog(resolve_event(event).name, monitor_id)
+                logger.info(f"DB 조회: 모니터 {monitor_id} - 표시 대기 {backlog}개 (카운터 기준), no > {last_displayed_item_no} 조건으로 조회")
             
             query = """
-                SELECT no, text, update_time, get_time, adr, state
+                SELECT {columns}
                 FROM {} 
                 WHERE state = 1 
                 AND adr = %s
                 AND no > %s
                 ORDER BY get_time ASC
                 LIMIT %s
-            """.format(table_name)
+            """.format(table_name, columns=ItemRecord.COLUMNS)
             
-            await cur.execute(query, (monitor_id, last_displayed_item_no, limit))
-            items = await cur.fetchall()
+            await execute_with_deadline(cur, deadline, query, (monitor_id, last_displayed_item_no, limit))
+            items = [ItemRecord.from_row(row) for row in await cur.fetchall()]
             
             # 로그 출력 여부에 따라 로그 출력
             if should_log:
                 if items:
-                    item_nos = [item['no'] for item in items]
+                    item_nos = [item.no for item in items]
                     logger.info(f"모니터 {monitor_id}를 위해 {len(items)}개 항목 가져옴. 항목 번호: {item_nos}")
                 else:
                     logger.info(f"모니터 {monitor_id}를 위한 새 항목 없음 (no > {last_displayed_item_no})")
             
             # 새 항목이 없으면 빈 리스트를 반환
             return items
+    except CircuitOpenError:
+        raise
     except Exception as e:
         logger.error(f"Error fetching new items for monitor {monitor_id}: {e}")
-        return []  # 오류 발생 시 빈 리스트 반환
+        raise  # 호출한 쪽이 기존 큐를 유지할 수 있도록 빈 리스트 대신 예외 전달
     finally:
         if conn: 
             try:
-                await DB_POOL.release(conn)
+                await pool.release(conn)
             except Exception as release_error:
                 logger.error(f"Error releasing connection: {release_error}")
 
 # --- get_latest_item_no 함수 추가 ---
-async def get_latest_item_no():
+async def get_latest_item_no(event: Optional[EventSettings] = None):
     """DB에서 가장 최신 항목의 no 값을 가져옵니다."""
+    deadline = OperationDeadline("get_latest_item_no")
+    pool = None
     conn = None
     try:
         # 안전한 테이블 이름 가져오기
-        table_name = get_safe_table_name()
+        table_name = get_safe_table_name(event)
         
-        conn = await get_db_connection()
+        pool, conn = await get_read_connection(deadline, event=event)
         async with conn.cursor() as cur:
             query = """
                 SELECT MAX(no) as latest_no
                 FROM {}
             """.format(table_name)
             
-            await cur.execute(query)
+            await execute_with_deadline(cur, deadline, query)
             result = await cur.fetchone()
             
             # 결과가 없거나 NULL이면 0 반환
@@ -427,6 +783,464 @@ async def get_latest_item_no():
             return result['latest_no']
     except Exception as e:
         logger.error(f"Error fetching latest item no: {e}")
-        return 0  # 오류 발생 시 기본값 0 반환
+        raise  # 0 을 반환하면 모니터 커서가 처음으로 돌아가므로 호출한 쪽에서 처리
+    finally:
+        if conn: await pool.release(conn)
+
+# --- create_archive_table 함수 추가 ---
+async def create_archive_table(event: Optional[EventSettings] = None):
+    """운영 테이블과 같은 구조의 아카이브 테이블이 없으면 생성합니다."""
+    deadline = OperationDeadline("create_archive_table")
+    conn = None
+    try:
+        table_name = get_safe_table_name(event)
+        archive_table_name = get_safe_archive_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            # LIKE는 컬럼과 인덱스만 복사하고 트리거는 복사하지 않으므로 update_time이 그대로 보존됨
+            await execute_with_deadline(cur, deadline, f"CREATE TABLE IF NOT EXISTS {archive_table_name} LIKE {table_name}")
+            await conn.commit()
+            logger.info(f"Archive table '{archive_table_name}' is ready.")
+    except Exception as e:
+        logger.error(f"Error creating archive table: {e}")
+        raise
     finally:
-        if conn: await DB_POOL.release(conn)
\ No newline at end of file
+        if conn: await DB_POOL.release(conn)
+
+# --- archive_displayed_items 함수 추가 ---
+async def archive_displayed_items(cutoff_time: datetime.datetime, batch_size: int, after_no: int = 0, event: Optional[EventSettings] = None) -> tuple:
+    """
+    get_time 이 cutoff_time 보다 오래된 state=1 항목 중 no 가 after_no 보다 큰 것을 최대 batch_size 개까지
+    아카이브 테이블로 옮기고 운영 테이블에서 삭제합니다.
+    한 트랜잭션으로 처리하므로 복사와 삭제 중 하나만 적용되는 일은 없습니다.
+
+    아카이브에 이미 같은 행이 있으면(이전 복사 후 삭제만 실패한 경우 등) 복사 없이 삭제하고,
+    같은 no 에 다른 내용의 행이 있으면(AUTO_INCREMENT 초기화 등) 운영 테이블에 남긴 채 로그만 남깁니다.
+    충돌한 행이 배치 앞쪽에 있어도 호출한 쪽이 반환된 마지막 no 이후부터 이어가므로 아카이브가 멈추지 않습니다.
+
+    Returns:
+        (옮겨진 항목 수, 조회한 대상 수, 조회한 마지막 no)
+    """
+    deadline = OperationDeadline("archive_displayed_items")
+    conn = None
+    try:
+        table_name = get_safe_table_name(event)
+        archive_table_name = get_safe_archive_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await conn.begin()
+
+            # PK 순서로 배치를 잡아 잠금 범위를 작게 유지하고, 같은 no 의 아카이브 행과 비교
+            await execute_with_deadline(cur, deadline, f"""
+                SELECT t.no,
+                       a.no IS NOT NULL AS in_archive,
+                       (a.text <=> t.text AND a.update_time <=> t.update_time AND a.adr <=> t.adr) AS same_row
+                FROM {table_name} t
+                LEFT JOIN {archive_table_name} a ON a.no = t.no
+                WHERE t.state = 1 AND t.get_time < %s AND t.no > %s
+                ORDER BY t.no ASC
+                LIMIT %s
+                FOR UPDATE
+            """, (cutoff_time, after_no, batch_size))
+            rows = await cur.fetchall()
+
+            if not rows:
+                await conn.rollback()
+                return 0, 0, after_no
+
+            to_copy = [row['no'] for row in rows if not row['in_archive']]
+            already_archived = [row['no'] for row in rows if row['in_archive'] and row['same_row']]
+            conflicts = [row['no'] for row in rows if row['in_archive'] and not row['same_row']]
+
+            if to_copy:
+                placeholders = ', '.join(['%s'] * len(to_copy))
+                await execute_with_deadline(cur, deadline, f"""
+                    INSERT INTO {archive_table_name}
+                    SELECT * FROM {table_name}
+                    WHERE no IN ({placeholders})
+                """, to_copy)
+
+            # 아카이브에 있는 것이 확인된 행만 삭제
+            archived_ids = to_copy + already_archived
+            archived_count = 0
+            if archived_ids:
+                placeholders = ', '.join(['%s'] * len(archived_ids))
+                await execute_with_deadline(cur, deadline, f"DELETE FROM {table_name} WHERE no IN ({placeholders})", archived_ids)
+                archived_count = cur.rowcount
+
+            await conn.commit()
+            if conflicts:
+                logger.warning(f"Archive table '{archive_table_name}' already has different rows for item no {conflicts}; left them in '{table_name}'")
+            counters.record_archived(resolve_event(event).name, archived_count)
+            return archived_count, len(rows), rows[-1]['no']
+    except Exception as e:
+        logger.error(f"Error archiving displayed items: {e}")
+        await rollback_quietly(conn)
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+# --- get_archived_items_db 함수 추가 ---
+async def get_archived_items_db(limit: int = 100, before_no: int = 0, monitor_id: str = None, event: Optional[EventSettings] = None):
+    """
+    아카이브 테이블의 항목을 no 내림차순으로 조회합니다.
+    before_no 를 지정하면 해당 번호보다 작은 항목만 조회합니다 (키셋 페이지네이션).
+    """
+    deadline = OperationDeadline("get_archived_items_db")
+    pool = None
+    conn = None
+    try:
+        archive_table_name = get_safe_archive_table_name(event)
+
+        pool, conn = await get_read_connection(deadline, event=event)
+        async with conn.cursor(aiomysql.cursors.Cursor) as cur:
+            conditions = []
+            params = []
+            if before_no:
+                conditions.append("no < %s")
+                params.append(before_no)
+            if monitor_id:
+                conditions.append("adr = %s")
+                params.append(monitor_id)
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            query = f"""
+                SELECT {ItemRecord.COLUMNS}
+                FROM {archive_table_name}
+                {where_clause}
+                ORDER BY no DESC
+                LIMIT %s
+            """
+            params.append(limit)
+
+            await execute_with_deadline(cur, deadline, query, params)
+            items = [ItemRecord.from_row(row) for row in await cur.fetchall()]
+            return items
+    except Exception as e:
+        logger.error(f"Error fetching archived items: {e}")
+        raise
+    finally:
+        if conn: await pool.release(conn)
+
+# --- 워커 리더 잠금 함수 추가 ---
+async def connect_with_deadline(deadline: OperationDeadline):
+    """
+    작업의 마감 시간 안에 풀을 거치지 않는 전용 연결을 만듭니다 (리더 잠금용).
+    시간 안에 연결하지 못하거나 연결에 실패하면 주 DB 차단기에 기록합니다.
+    """
+    deadline.breaker = DB_BREAKER
+    timeout = deadline.remaining("acquire")
+    try:
+        return await asyncio.wait_for(aiomysql.connect(
+            host=settings.DB_HOST,
+            port=settings.DB_PORT,
+            user=settings.DB_USER,
+            password=settings.DB_PASSWORD,
+            db=settings.DB_NAME,
+            autocommit=True,
+            charset='utf8mb4',
+            cursorclass=aiomysql.cursors.DictCursor,
+        ), timeout)
+    except asyncio.TimeoutError:
+        counters.record_query_timeout(deadline.operation, "acquire")
+        error = QueryTimeoutError(f"{deadline.operation}: could not connect within {deadline.timeout}s")
+        DB_BREAKER.record_failure(error)
+        raise error
+    except Exception as e:
+        record_db_failure(e)
+        raise
+
+async def try_acquire_worker_lock(lock_name: str) -> bool:
+    """
+    전용 연결에서 GET_LOCK 으로 워커 리더 잠금을 시도합니다 (대기하지 않음).
+    잠금은 연결에 묶여 있으므로 프로세스가 죽거나 연결이 끊기면 DB가 자동으로 해제하고,
+    다른 프로세스가 다음 확인 주기에 잠금을 이어받습니다.
+    """
+    global LEADER_LOCK_CONN
+    deadline = OperationDeadline("try_acquire_worker_lock")
+    try:
+        if LEADER_LOCK_CONN is None or LEADER_LOCK_CONN.closed:
+            LEADER_LOCK_CONN = await connect_with_deadline(deadline)
+        async with LEADER_LOCK_CONN.cursor() as cur:
+            await execute_with_deadline(cur, deadline, "SELECT GET_LOCK(%s, 0) AS acquired", (lock_name,))
+            result = await cur.fetchone()
+            return bool(result and result['acquired'] == 1)
+    except Exception as e:
+        logger.error(f"Error acquiring worker lock '{lock_name}': {e}")
+        if LEADER_LOCK_CONN:
+            LEADER_LOCK_CONN.close()
+            LEADER_LOCK_CONN = None
+        return False
+
+async def check_worker_lock(lock_name: str) -> bool:
+    """현재 프로세스의 전용 연결이 여전히 워커 리더 잠금을 보유하고 있는지 확인합니다."""
+    global LEADER_LOCK_CONN
+    if LEADER_LOCK_CONN is None or LEADER_LOCK_CONN.closed:
+        return False
+    deadline = OperationDeadline("check_worker_lock")
+    try:
+        async with LEADER_LOCK_CONN.cursor() as cur:
+            await execute_with_deadline(cur, deadline, "SELECT IS_USED_LOCK(%s) = CONNECTION_ID() AS held", (lock_name,))
+            result = await cur.fetchone()
+            return bool(result and result['held'] == 1)
+    except Exception as e:
+        logger.error(f"Error checking worker lock '{lock_name}': {e}")
+        # 연결 상태를 알 수 없으면 잠금을 잃은 것으로 간주하고 연결 정리
+        LEADER_LOCK_CONN.close()
+        LEADER_LOCK_CONN = None
+        return False
+
+async def release_worker_lock(lock_name: str):
+    """워커 리더 잠금을 해제하고 전용 연결을 닫습니다."""
+    global LEADER_LOCK_CONN
+    if LEADER_LOCK_CONN is None:
+        return
+    deadline = OperationDeadline("release_worker_lock")
+    try:
+        if not LEADER_LOCK_CONN.closed:
+            async with LEADER_LOCK_CONN.cursor() as cur:
+                await execute_with_deadline(cur, deadline, "SELECT RELEASE_LOCK(%s)", (lock_name,))
+    except Exception as e:
+        logger.error(f"Error releasing worker lock '{lock_name}': {e}")
+    finally:
+        LEADER_LOCK_CONN.close()
+        LEADER_LOCK_CONN = None
+
+# --- release_orphaned_claims 함수 추가 ---
+async def release_orphaned_claims(event: Optional[EventSettings] = None) -> int:
+    """
+    처리 중(state=-1)으로 남아 있는 항목을 다시 대기(state=0)로 되돌립니다.
+    리더가 바뀐 직후 호출하여 이전 리더가 처리하지 못한 항목을 복구합니다.
+    """
+    deadline = OperationDeadline("release_orphaned_claims")
+    conn = None
+    try:
+        table_name = get_safe_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"UPDATE {table_name} SET state = 0 WHERE state = -1")
+            released_count = cur.rowcount
+            await conn.commit()
+            counters.record_released(resolve_event(event).name, released_count)
+            return released_count
+    except Exception as e:
+        logger.error(f"Error releasing orphaned claims: {e}")
+        await rollback_quietly(conn)
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+# --- get_last_assigned_monitor_id 함수 추가 ---
+async def get_last_assigned_monitor_id(event: Optional[EventSettings] = None):
+    """가장 최근에 항목이 할당된 모니터 ID를 조회합니다. 없으면 None 을 반환합니다."""
+    deadline = OperationDeadline("get_last_assigned_monitor_id")
+    conn = None
+    try:
+        table_name = get_safe_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"""
+                SELECT adr
+                FROM {table_name}
+                WHERE state = 1
+                ORDER BY get_time DESC
+                LIMIT 1
+            """)
+            result = await cur.fetchone()
+            return result['adr'] if result else None
+    except Exception as e:
+        logger.error(f"Error fetching last assigned monitor id: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+# --- get_item_state_counts 함수 추가 ---
+async def get_item_state_counts(event: Optional[EventSettings] = None):
+    """
+    카운터 초기화용으로 최신 no 와 상태별 항목 수를 한 번의 쿼리로 조회하고,
+    모니터별로 표시 시작 번호(시작 시점의 최신 no) 이후에 할당된 아직 표시되지 않은 항목 수를 조회합니다.
+    """
+    deadline = OperationDeadline("get_item_state_counts")
+    conn = None
+    try:
+        table_name = get_safe_table_name(event)
+
+        # 카운터는 프로세스 시작 시 한 번만 채우므로 정확한 값을 위해 주 DB에서 조회
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"""
+                SELECT MAX(no) AS latest_no,
+                       SUM(state = 0) AS pending,
+                       SUM(state = -1) AS claimed,
+                       SUM(state = 1) AS assigned
+                FROM {table_name}
+            """)
+            result = await cur.fetchone()
+            latest_no = int(result['latest_no'] or 0)
+
+            # 모니터는 시작 시점의 최신 no 이후 항목부터 표시하므로 같은 기준으로 모니터별 대기 수를 계산
+            await execute_with_deadline(cur, deadline, f"""
+                SELECT adr, COUNT(*) AS backlog
+                FROM {table_name}
+                WHERE state = 1 AND no > %s
+                GROUP BY adr
+            """, (latest_no,))
+            backlog = {str(row['adr']): int(row['backlog']) for row in await cur.fetchall()}
+            return {
+                "latest_no": latest_no,
+                "pending": int(result['pending'] or 0),
+                "claimed": int(result['claimed'] or 0),
+                "assigned": int(result['assigned'] or 0),
+                "backlog": backlog,
+            }
+    except Exception as e:
+        logger.error(f"Error fetching item state counts: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+# --- 할당 변경 피드 함수 추가 ---
+async def create_changefeed_table(event: Optional[EventSettings] = None):
+    """할당 변경 피드 테이블이 없으면 생성합니다. seq 는 AUTO_INCREMENT 기본 키로 범위 조회에 사용됩니다."""
+    deadline = OperationDeadline("create_changefeed_table")
+    conn = None
+    try:
+        changefeed_table_name = get_safe_changefeed_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"""
+                CREATE TABLE IF NOT EXISTS {changefeed_table_name} (
+                    seq BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+                    item_no INT NOT NULL,
+                    monitor_id VARCHAR(32) NOT NULL,
+                    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    KEY idx_created_at (created_at)
+                )
+            """)
+            await conn.commit()
+            logger.info(f"Changefeed table '{changefeed_table_name}' is ready.")
+    except Exception as e:
+        logger.error(f"Error creating changefeed table: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+async def get_changefeed_head(event: Optional[EventSettings] = None) -> int:
+    """변경 피드의 마지막 seq 를 조회합니다 (기록이 없으면 0)."""
+    deadline = OperationDeadline("get_changefeed_head")
+    conn = None
+    try:
+        changefeed_table_name = get_safe_changefeed_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"SELECT MAX(seq) AS head FROM {changefeed_table_name}")
+            result = await cur.fetchone()
+            return int(result['head'] or 0)
+    except Exception as e:
+        logger.error(f"Error fetching changefeed head: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+async def get_changefeed_since(after_seq: int, limit: int, event: Optional[EventSettings] = None):
+    """
+    after_seq 이후의 변경 피드 기록을 seq 순으로 최대 limit 개 조회합니다.
+    기본 키 범위 조회이므로 새 기록 수에 비례하는 비용만 듭니다.
+    복제본은 피드가 늦게 보일 수 있으므로 주 DB에서 조회합니다.
+    """
+    deadline = OperationDeadline("get_changefeed_since")
+    conn = None
+    try:
+        changefeed_table_name = get_safe_changefeed_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"""
+                SELECT seq, item_no, monitor_id
+                FROM {changefeed_table_name}
+                WHERE seq > %s
+                ORDER BY seq ASC
+                LIMIT %s
+            """, (after_seq, limit))
+            return await cur.fetchall()
+    except Exception as e:
+        logger.error(f"Error reading changefeed: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+async def purge_changefeed(cutoff_time: datetime.datetime, batch_size: int, event: Optional[EventSettings] = None) -> int:
+    """cutoff_time 보다 오래된 변경 피드 기록을 최대 batch_size 개 삭제하고 삭제된 수를 반환합니다."""
+    deadline = OperationDeadline("purge_changefeed")
+    conn = None
+    try:
+        changefeed_table_name = get_safe_changefeed_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, 
+                f"DELETE FROM {changefeed_table_name} WHERE created_at < %s LIMIT %s",
+                (cutoff_time, batch_size),
+            )
+            deleted = cur.rowcount
+            await conn.commit()
+            return deleted
+    except Exception as e:
+        logger.error(f"Error purging changefeed: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+# --- 중복 제출 병합 테이블 함수 추가 ---
+async def create_dedup_table(event: Optional[EventSettings] = None):
+    """중복 제출 병합용 해시 테이블이 없으면 생성합니다."""
+    deadline = OperationDeadline("create_dedup_table")
+    conn = None
+    try:
+        dedup_table_name = get_safe_dedup_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, f"""
+                CREATE TABLE IF NOT EXISTS {dedup_table_name} (
+                    text_hash CHAR(40) NOT NULL PRIMARY KEY,
+                    item_no INT NOT NULL,
+                    created_at DATETIME NOT NULL,
+                    KEY idx_created_at (created_at)
+                )
+            """)
+            await conn.commit()
+            logger.info(f"Dedup table '{dedup_table_name}' is ready.")
+    except Exception as e:
+        logger.error(f"Error creating dedup table: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
+
+async def purge_dedup_entries(window_seconds: int, batch_size: int, event: Optional[EventSettings] = None) -> int:
+    """병합 기간이 지난 해시 행을 최대 batch_size 개 삭제하고 삭제된 수를 반환합니다."""
+    deadline = OperationDeadline("purge_dedup_entries")
+    conn = None
+    try:
+        dedup_table_name = get_safe_dedup_table_name(event)
+
+        conn = await get_db_connection(deadline)
+        async with conn.cursor() as cur:
+            await execute_with_deadline(cur, deadline, 
+                f"DELETE FROM {dedup_table_name} WHERE created_at < NOW() - INTERVAL %s SECOND LIMIT %s",
+                (window_seconds, batch_size),
+            )
+            deleted = cur.rowcount
+            await conn.commit()
+            return deleted
+    except Exception as e:
+        logger.error(f"Error purging dedup entries: {e}")
+        raise
+    finally:
+        if conn: await DB_POOL.release(conn)
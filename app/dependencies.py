@@ -1,5 +1,59 @@
 # app/dependencies.py
-# 현재 예시에서는 사용되지 않습니다.
+from fastapi import HTTPException, Request
+from .core.config import settings, EventSettings
+from .internal.admission import AdmissionRejected, check_ingest_rate
+
+# 경로의 이벤트 이름으로 이벤트 설정을 찾는 의존성
+def get_event_or_404(event_name: str) -> EventSettings:
+    """이벤트 이름으로 설정을 찾습니다. 없으면 404 오류를 발생시킵니다."""
+    event = settings.EVENTS.get(event_name)
+    if event is None:
+        raise HTTPException(status_code=404, detail=f"Event '{event_name}' not found.")
+    return event
+
+# X-Forwarded-For 를 신뢰할 프록시 주소 목록
+TRUSTED_PROXY_HOSTS = {host.strip() for host in settings.TRUSTED_PROXY_HOSTS.split(",") if host.strip()}
+
+def get_client_ip(request: Request) -> str:
+    """
+    요청한 클라이언트의 IP를 반환합니다.
+    연결 주소가 신뢰하는 프록시이면 X-Forwarded-For 를 오른쪽부터 따라가 처음 만나는 신뢰하지 않는 주소를 사용합니다
+    (클라이언트가 직접 넣은 왼쪽 값은 위조될 수 있으므로 사용하지 않음).
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    trust_all = "*" in TRUSTED_PROXY_HOSTS
+    if not (trust_all or client_ip in TRUSTED_PROXY_HOSTS):
+        return client_ip
+
+    forwarded_for = request.headers.get("X-Forwarded-For", "")
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        client_ip = hop
+        if not trust_all and hop not in TRUSTED_PROXY_HOSTS:
+            break
+    # "*" 이면 모든 프록시를 신뢰하므로 가장 왼쪽(원래 클라이언트) 주소가 남음
+    return client_ip
+
+# 수집(ingest) 라우트용 토큰 버킷 검사 의존성
+async def ingest_rate_limit(request: Request):
+    """전체 및 클라이언트별 수집 속도 제한을 확인하고, 초과 시 429 응답을 반환합니다."""
+    client_id = get_client_ip(request)
+    try:
+        check_ingest_rate(client_id)
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=429,
+            detail=f"요청이 너무 많습니다: {e.reason}",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+# 관리자 엔드포인트 보호 의존성
+async def require_admin_token(request: Request):
+    """ADMIN_TOKEN 이 설정된 경우 X-Admin-Token 헤더가 일치하는지 확인합니다."""
+    if settings.ADMIN_TOKEN and request.headers.get("X-Admin-Token") != settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다.")
+
+# DB 연결 의존성은 현재 예시에서는 사용되지 않습니다.
 # from .database import get_db_connection
 
 # async def get_db():
@@ -12,4 +66,4 @@
 #             # pool.release(conn) 방식은 get_db_connection 내부나
 #             # 사용하는 함수 내에서 finally 블록에서 처리하는 것이 좋습니다.
 #             # 의존성 주입 시에는 별도의 패턴이 필요할 수 있습니다.
-#             pass # aiomysql connection release should be managed
\ No newline at end of file
+#             pass # aiomysql connection release should be managed
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트별 버킷을 보관할 최대 개수 (오래 사용하지 않은 클라이언트부터 제거)
+MAX_TRACKED_CLIENTS = 10000
+
+
+class AdmissionRejected(Exception):
+    """수집 요청을 받아들일 수 없을 때 발생하는 예외. retry_after 초 후 재시도를 안내합니다."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 capacity 개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def wait_time(self) -> float:
+        """
+        토큰을 사용하지 않고 확인만 합니다.
+        토큰이 있으면 0을, 부족하면 다음 토큰이 생길 때까지의 대기 시간(초)을 반환합니다.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        """wait_time() 이 0을 반환한 뒤 토큰 1개를 사용합니다."""
+        self.tokens -= 1
+
+
+# 전체 수집 요청 버킷과 클라이언트별 버킷
+GLOBAL_BUCKET = TokenBucket(settings.INGEST_RATE_PER_SECOND, settings.INGEST_BURST)
+CLIENT_BUCKETS: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+# 수집 경로와 백그라운드 작업(워커, 아카이브, 변경 피드, 중복 해시 정리)이 함께 사용할 수 있는 DB 연결 수
+# (나머지는 모니터 표시 경로용으로 예약)
+NON_DISPLAY_DB_SLOTS = asyncio.Semaphore(max(1, settings.DB_POOL_MAXSIZE - settings.DB_DISPLAY_RESERVED_CONNECTIONS))
+ingest_waiting = 0  # DB 연결 슬롯을 기다리는 수집 요청 수
+
+
+def _get_client_bucket(client_id: str) -> TokenBucket:
+    client_bucket = CLIENT_BUCKETS.get(client_id)
+    if client_bucket is None:
+        client_bucket = TokenBucket(settings.INGEST_CLIENT_RATE_PER_SECOND, settings.INGEST_CLIENT_BURST)
+        CLIENT_BUCKETS[client_id] = client_bucket
+        if len(CLIENT_BUCKETS) > MAX_TRACKED_CLIENTS:
+            CLIENT_BUCKETS.popitem(last=False)
+    else:
+        CLIENT_BUCKETS.move_to_end(client_id)
+    return client_bucket
+
+
+def check_ingest_rate(client_id: str):
+    """
+    전체 및 클라이언트별(INGEST_CLIENT_LIMIT_ENABLED 인 경우) 토큰 버킷을 확인합니다. 초과 시 AdmissionRejected 를 발생시킵니다.
+    두 버킷을 모두 확인한 뒤에만 토큰을 사용하므로, 한쪽에서 거부된 요청은 다른 쪽 토큰을 소모하지 않습니다.
+    """
+    client_bucket = _get_client_bucket(client_id) if settings.INGEST_CLIENT_LIMIT_ENABLED else None
+
+    # 클라이언트 버킷을 먼저 확인해 한 클라이언트의 폭주가 전체 토큰을 소모하지 않도록 함
+    if client_bucket is not None:
+        wait_seconds = client_bucket.wait_time()
+        if wait_seconds:
+            raise AdmissionRejected("client rate limit exceeded", wait_seconds)
+
+    wait_seconds = GLOBAL_BUCKET.wait_time()
+    if wait_seconds:
+        raise AdmissionRejected("global rate limit exceeded", wait_seconds)
+
+    if client_bucket is not None:
+        client_bucket.take()
+    GLOBAL_BUCKET.take()
+
+
+@asynccontextmanager
+async def ingest_db_slot():
+    """
+    수집 경로용 DB 연결 슬롯을 확보합니다.
+    대기열이 가득 찼거나 INGEST_SLOT_TIMEOUT_SECONDS 안에 슬롯을 얻지 못하면 AdmissionRejected 를 발생시킵니다.
+    """
+    global ingest_waiting
+
+    if NON_DISPLAY_DB_SLOTS.locked() and ingest_waiting >= settings.INGEST_MAX_WAITING:
+        raise AdmissionRejected("ingest queue is full", settings.INGEST_SLOT_TIMEOUT_SECONDS)
+
+    ingest_waiting += 1
+    try:
+        await asyncio.wait_for(NON_DISPLAY_DB_SLOTS.acquire(), timeout=settings.INGEST_SLOT_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise AdmissionRejected("timed out waiting for a database slot", settings.INGEST_SLOT_TIMEOUT_SECONDS)
+    finally:
+        ingest_waiting -= 1
+
+    try:
+        yield
+    finally:
+        NON_DISPLAY_DB_SLOTS.release()
+
+
+@asynccontextmanager
+async def background_db_slot():
+    """
+    백그라운드 작업용 DB 연결 슬롯을 확보합니다.
+    수집 경로와 같은 슬롯을 사용하므로 백그라운드 작업이 표시 경로용으로 예약된 연결을 쓰지 않으며,
+    거부하지 않고 슬롯이 빌 때까지 기다립니다.
+    """
+    async with NON_DISPLAY_DB_SLOTS:
+        yield
@@ -0,0 +1,50 @@
+import asyncio
+import datetime
+import logging
+from ..database import archive_displayed_items
+from .admission import background_db_slot
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 배치 사이 대기 시간(초) - 한 번에 오래 잠금을 잡지 않도록 배치를 나눠 처리
+ARCHIVE_BATCH_PAUSE_SECONDS = 0.5
+
+async def archive_old_items_worker():
+    """
+    주기적으로 표시가 끝난 지 보관 기간(ARCHIVE_RETENTION_MINUTES)이 지난 항목을
+    아카이브 테이블로 옮겨 운영 테이블이 현재 작업 중인 항목만 갖도록 유지합니다.
+    """
+    logger.info(f"Archive worker started. Moving items older than {settings.ARCHIVE_RETENTION_MINUTES} minutes every {settings.ARCHIVE_INTERVAL_SECONDS} seconds.")
+
+    while True:
+        try:
+            cutoff_time = datetime.datetime.now() - datetime.timedelta(minutes=settings.ARCHIVE_RETENTION_MINUTES)
+
+            for event in settings.EVENTS.values():
+                total_archived = 0
+                after_no = 0
+
+                # 남은 대상이 배치 크기보다 적을 때까지 배치 단위로 반복
+                # (옮기지 못한 충돌 행이 있어도 마지막으로 조회한 no 이후부터 이어가므로 같은 배치를 반복하지 않음)
+                while True:
+                    async with background_db_slot():
+                        archived_count, scanned_count, after_no = await archive_displayed_items(
+                            cutoff_time, settings.ARCHIVE_BATCH_SIZE, after_no=after_no, event=event
+                        )
+                    total_archived += archived_count
+                    if scanned_count < settings.ARCHIVE_BATCH_SIZE:
+                        break
+                    await asyncio.sleep(ARCHIVE_BATCH_PAUSE_SECONDS)
+
+                if total_archived:
+                    logger.info(f"[{event.name}] Archived {total_archived} items displayed before {cutoff_time}")
+
+        except asyncio.CancelledError:
+            logger.info("Archive worker cancelled.")
+            break
+        except Exception as e:
+            logger.error(f"An error occurred in the archive worker loop: {e}")
+
+        # 다음 실행까지 대기
+        await asyncio.sleep(settings.ARCHIVE_INTERVAL_SECONDS)
@@ -0,0 +1,96 @@
+import asyncio
+import datetime
+import logging
+import time
+from typing import Dict
+from ..database import get_changefeed_head, get_changefeed_since, purge_changefeed, note_assignment_write
+from ..core.config import settings, EventSettings
+from ..routers.monitors import mark_monitor_stale
+from . import counters
+from .admission import background_db_slot
+
+logger = logging.getLogger(__name__)
+
+# 이벤트별로 이 프로세스가 마지막으로 읽은 변경 피드 seq
+LAST_SEQ: Dict[str, int] = {}
+# 이벤트별로 건너뛴 seq -> 처음 발견한 시각 (monotonic)
+# seq 는 삽입 시 정해지고 커밋은 그 뒤에 일어나므로, 작은 seq 가 더 늦게 커밋되어 나중에 보일 수 있음
+PENDING_GAPS: Dict[str, Dict[int, float]] = {}
+# 오래된 피드 기록을 정리하는 간격(초)
+PURGE_INTERVAL_SECONDS = 600
+
+
+async def poll_changefeed(event: EventSettings):
+    """
+    이벤트의 변경 피드에서 새 기록(과 아직 보이지 않던 seq)을 읽어 해당 모니터를 갱신 대상으로 표시합니다.
+    건너뛴 seq 는 CHANGEFEED_GAP_GRACE_SECONDS 동안 가장 작은 것부터 다시 조회하고,
+    그 뒤에도 보이지 않으면 롤백 등으로 비어 있는 번호로 보고 더 확인하지 않습니다.
+    """
+    gaps = PENDING_GAPS.setdefault(event.name, {})
+    now = time.monotonic()
+    for seq in [seq for seq, seen_at in gaps.items() if now - seen_at > settings.CHANGEFEED_GAP_GRACE_SECONDS]:
+        del gaps[seq]
+
+    after_seq = min(gaps) - 1 if gaps else LAST_SEQ[event.name]
+    # 배치 크기만큼 가득 차면 남은 기록을 바로 이어서 읽음
+    while True:
+        async with background_db_slot():
+            records = await get_changefeed_since(after_seq, settings.CHANGEFEED_BATCH_SIZE, event=event)
+        for record in records:
+            seq = record['seq']
+            last_seq = LAST_SEQ[event.name]
+            if seq > last_seq:
+                # 배치보다 크게 벌어진 경우(AUTO_INCREMENT 점프 등)는 추적하지 않음
+                if seq - last_seq - 1 <= settings.CHANGEFEED_BATCH_SIZE:
+                    for missing_seq in range(last_seq + 1, seq):
+                        gaps[missing_seq] = now
+                LAST_SEQ[event.name] = seq
+            elif gaps.pop(seq, None) is None:
+                continue  # 다시 조회한 범위에서 이미 반영한 기록
+            # 직후의 큐 조회가 아직 할당이 반영되지 않은 복제본으로 가지 않도록 주 DB로 고정
+            note_assignment_write(event.table_name, record['monitor_id'])
+            counters.record_backlog_added(event.name, str(record['monitor_id']))
+            mark_monitor_stale(event, record['monitor_id'])
+        if len(records) < settings.CHANGEFEED_BATCH_SIZE:
+            break
+        after_seq = records[-1]['seq']
+
+
+async def changefeed_tailer():
+    """
+    각 이벤트의 할당 변경 피드를 마지막 seq 이후부터 주기적으로 읽어,
+    새 할당이 있는 모니터만 큐를 다시 조회하도록 표시합니다.
+    프로세스마다 하나만 실행되며, 모니터 수와 관계없이 주기당 이벤트별 범위 조회 한 번만 수행합니다.
+    """
+    logger.info(f"Changefeed tailer started. Polling every {settings.CHANGEFEED_POLL_INTERVAL_SECONDS} seconds.")
+    loop = asyncio.get_running_loop()
+    last_purge = loop.time()
+
+    while True:
+        try:
+            for event in settings.EVENTS.values():
+                # 처음에는 현재 끝에서 시작 (이전 기록은 모니터 초기화 시 큐 조회로 이미 반영됨)
+                if event.name not in LAST_SEQ:
+                    async with background_db_slot():
+                        LAST_SEQ[event.name] = await get_changefeed_head(event=event)
+                    logger.info(f"[{event.name}] Changefeed tailing from seq {LAST_SEQ[event.name]}")
+
+                await poll_changefeed(event)
+
+            # 보관 기간이 지난 피드 기록 정리 (여러 프로세스가 동시에 실행해도 무방)
+            if loop.time() - last_purge >= PURGE_INTERVAL_SECONDS:
+                last_purge = loop.time()
+                cutoff_time = datetime.datetime.now() - datetime.timedelta(minutes=settings.CHANGEFEED_RETENTION_MINUTES)
+                for event in settings.EVENTS.values():
+                    async with background_db_slot():
+                        purged = await purge_changefeed(cutoff_time, settings.CHANGEFEED_BATCH_SIZE, event=event)
+                    if purged:
+                        logger.info(f"[{event.name}] Purged {purged} changefeed records older than {cutoff_time}")
+
+        except asyncio.CancelledError:
+            logger.info("Changefeed tailer cancelled.")
+            break
+        except Exception as e:
+            logger.error(f"An error occurred in the changefeed tailer loop: {e}")
+
+        await asyncio.sleep(settings.CHANGEFEED_POLL_INTERVAL_SECONDS)
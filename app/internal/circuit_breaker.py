@@ -0,0 +1,126 @@
+import logging
+import random
+import time
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"        # 정상: 모든 요청 통과
+OPEN = "open"            # 차단: 대기 시간이 지날 때까지 요청을 DB로 보내지 않음
+HALF_OPEN = "half_open"  # 시험: 대기 시간마다 한 요청만 통과시켜 복구 여부 확인
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 DB 요청을 보내지 않았을 때 발생하는 예외"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} circuit is open, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 번 쌓이면 열리고, 지수적으로 늘어나는 대기 시간(지터 포함) 뒤
+    반열림 상태에서 시험 요청 하나를 통과시킵니다. 시험 요청이 성공하면 닫히고 실패하면 대기 시간을 늘려 다시 열립니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, base_backoff: float, max_backoff: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0      # 복구 전까지 연속으로 열린 횟수 (대기 시간 지수)
+        self.retry_at = 0.0      # 다음 시험 요청을 허용할 시각 (monotonic)
+        self.opened_at = None    # 처음 열린 시각 (time.time)
+        self.rejected_count = 0  # 차단으로 보내지 않은 요청 수
+        self.probe_count = 0     # 반열림 상태에서 통과시킨 시험 요청 수
+
+    @property
+    def healthy(self) -> bool:
+        return self.state == CLOSED
+
+    def allow_request(self) -> bool:
+        """요청을 DB로 보내도 되는지 반환합니다. 반열림 상태에서는 대기 시간마다 한 요청만 허용합니다."""
+        if self.state == CLOSED:
+            return True
+        now = time.monotonic()
+        if now < self.retry_at:
+            self.rejected_count += 1
+            return False
+        # 시험 요청 결과가 보고되지 않더라도(요청이 취소된 경우 등) 다음 시험은 같은 대기 시간 뒤에 허용
+        self.state = HALF_OPEN
+        self.retry_at = now + self._backoff()
+        self.probe_count += 1
+        logger.info(f"{self.name} circuit half-open: sending probe #{self.probe_count}")
+        return True
+
+    def retry_after(self) -> float:
+        """다음 시험 요청까지 남은 시간(초)"""
+        return max(0.0, self.retry_at - time.monotonic())
+
+    def record_success(self):
+        """요청 성공을 기록합니다. 열려 있었다면 닫습니다."""
+        if self.state != CLOSED:
+            downtime = time.time() - self.opened_at if self.opened_at else 0
+            logger.info(f"✅ {self.name} circuit closed: recovered after {downtime:.1f}s ({self.probe_count} probes, {self.rejected_count} requests rejected)")
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.opened_at = None
+
+    def record_failure(self, error: Exception):
+        """요청 실패를 기록합니다. 시험 요청이 실패했거나 연속 실패가 임계값에 도달하면 엽니다."""
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+            self._open(error)
+
+    def _backoff(self) -> float:
+        """현재 열린 횟수에 따른 대기 시간 (여러 프로세스의 시험 요청이 겹치지 않도록 ±20% 지터)"""
+        backoff = min(self.max_backoff, self.base_backoff * (2 ** max(0, self.open_count - 1)))
+        return backoff * random.uniform(0.8, 1.2)
+
+    def _open(self, error: Exception):
+        self.open_count += 1
+        self.state = OPEN
+        if self.opened_at is None:
+            self.opened_at = time.time()
+            self.rejected_count = 0
+            self.probe_count = 0
+        backoff = self._backoff()
+        self.retry_at = time.monotonic() + backoff
+        logger.warning(f"⚠️ {self.name} circuit open after {self.consecutive_failures} consecutive failures, next probe in {backoff:.1f}s: {error}")
+
+    def snapshot(self) -> dict:
+        """상태 확인용 차단기 상태"""
+        return {
+            "state": self.state,
+            "healthy": self.healthy,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after": round(self.retry_after(), 1) if self.state != CLOSED else 0,
+            "opened_at": self.opened_at,
+            "rejected_count": self.rejected_count,
+            "probe_count": self.probe_count,
+        }
+
+
+# 주 DB 연결/쿼리용 차단기 (프로세스 단위)
+DB_BREAKER = CircuitBreaker(
+    "Database",
+    failure_threshold=settings.DB_BREAKER_FAILURE_THRESHOLD,
+    base_backoff=settings.DB_BREAKER_BASE_BACKOFF_SECONDS,
+    max_backoff=settings.DB_BREAKER_MAX_BACKOFF_SECONDS,
+)
+# 복제본용 차단기 (복제본 장애가 주 DB를 막지 않도록 분리, 열려 있으면 조회를 주 DB로 보냄)
+REPLICA_BREAKER = CircuitBreaker(
+    "Replica",
+    failure_threshold=settings.DB_BREAKER_FAILURE_THRESHOLD,
+    base_backoff=settings.DB_BREAKER_BASE_BACKOFF_SECONDS,
+    max_backoff=settings.DB_BREAKER_MAX_BACKOFF_SECONDS,
+)
+
+
+def is_db_healthy() -> bool:
+    """DB 차단기가 닫혀 있는지(정상인지) 반환합니다."""
+    return DB_BREAKER.healthy
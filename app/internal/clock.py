@@ -0,0 +1,50 @@
+import datetime
+import time
+
+# 스케줄링 코드(모니터 표시 시간 계산, 워커 임계 시간)가 사용하는 시계
+# 운영에서는 시스템 시계를, 시뮬레이터에서는 가상 시계를 설정합니다.
+
+
+class SystemClock:
+    """시스템 시계"""
+
+    def time(self) -> float:
+        return time.time()
+
+    def now(self) -> datetime.datetime:
+        return datetime.datetime.now()
+
+
+class VirtualClock:
+    """advance() 로만 흐르는 가상 시계 (시뮬레이션용)"""
+
+    def __init__(self, start: float):
+        self.current = start
+
+    def time(self) -> float:
+        return self.current
+
+    def now(self) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(self.current)
+
+    def advance(self, seconds: float):
+        self.current += seconds
+
+
+CLOCK = SystemClock()
+
+
+def set_clock(clock):
+    """사용할 시계를 교체합니다."""
+    global CLOCK
+    CLOCK = clock
+
+
+def current_time() -> float:
+    """현재 시각(epoch 초)을 반환합니다."""
+    return CLOCK.time()
+
+
+def current_datetime() -> datetime.datetime:
+    """현재 시각을 datetime 으로 반환합니다."""
+    return CLOCK.now()
@@ -0,0 +1,135 @@
+import logging
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# 이벤트별 프로세스 내 항목 카운터 (시작 시 DB에서 한 번 채운 뒤 삽입/할당/표시 경로에서 갱신)
+# 여러 프로세스로 실행하면 각 프로세스가 직접 처리한 변경만 반영되는 근사값입니다.
+# 모니터별 대기 수는 변경 피드를 사용하면 모든 프로세스의 할당을 피드에서 반영하고,
+# 사용하지 않으면 이 프로세스가 직접 할당한 항목만 반영합니다 (MONITOR_BACKLOG_SOURCE).
+LATEST_ITEM_NO: Dict[str, int] = {}  # 이벤트별 알려진 가장 큰 항목 번호
+STATE_COUNTS: Dict[str, Dict[str, int]] = {}  # 이벤트별 상태 카운트 (pending: state=0, claimed: state=-1, assigned: state=1)
+MONITOR_BACKLOG: Dict[str, Dict[str, int]] = {}  # 이벤트별/모니터별 할당되었지만 아직 표시되지 않은 항목 수
+MONITOR_BACKLOG_SOURCE = "process"  # 모니터별 대기 수의 출처 (changefeed: 모든 프로세스, process: 이 프로세스의 할당만)
+SEEDED = set()  # DB에서 초기값을 가져온 이벤트 이름
+# DB 작업별 마감 시간 초과 횟수 (acquire: 연결 대기, query: 쿼리 실행)
+QUERY_TIMEOUTS: Dict[str, Dict[str, int]] = {}
+
+
+def _state_counts(event_name: str) -> Dict[str, int]:
+    return STATE_COUNTS.setdefault(event_name, {"pending": 0, "claimed": 0, "assigned": 0})
+
+
+def _adjust(event_name: str, state: str, delta: int):
+    counts = _state_counts(event_name)
+    counts[state] = max(0, counts[state] + delta)
+
+
+def seed_counters(event_name: str, latest_no: int, pending: int, claimed: int, assigned: int, backlog: Dict[str, int]):
+    """DB에서 조회한 값으로 이벤트의 카운터를 초기화합니다. backlog 는 모니터별 아직 표시되지 않은 할당 항목 수입니다."""
+    LATEST_ITEM_NO[event_name] = latest_no or 0
+    STATE_COUNTS[event_name] = {
+        "pending": pending or 0,
+        "claimed": claimed or 0,
+        "assigned": assigned or 0,
+    }
+    MONITOR_BACKLOG[event_name] = dict(backlog)
+    SEEDED.add(event_name)
+    logger.info(f"Counters seeded for event '{event_name}': latest_no={LATEST_ITEM_NO[event_name]}, {STATE_COUNTS[event_name]}, backlog={MONITOR_BACKLOG[event_name]}")
+
+
+def set_monitor_backlog_source(source: str):
+    """모니터별 대기 수의 출처를 설정합니다 (changefeed 또는 process)."""
+    global MONITOR_BACKLOG_SOURCE
+    MONITOR_BACKLOG_SOURCE = source
+
+
+def is_seeded(event_name: str) -> bool:
+    """이벤트의 카운터가 DB 값으로 초기화되었는지 반환합니다."""
+    return event_name in SEEDED
+
+
+def get_latest_item_no(event_name: str) -> int:
+    """이벤트의 알려진 가장 큰 항목 번호를 반환합니다."""
+    return LATEST_ITEM_NO.get(event_name, 0)
+
+
+def get_monitor_backlog(event_name: str, monitor_id: str) -> int:
+    """모니터에 할당되었지만 아직 표시되지 않은 항목 수를 반환합니다."""
+    return MONITOR_BACKLOG.get(event_name, {}).get(monitor_id, 0)
+
+
+def record_latest_item_no(event_name: str, item_no: int):
+    """DB에서 확인한 최신 항목 번호를 반영합니다 (다른 프로세스가 삽입한 항목 포함)."""
+    LATEST_ITEM_NO[event_name] = max(LATEST_ITEM_NO.get(event_name, 0), item_no)
+
+
+def record_insert(event_name: str, item_no: int):
+    """새 항목 삽입을 반영합니다."""
+    record_latest_item_no(event_name, item_no)
+    _adjust(event_name, "pending", 1)
+
+
+def record_claimed(event_name: str, count: int):
+    """워커가 대기 항목을 처리 중(state=-1)으로 가져간 것을 반영합니다."""
+    _adjust(event_name, "pending", -count)
+    _adjust(event_name, "claimed", count)
+
+
+def record_released(event_name: str, count: int):
+    """처리 중이던 항목이 다시 대기(state=0)로 돌아간 것을 반영합니다."""
+    _adjust(event_name, "claimed", -count)
+    _adjust(event_name, "pending", count)
+
+
+def record_assigned(event_name: str, monitor_id: str, previous_state: int):
+    """
+    항목이 모니터에 할당(state=1)된 것을 반영합니다.
+    변경 피드를 사용하면 모니터별 대기 수는 피드에서 반영하므로 여기서는 상태 카운트만 갱신합니다.
+    """
+    _adjust(event_name, "pending" if previous_state == 0 else "claimed", -1)
+    _adjust(event_name, "assigned", 1)
+    if MONITOR_BACKLOG_SOURCE != "changefeed":
+        record_backlog_added(event_name, monitor_id)
+
+
+def record_backlog_added(event_name: str, monitor_id: str):
+    """모니터에 표시할 항목이 하나 할당된 것을 모니터별 대기 수에 반영합니다."""
+    backlog = MONITOR_BACKLOG.setdefault(event_name, {})
+    backlog[monitor_id] = backlog.get(monitor_id, 0) + 1
+
+
+def record_displayed(event_name: str, monitor_id: str):
+    """모니터가 할당된 항목 하나를 표시하기 시작한 것을 반영합니다."""
+    backlog = MONITOR_BACKLOG.setdefault(event_name, {})
+    backlog[monitor_id] = max(0, backlog.get(monitor_id, 0) - 1)
+
+
+def record_archived(event_name: str, count: int):
+    """표시가 끝난 항목이 아카이브 테이블로 옮겨진 것을 반영합니다."""
+    _adjust(event_name, "assigned", -count)
+
+
+def get_counters_snapshot() -> dict:
+    """상태 확인용으로 이벤트별 현재 카운터 값을 반환합니다."""
+    return {
+        event_name: {
+            "seeded": event_name in SEEDED,
+            "latest_item_no": LATEST_ITEM_NO.get(event_name, 0),
+            **counts,
+            "monitor_backlog": dict(MONITOR_BACKLOG.get(event_name, {})),
+            "monitor_backlog_source": MONITOR_BACKLOG_SOURCE,
+        }
+        for event_name, counts in STATE_COUNTS.items()
+    }
+
+
+def record_query_timeout(operation: str, phase: str):
+    """DB 작업이 마감 시간을 넘긴 것을 반영합니다 (phase: acquire 또는 query)."""
+    timeouts = QUERY_TIMEOUTS.setdefault(operation, {"acquire": 0, "query": 0})
+    timeouts[phase] += 1
+
+
+def get_query_timeouts_snapshot() -> dict:
+    """작업별 마감 시간 초과 횟수를 반환합니다."""
+    return {operation: dict(timeouts) for operation, timeouts in QUERY_TIMEOUTS.items()}
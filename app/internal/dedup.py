@@ -0,0 +1,85 @@
+import asyncio
+import hashlib
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+from ..database import purge_dedup_entries
+from .admission import background_db_slot
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 이벤트별 최근 제출 텍스트 해시 -> (항목 no, 기록 시각)
+# 기간이 모두 같으므로 삽입 순서가 곧 만료 순서 (앞에서부터 만료된 항목 제거)
+RECENT_SUBMISSIONS: Dict[str, "OrderedDict[str, tuple]"] = {}
+# 메모리 색인 최대 크기 (이벤트별)
+MAX_TRACKED_SUBMISSIONS = 10000
+# DB 해시 테이블 정리 간격(초)과 한 번에 삭제할 행 수
+PURGE_INTERVAL_SECONDS = 60
+PURGE_BATCH_SIZE = 1000
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """중복 판단용으로 텍스트를 정규화합니다 (유니코드 정규화, 공백 정리, 대소문자 무시)."""
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip().casefold()
+
+
+def text_hash(text: str) -> str:
+    """정규화한 텍스트의 SHA-1 해시(40자)를 반환합니다."""
+    return hashlib.sha1(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def _prune(submissions: OrderedDict, now: float):
+    """기간이 지났거나 크기 제한을 넘은 오래된 항목을 앞에서부터 제거합니다."""
+    expire_before = now - settings.DEDUP_WINDOW_SECONDS
+    while submissions:
+        _, (_, recorded_at) = next(iter(submissions.items()))
+        if recorded_at >= expire_before and len(submissions) <= MAX_TRACKED_SUBMISSIONS:
+            break
+        submissions.popitem(last=False)
+
+
+def find_recent_submission(event_name: str, key: str) -> Optional[int]:
+    """기간 안에 같은 해시로 저장된 항목이 메모리 색인에 있으면 그 no 를 반환합니다."""
+    submissions = RECENT_SUBMISSIONS.get(event_name)
+    if not submissions:
+        return None
+    _prune(submissions, time.monotonic())
+    entry = submissions.get(key)
+    return entry[0] if entry else None
+
+
+def remember_submission(event_name: str, key: str, item_no: int):
+    """저장(또는 병합)된 항목을 메모리 색인에 기록합니다."""
+    submissions = RECENT_SUBMISSIONS.setdefault(event_name, OrderedDict())
+    now = time.monotonic()
+    # 같은 키가 있으면 지우고 다시 넣어 순서를 기록 시각 순으로 유지
+    submissions.pop(key, None)
+    submissions[key] = (item_no, now)
+    _prune(submissions, now)
+
+
+async def dedup_cleanup_worker():
+    """병합 기간이 지난 DB 해시 행을 주기적으로 정리합니다."""
+    logger.info(f"Dedup cleanup worker started. Purging entries older than {settings.DEDUP_WINDOW_SECONDS} seconds every {PURGE_INTERVAL_SECONDS} seconds.")
+
+    while True:
+        try:
+            for event in settings.EVENTS.values():
+                async with background_db_slot():
+                    purged = await purge_dedup_entries(settings.DEDUP_WINDOW_SECONDS, PURGE_BATCH_SIZE, event=event)
+                if purged:
+                    logger.info(f"[{event.name}] Purged {purged} expired dedup entries")
+        except asyncio.CancelledError:
+            logger.info("Dedup cleanup worker cancelled.")
+            break
+        except Exception as e:
+            logger.error(f"An error occurred in the dedup cleanup loop: {e}")
+
+        await asyncio.sleep(PURGE_INTERVAL_SECONDS)
@@ -0,0 +1,117 @@
+import logging
+from functools import lru_cache
+from ..core.config import settings
+from .records import ItemRecord
+
+logger = logging.getLogger(__name__)
+
+# display.html 의 글자 크기 계산을 서버에서 항목당 한 번만 수행하기 위한 모듈
+# (클라이언트는 매초 DOM 측정과 정규식 계산을 하지 않고 결과만 적용)
+
+BASE_FONT_SIZE = 56  # 기본 폰트 크기 (px)
+MIN_FONT_SIZE = 12
+MAX_FONT_SIZE = 60
+# 텍스트 영역 너비 중 텍스트가 차지할 수 있는 비율 (display.html 과 동일)
+TEXT_WIDTH_RATIO = 0.55
+
+# Pretendard 글자 종류별 대략적인 너비 (폰트 크기 대비 비율)
+# 브라우저처럼 실제 글꼴로 측정할 수 없으므로 글자 종류별 평균 너비로 추정
+HANGUL_WIDTH = 0.95
+UPPERCASE_WIDTH = 0.68
+LOWERCASE_WIDTH = 0.55
+DIGIT_WIDTH = 0.58
+SPACE_WIDTH = 0.25
+OTHER_WIDTH = 0.4
+
+
+def _char_width(ch: str) -> float:
+    if 'A' <= ch <= 'Z':
+        return UPPERCASE_WIDTH
+    if 'a' <= ch <= 'z':
+        return LOWERCASE_WIDTH
+    if '0' <= ch <= '9':
+        return DIGIT_WIDTH
+    if ch.isspace():
+        return SPACE_WIDTH
+    # 한글, 한자, 가나 등 전각 문자
+    if ord(ch) >= 0x1100:
+        return HANGUL_WIDTH
+    return OTHER_WIDTH
+
+
+def estimate_text_width(text: str, font_size: float) -> float:
+    """글자 종류별 평균 너비로 텍스트의 표시 너비(px)를 추정합니다."""
+    return sum(_char_width(ch) for ch in text) * font_size
+
+
+@lru_cache(maxsize=4096)
+def compute_text_layout(text: str) -> dict:
+    """
+    항목 텍스트의 글자 크기, 두 줄 사이 간격, 상단 여백(px)을 계산합니다.
+    display.html 에 있던 계산 방식을 그대로 옮겼으며 같은 텍스트는 캐시된 결과를 사용합니다.
+    """
+    text = text or ""
+    length = max(len(text), 1)
+    font_size = BASE_FONT_SIZE
+
+    # 텍스트 너비가 영역보다 넓으면 비율에 맞춰 축소 (화면에는 "텍스트's" 가 두 줄로 표시됨)
+    container_width = settings.LAYOUT_TEXT_AREA_WIDTH_PX * TEXT_WIDTH_RATIO
+    text_width = estimate_text_width(f"{text}'s{text}'s", font_size)
+    if text_width > container_width:
+        ratio = container_width / text_width
+        font_size = max(MIN_FONT_SIZE, int(font_size * ratio * 0.9))
+
+    # 텍스트 길이에 따른 추가 축소
+    if len(text) > 25:
+        font_size = max(MIN_FONT_SIZE, font_size * 0.85)
+    elif len(text) > 15:
+        font_size = max(MIN_FONT_SIZE, font_size * 0.9)
+    elif len(text) > 8:
+        font_size = max(MIN_FONT_SIZE, font_size * 0.95)
+
+    # 대문자/소문자 비율에 따른 추가 축소
+    uppercase_ratio = sum(1 for ch in text if 'A' <= ch <= 'Z') / length
+    lowercase_ratio = sum(1 for ch in text if 'a' <= ch <= 'z') / length
+    if uppercase_ratio > 0.7:
+        font_size = max(MIN_FONT_SIZE, font_size * 0.85)
+    elif uppercase_ratio > 0.4:
+        font_size = max(MIN_FONT_SIZE, font_size * 0.95)
+
+    if len(text) > 3:
+        if lowercase_ratio > 0.7:
+            font_size = max(MIN_FONT_SIZE, font_size * 0.85)
+        elif lowercase_ratio > 0.5:
+            font_size = max(MIN_FONT_SIZE, font_size * 0.9)
+        elif lowercase_ratio > 0.3:
+            font_size = max(MIN_FONT_SIZE, font_size * 0.95)
+
+    # 특수 문자나 숫자가 많은 경우 추가 축소
+    special_ratio = sum(1 for ch in text if not (ch.isascii() and ch.isalpha()) and not ch.isspace()) / length
+    if special_ratio > 0.3:
+        font_size = max(MIN_FONT_SIZE, font_size * 0.95)
+
+    # 단어 수가 많으면 추가 축소
+    if len(text.split()) > 3:
+        font_size = max(MIN_FONT_SIZE, font_size * 0.95)
+
+    # 최종 크기 증가 (소문자가 많으면 증가율 감소)
+    if lowercase_ratio > 0.6:
+        size_multiplier = 1.1
+    elif lowercase_ratio > 0.4:
+        size_multiplier = 1.15
+    else:
+        size_multiplier = 1.2
+    font_size = min(MAX_FONT_SIZE, int(font_size * size_multiplier))
+
+    return {
+        "font_size": font_size,
+        "gap": 40 + BASE_FONT_SIZE - font_size,  # 두 줄 사이 간격
+        "top_margin": 14 + BASE_FONT_SIZE - font_size,  # 상단 여백
+    }
+
+
+def attach_layout(item: ItemRecord) -> ItemRecord:
+    """항목에 레이아웃 힌트(layout)를 붙여 반환합니다. 이미 있으면 다시 계산하지 않습니다."""
+    if item.layout is None:
+        item.layout = compute_text_layout(item.text or "")
+    return item
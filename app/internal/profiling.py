@@ -0,0 +1,175 @@
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# --- 이벤트 루프 지연 측정 ---
+# 루프 안의 하트비트 태스크가 주기적으로 시각을 기록하고, 별도 스레드(워치독)가
+# 하트비트가 임계값 이상 멈추면 그 순간 루프 스레드의 스택을 잡아 기록합니다.
+# (루프가 막혀 있는 동안에는 루프 안의 코드가 실행되지 않으므로 스택은 스레드에서 잡아야 함)
+LOOP_THREAD_ID: Optional[int] = None
+LAST_HEARTBEAT: float = 0.0
+LOOP_LAG_STATS = {"samples": 0, "total_ms": 0.0, "max_ms": 0.0, "over_threshold": 0}
+LAG_EVENTS = []  # 최근 임계값 초과 기록 (lag_ms, 시각, 스택)
+MAX_LAG_EVENTS = 20
+WATCHDOG_STOP = threading.Event()
+
+# --- 라우트별 처리 시간 ---
+ROUTE_TIMINGS: Dict[str, Dict[str, float]] = {}
+
+# 동시에 하나의 cProfile 캡처만 허용 (여러 프로파일러를 동시에 켤 수 없음)
+PROFILE_LOCK = asyncio.Lock()
+
+
+def _record_lag_event(lag_ms: float, stack: str):
+    LAG_EVENTS.append({"lag_ms": round(lag_ms, 1), "at": time.time(), "stack": stack})
+    if len(LAG_EVENTS) > MAX_LAG_EVENTS:
+        del LAG_EVENTS[0]
+
+
+async def loop_heartbeat():
+    """
+    일정 간격으로 잠들었다 깨어나며 예정보다 얼마나 늦게 깨어났는지(루프 지연)를 기록합니다.
+    지연은 동기 로깅, json.dumps, 템플릿 렌더링 등으로 루프가 막힌 시간을 나타냅니다.
+    """
+    global LOOP_THREAD_ID, LAST_HEARTBEAT
+    LOOP_THREAD_ID = threading.get_ident()
+    interval = settings.LOOP_LAG_CHECK_INTERVAL_SECONDS
+    loop = asyncio.get_running_loop()
+
+    while True:
+        expected = loop.time() + interval
+        LAST_HEARTBEAT = time.monotonic()
+        try:
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            logger.info("Loop heartbeat cancelled.")
+            break
+
+        lag_ms = max(0.0, (loop.time() - expected) * 1000)
+        LOOP_LAG_STATS["samples"] += 1
+        LOOP_LAG_STATS["total_ms"] += lag_ms
+        LOOP_LAG_STATS["max_ms"] = max(LOOP_LAG_STATS["max_ms"], lag_ms)
+        if lag_ms >= settings.LOOP_LAG_THRESHOLD_MS:
+            LOOP_LAG_STATS["over_threshold"] += 1
+            logger.warning(f"Event loop lag {lag_ms:.1f}ms (threshold {settings.LOOP_LAG_THRESHOLD_MS}ms)")
+
+
+def _watchdog_thread():
+    """하트비트가 임계값 이상 멈춘 경우 루프 스레드의 현재 스택을 기록합니다."""
+    threshold = settings.LOOP_LAG_THRESHOLD_MS / 1000
+    # 한 번 막힌 동안 스택을 한 번만 기록하기 위해 마지막으로 기록한 하트비트를 기억
+    reported_heartbeat = None
+
+    while not WATCHDOG_STOP.wait(threshold / 2):
+        if LOOP_THREAD_ID is None or not LAST_HEARTBEAT:
+            continue
+        heartbeat = LAST_HEARTBEAT
+        stalled = time.monotonic() - heartbeat - settings.LOOP_LAG_CHECK_INTERVAL_SECONDS
+        if stalled < threshold or heartbeat == reported_heartbeat:
+            continue
+
+        frame = sys._current_frames().get(LOOP_THREAD_ID)
+        if frame is None:
+            continue
+        stack = "".join(traceback.format_stack(frame))
+        reported_heartbeat = heartbeat
+        _record_lag_event(stalled * 1000, stack)
+        logger.warning(f"Event loop blocked for {stalled * 1000:.1f}ms. Loop thread stack:\n{stack}")
+
+
+def start_loop_watchdog() -> asyncio.Task:
+    """루프 지연 하트비트 태스크와 워치독 스레드를 시작합니다. (실행 중인 루프 안에서 호출)"""
+    WATCHDOG_STOP.clear()
+    thread = threading.Thread(target=_watchdog_thread, name="loop-lag-watchdog", daemon=True)
+    thread.start()
+    logger.info(f"Loop lag watchdog started (threshold {settings.LOOP_LAG_THRESHOLD_MS}ms).")
+    return asyncio.create_task(loop_heartbeat())
+
+
+def stop_loop_watchdog():
+    """워치독 스레드를 종료합니다. (하트비트 태스크는 호출한 쪽에서 취소)"""
+    WATCHDOG_STOP.set()
+
+
+def get_loop_lag_snapshot() -> dict:
+    """루프 지연 통계와 최근 임계값 초과 기록을 반환합니다."""
+    samples = LOOP_LAG_STATS["samples"]
+    return {
+        "samples": samples,
+        "avg_ms": round(LOOP_LAG_STATS["total_ms"] / samples, 2) if samples else 0.0,
+        "max_ms": round(LOOP_LAG_STATS["max_ms"], 2),
+        "over_threshold": LOOP_LAG_STATS["over_threshold"],
+        "threshold_ms": settings.LOOP_LAG_THRESHOLD_MS,
+        "recent_stalls": list(LAG_EVENTS),
+    }
+
+
+def record_route_timing(route_key: str, elapsed_ms: float):
+    """라우트별 호출 수, 누적/최대 처리 시간을 기록합니다."""
+    stats = ROUTE_TIMINGS.get(route_key)
+    if stats is None:
+        stats = ROUTE_TIMINGS[route_key] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+    stats["count"] += 1
+    stats["total_ms"] += elapsed_ms
+    stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+async def route_timing_middleware(request, call_next):
+    """
+    요청마다 처리 시간을 라우트 경로 템플릿(/monitor/{monitor_id} 등) 단위로 기록합니다.
+    스트리밍 응답은 헤더를 보내기까지의 시간만 측정됩니다.
+    """
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # 경로 템플릿으로 묶어야 모니터 번호마다 항목이 따로 생기지 않음
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or "<unmatched>"
+    record_route_timing(f"{request.method} {path}", elapsed_ms)
+    return response
+
+
+def get_route_timings_snapshot() -> dict:
+    """라우트별 처리 시간 통계를 평균 처리 시간 순으로 반환합니다."""
+    snapshot = {
+        key: {
+            "count": int(stats["count"]),
+            "avg_ms": round(stats["total_ms"] / stats["count"], 2),
+            "max_ms": round(stats["max_ms"], 2),
+        }
+        for key, stats in ROUTE_TIMINGS.items()
+    }
+    return dict(sorted(snapshot.items(), key=lambda kv: kv[1]["avg_ms"], reverse=True))
+
+
+async def capture_profile(seconds: float, sort_by: str = "cumulative", limit: int = 40) -> str:
+    """
+    지정한 시간 동안 이벤트 루프 스레드에서 cProfile 을 켜고 결과 보고서를 문자열로 반환합니다.
+    이 코루틴이 잠든 동안 루프에서 실행되는 모든 요청/워커 코드가 측정됩니다.
+    """
+    if PROFILE_LOCK.locked():
+        raise RuntimeError("A profile capture is already running.")
+
+    async with PROFILE_LOCK:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats(sort_by).print_stats(limit)
+    return output.getvalue()
@@ -0,0 +1,306 @@
+import asyncio
+import html
+import logging
+import random
+import time
+from collections import deque
+from typing import Dict, Optional
+import httpx
+from ..core.config import settings
+from .layout import compute_text_layout
+from .records import ItemRecord
+from ..routers import monitors
+
+logger = logging.getLogger(__name__)
+
+# 모든 엔드포인트가 함께 쓰는 keep-alive HTTP 클라이언트 (항목마다 연결을 새로 만들지 않음)
+PUSH_CLIENT: Optional[httpx.AsyncClient] = None
+# 엔드포인트(URL)별 전송 대기열과 그 대기열을 순서대로 보내는 작업 (엔드포인트마다 하나)
+# 재시도 대기 중에도 다음 작업을 시작하지 않으므로 같은 모니터로 가는 항목은 대기열에 들어간 순서대로 도착함
+ENDPOINT_QUEUES: Dict[str, asyncio.Queue] = {}
+ENDPOINT_WORKERS: Dict[str, asyncio.Task] = {}
+# 지금 전송 중(재시도 대기 포함)인 엔드포인트
+SENDING = set()
+# 모든 엔드포인트를 합한 동시 요청 수 상한 (공유 연결 풀 크기와 같음)
+DISPATCH_SLOTS: Optional[asyncio.Semaphore] = None
+# 모니터별 전송 통계
+DELIVERY_STATS: Dict[str, dict] = {}
+# 모니터별 마지막 전송 순번 (X-Push-Seq, 받는 쪽이 늦게 도착한 이전 항목을 버릴 수 있도록) 과 마지막으로 보낸 항목 no
+PUSH_SEQUENCES: Dict[str, int] = {}
+LAST_PUSHED_ITEMS: Dict[str, int] = {}
+# 푸시 모니터의 표시 순서를 진행시키는 스케줄러 작업
+SCHEDULER_TASK: Optional[asyncio.Task] = None
+# 지연 시간 통계에 보관할 최근 전송 수 (모니터별)
+LATENCY_SAMPLES = 500
+# 재시도할 HTTP 상태 코드 (그 외 4xx 는 다시 보내도 같으므로 바로 실패 처리)
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class PushJob:
+    """모니터 하나로 보낼 항목 하나의 전송 작업"""
+    __slots__ = ("monitor_key", "url", "seq", "item_no", "body", "enqueued_at")
+
+    def __init__(self, monitor_key: str, url: str, seq: int, item_no: int, body: str):
+        self.monitor_key = monitor_key
+        self.url = url
+        self.seq = seq
+        self.item_no = item_no
+        self.body = body
+        self.enqueued_at = time.monotonic()
+
+
+def render_item_html(item: ItemRecord) -> str:
+    """항목을 display.html 과 같은 구조의 HTML 조각으로 렌더링합니다 (글자 크기는 서버 레이아웃 계산 사용)."""
+    font_size = compute_text_layout(item.text or "")["font_size"]
+    text = html.escape(item.text or "")
+    line = f"""
+            <div class="text-item">
+                <h2 style="font-size: {font_size}px;">
+                    {text}'s
+                </h2>
+            </div>"""
+    return f"""<div class="text-row" data-no="{item.no}">{line}{line}
+        </div>"""
+
+
+def _stats(monitor_key: str) -> dict:
+    return DELIVERY_STATS.setdefault(monitor_key, {
+        "delivered": 0,
+        "failed": 0,
+        "retries": 0,
+        "dropped": 0,
+        "superseded": 0,  # 보내기 전에 같은 모니터의 새 항목이 대기열에 들어와 건너뛴 전송
+        "request_latencies": deque(maxlen=LATENCY_SAMPLES),   # 성공한 POST 한 번의 응답 시간
+        "delivery_latencies": deque(maxlen=LATENCY_SAMPLES),  # 대기열에 들어간 뒤 전송 완료까지의 시간 (재시도 포함)
+    })
+
+
+def enqueue_item_delivery(monitor_key: str, item: ItemRecord) -> bool:
+    """
+    표시 차례가 된 항목을 모니터의 푸시 URL 대기열에 넣습니다.
+    같은 모니터로 아직 보내지 못한 이전 항목은 이 항목으로 대체되어 보내지 않습니다.
+    URL이 설정되지 않은 모니터(SSE로 받는 모니터)는 건너뛰며, 대기열이 가득 차면 버리고 False 를 반환합니다.
+    """
+    url = settings.PUSH_MONITOR_URLS.get(monitor_key)
+    queue = ENDPOINT_QUEUES.get(url)
+    if queue is None:
+        return False
+    try:
+        seq = PUSH_SEQUENCES.get(monitor_key, 0) + 1
+        queue.put_nowait(PushJob(monitor_key, url, seq, item.no, render_item_html(item)))
+        PUSH_SEQUENCES[monitor_key] = seq
+        return True
+    except asyncio.QueueFull:
+        _stats(monitor_key)["dropped"] += 1
+        logger.warning(f"Push queue full, dropping item {item.no} for monitor {monitor_key}")
+        return False
+
+
+def _is_superseded(job: PushJob) -> bool:
+    """같은 모니터로 보낼 더 새로운 항목이 대기열에 들어왔는지 반환합니다."""
+    return PUSH_SEQUENCES.get(job.monitor_key, 0) > job.seq
+
+
+async def _post_with_retries(job: PushJob):
+    """
+    POST 하고, 실패하면 지수 대기 + 지터로 재시도합니다.
+    엔드포인트 작업 안에서 실행되므로 재시도 대기 중에도 같은 엔드포인트의 다음 작업은 시작되지 않으며,
+    그사이 같은 모니터의 새 항목이 들어오면 이전 항목은 더 보내지 않습니다.
+    """
+    stats = _stats(job.monitor_key)
+
+    for attempt in range(settings.PUSH_MAX_RETRIES + 1):
+        if attempt:
+            # 전체 지터: 0 ~ base * 2^(attempt-1) 사이에서 무작위로 대기해 재시도가 한꺼번에 몰리지 않게 함
+            await asyncio.sleep(random.uniform(0, settings.PUSH_RETRY_BASE_SECONDS * (2 ** (attempt - 1))))
+            if _is_superseded(job):
+                stats["superseded"] += 1
+                logger.info(f"Stopped retrying item {job.item_no} for monitor {job.monitor_key}: a newer item is queued")
+                return
+            stats["retries"] += 1
+
+        error = None
+        async with DISPATCH_SLOTS:
+            started = time.monotonic()
+            try:
+                response = await PUSH_CLIENT.post(
+                    job.url,
+                    content=job.body,
+                    headers={"Content-Type": "text/html; charset=utf-8", "X-Item-No": str(job.item_no), "X-Push-Seq": str(job.seq)},
+                )
+                if response.is_success:
+                    finished = time.monotonic()
+                    stats["delivered"] += 1
+                    stats["request_latencies"].append(finished - started)
+                    stats["delivery_latencies"].append(finished - job.enqueued_at)
+                    return
+                error = f"HTTP {response.status_code}"
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    break
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+            except Exception as e:
+                # 잘못된 URL 등 다시 보내도 같은 오류는 재시도하지 않음 (작업 안에서 예외가 사라지지 않도록 기록)
+                logger.exception(f"Unexpected error pushing item {job.item_no} to monitor {job.monitor_key}: {e}")
+                break
+
+        logger.warning(f"Push to monitor {job.monitor_key} failed (item {job.item_no}, attempt {attempt + 1}): {error}")
+
+    stats["failed"] += 1
+    logger.error(f"Giving up pushing item {job.item_no} to monitor {job.monitor_key}")
+
+
+async def endpoint_worker(url: str, queue: asyncio.Queue):
+    """
+    엔드포인트 하나의 대기열에서 작업을 하나씩 꺼내 보냅니다 (재시도가 끝나야 다음 작업 시작).
+    보내기 전에 같은 모니터의 새 항목이 들어온 작업은 건너뜁니다.
+    """
+    while True:
+        job = await queue.get()
+        if _is_superseded(job):
+            _stats(job.monitor_key)["superseded"] += 1
+            continue
+        SENDING.add(url)
+        try:
+            await _post_with_retries(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"An error occurred pushing to endpoint {url}: {e}")
+        finally:
+            SENDING.discard(url)
+
+
+async def push_dispatcher():
+    """
+    엔드포인트마다 순서대로 보내는 작업을 하나씩 실행합니다.
+    한 모니터가 느려도 그 엔드포인트의 작업만 기다리므로 다른 모니터로의 전송은 막히지 않습니다.
+    """
+    logger.info(f"Push dispatcher started for {len(ENDPOINT_QUEUES)} monitor endpoint(s).")
+    for url, queue in ENDPOINT_QUEUES.items():
+        ENDPOINT_WORKERS[url] = asyncio.create_task(endpoint_worker(url, queue))
+    try:
+        await asyncio.gather(*ENDPOINT_WORKERS.values())
+    except asyncio.CancelledError:
+        logger.info("Push dispatcher cancelled.")
+    finally:
+        await _cancel_endpoint_workers()
+
+
+async def push_display_scheduler():
+    """
+    푸시 모니터의 표시 순서를 SSE 모니터와 같은 스케줄(build_monitor_frame)로 진행시키고,
+    현재 표시 항목이 바뀔 때만 그 항목을 전송 대기열에 넣습니다.
+    항목은 할당 시점이 아니라 표시 차례가 되었을 때 하나씩 전송되므로 표시 시간이 그대로 지켜집니다.
+    """
+    monitor_keys = []
+    for monitor_key in settings.PUSH_MONITOR_URLS:
+        event_name, _, monitor_id = monitor_key.rpartition("/")
+        event = settings.EVENTS.get(event_name or settings.DEFAULT_EVENT_NAME)
+        if event is None or not monitor_id.isdigit() or not 1 <= int(monitor_id) <= event.monitor_count:
+            logger.warning(f"Ignoring push URL for unknown monitor key '{monitor_key}'")
+            continue
+        # 상태 키 등록 (get_monitor_ref 로 이벤트와 모니터 ID를 찾을 수 있도록)
+        monitor_keys.append(monitors.get_monitor_key(event, int(monitor_id)))
+
+    while True:
+        try:
+            for monitor_key in monitor_keys:
+                try:
+                    if monitor_key not in monitors.MONITOR_QUEUES:
+                        await monitors.update_monitor_queue(monitor_key)
+                    monitors.NO_ITEMS_LOG_COUNTERS.setdefault(monitor_key, 0)
+
+                    await monitors.build_monitor_frame(monitor_key)
+                    current_item = monitors.CURRENT_ITEMS.get(monitor_key)
+                    if current_item and LAST_PUSHED_ITEMS.get(monitor_key) != current_item.no:
+                        LAST_PUSHED_ITEMS[monitor_key] = current_item.no
+                        enqueue_item_delivery(monitor_key, current_item)
+                except Exception as e:
+                    logger.error(f"Error scheduling push display for monitor {monitor_key}: {e}")
+        except asyncio.CancelledError:
+            logger.info("Push display scheduler cancelled.")
+            break
+
+        await asyncio.sleep(monitors.SSE_UPDATE_INTERVAL)
+
+
+async def _cancel_endpoint_workers():
+    workers = list(ENDPOINT_WORKERS.values())
+    ENDPOINT_WORKERS.clear()
+    for task in workers:
+        task.cancel()
+    if workers:
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def start_push_dispatcher(transport: Optional[httpx.AsyncBaseTransport] = None) -> asyncio.Task:
+    """
+    공유 HTTP 클라이언트와 엔드포인트별 대기열을 만들고 표시 스케줄러와 디스패처 작업을 시작합니다.
+    transport 를 지정하면 네트워크 대신 사용합니다 (예: httpx.ASGITransport(app) 로 /mock_monitor_endpoint/ 확인).
+    """
+    global PUSH_CLIENT, DISPATCH_SLOTS, SCHEDULER_TASK
+    PUSH_CLIENT = httpx.AsyncClient(
+        transport=transport,
+        timeout=settings.PUSH_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=settings.PUSH_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.PUSH_MAX_CONNECTIONS,
+        ),
+    )
+    ENDPOINT_QUEUES.clear()
+    for url in settings.PUSH_MONITOR_URLS.values():
+        ENDPOINT_QUEUES.setdefault(url, asyncio.Queue(maxsize=settings.PUSH_QUEUE_SIZE))
+    DISPATCH_SLOTS = asyncio.Semaphore(settings.PUSH_MAX_CONNECTIONS)
+    SCHEDULER_TASK = asyncio.create_task(push_display_scheduler())
+    return asyncio.create_task(push_dispatcher())
+
+
+async def stop_push_dispatcher():
+    """표시 스케줄러와 엔드포인트별 전송 작업을 취소하고 HTTP 클라이언트를 닫습니다."""
+    global PUSH_CLIENT, SCHEDULER_TASK
+    if SCHEDULER_TASK:
+        SCHEDULER_TASK.cancel()
+        await asyncio.gather(SCHEDULER_TASK, return_exceptions=True)
+        SCHEDULER_TASK = None
+    await _cancel_endpoint_workers()
+    if PUSH_CLIENT:
+        await PUSH_CLIENT.aclose()
+        PUSH_CLIENT = None
+    ENDPOINT_QUEUES.clear()
+    SENDING.clear()
+
+
+def _percentile(samples, ratio: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] * 1000, 1)
+
+
+def get_push_stats_snapshot() -> dict:
+    """모니터별 전송 수, 실패/재시도/대체 수, 지연 시간(ms, p50/p95/max)을 반환합니다."""
+    return {
+        "queued": sum(queue.qsize() for queue in ENDPOINT_QUEUES.values()),
+        "sending_endpoints": len(SENDING),
+        "monitors": {
+            monitor_key: {
+                "delivered": stats["delivered"],
+                "failed": stats["failed"],
+                "retries": stats["retries"],
+                "dropped": stats["dropped"],
+                "superseded": stats["superseded"],
+                "request_ms": {
+                    "p50": _percentile(stats["request_latencies"], 0.5),
+                    "p95": _percentile(stats["request_latencies"], 0.95),
+                    "max": _percentile(stats["request_latencies"], 1.0),
+                },
+                "delivery_ms": {
+                    "p50": _percentile(stats["delivery_latencies"], 0.5),
+                    "p95": _percentile(stats["delivery_latencies"], 0.95),
+                    "max": _percentile(stats["delivery_latencies"], 1.0),
+                },
+            }
+            for monitor_key, stats in DELIVERY_STATS.items()
+        },
+    }
@@ -0,0 +1,62 @@
+import datetime
+from typing import Optional
+
+
+def format_datetime(value: Optional[datetime.datetime]) -> Optional[str]:
+    """datetime 을 기존 응답과 같은 형식(str(datetime))의 문자열로 변환합니다."""
+    return value.isoformat(sep=' ') if value is not None else None
+
+
+class ItemRecord:
+    """
+    항목 테이블의 한 행.
+    DictCursor 의 dict 대신 튜플 커서 결과로 만들어 모니터 큐 등에 오래 보관할 때
+    행마다 반복되는 키 문자열과 dict 오버헤드를 줄입니다.
+    """
+    __slots__ = ("no", "text", "update_time", "get_time", "adr", "state", "layout")
+
+    # 항목 조회 쿼리의 SELECT 목록 (database.py 의 쿼리가 이 값으로 만들어지므로 from_row 의 인자 순서와 항상 일치)
+    COLUMNS = "no, text, update_time, get_time, adr, state"
+
+    def __init__(self, no: int, text: str, update_time: Optional[datetime.datetime] = None,
+                 get_time: Optional[datetime.datetime] = None, adr: Optional[str] = None, state: int = 0):
+        self.no = no
+        self.text = text
+        self.update_time = update_time
+        self.get_time = get_time
+        self.adr = adr
+        self.state = state
+        self.layout: Optional[dict] = None  # 표시용 레이아웃 힌트 (모니터 큐에 들어갈 때 설정)
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "ItemRecord":
+        """COLUMNS 순서로 조회한 튜플 행으로 레코드를 만듭니다."""
+        return cls(*row)
+
+    def to_dict(self) -> dict:
+        """API 응답용 dict (datetime 은 그대로 두어 FastAPI 가 직렬화)"""
+        return {
+            "no": self.no,
+            "text": self.text,
+            "update_time": self.update_time,
+            "get_time": self.get_time,
+            "adr": self.adr,
+            "state": self.state,
+        }
+
+    def to_json_dict(self) -> dict:
+        """SSE 프레임용 dict (datetime 을 직접 문자열로 변환해 json.dumps 의 default 호출을 피함)"""
+        data = {
+            "no": self.no,
+            "text": self.text,
+            "update_time": format_datetime(self.update_time),
+            "get_time": format_datetime(self.get_time),
+            "adr": self.adr,
+            "state": self.state,
+        }
+        if self.layout is not None:
+            data["layout"] = self.layout
+        return data
+
+    def __repr__(self) -> str:
+        return f"ItemRecord(no={self.no!r}, adr={self.adr!r}, state={self.state!r})"
@@ -0,0 +1,353 @@
+"""
+모니터 표시 스케줄러 시뮬레이터 (용량 산정용)
+
+실제 워커 할당 로직(assign_event_items)과 모니터 표시 로직(build_monitor_frame)을
+가상 시계와 메모리 항목 저장소 위에서 실행하여, 도착 기록(trace)을 몇 초 만에 재생하고
+모니터별 대기 항목(backlog) 증가와 대기 시간 분포를 보고합니다.
+
+사용 예:
+    # 시간당 300건, 2시간 동안 무작위 도착 (모니터 3대)
+    python -m app.internal.simulator --rate 300 --hours 2 --monitors 3
+
+    # DB에서 내보낸 도착 기록 재생 (CSV: update_time[,text])
+    python -m app.internal.simulator --trace arrivals.csv --drain
+"""
+import argparse
+import asyncio
+import csv
+import dataclasses
+import datetime
+import json
+import logging
+import random
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from ..core.config import settings, EventSettings
+from . import clock, worker
+from .clock import VirtualClock
+from .records import ItemRecord
+from ..routers import monitors
+
+logger = logging.getLogger(__name__)
+
+# 가상 시계 시작 시각 (도착 기록의 첫 시각이 여기에 맞춰짐)
+SIMULATION_START = datetime.datetime(2024, 1, 1, 9, 0, 0)
+# 백로그 추이를 기록하는 간격(초)
+BACKLOG_SAMPLE_INTERVAL = 300
+# --drain 사용 시 도착이 끝난 뒤 최대로 더 진행할 시간(초)
+MAX_DRAIN_SECONDS = 24 * 3600
+
+
+class InMemoryItemStore:
+    """
+    DB 항목 테이블을 흉내 내는 메모리 저장소.
+    워커/모니터 모듈이 사용하는 DB 함수와 같은 시그니처로 조회/갱신을 제공합니다.
+    """
+
+    def __init__(self, sim_clock: VirtualClock):
+        self.clock = sim_clock
+        self.items: Dict[int, ItemRecord] = {}
+        self.pending: List[int] = []  # state=0 항목 번호 (도착 순)
+        self.assigned: Dict[str, List[int]] = {}  # 모니터별 할당 항목 번호 (할당 순)
+        self.assigned_start: Dict[str, int] = {}  # 모니터별 이미 표시된 앞부분을 건너뛰기 위한 위치
+        self.next_no = 1
+
+    def insert(self, text: str) -> int:
+        no = self.next_no
+        self.next_no += 1
+        self.items[no] = ItemRecord(no, text, update_time=self.clock.now())
+        self.pending.append(no)
+        return no
+
+    async def get_items_to_process(self, threshold_time: datetime.datetime, event: Optional[EventSettings] = None):
+        """state=0 이고 update_time 이 임계값보다 오래된 항목을 처리 중(state=-1)으로 가져갑니다."""
+        claimed = []
+        while self.pending and self.items[self.pending[0]].update_time < threshold_time:
+            item = self.items[self.pending.pop(0)]
+            item.state = -1
+            claimed.append(self._copy(item))
+        return claimed
+
+    async def mark_item_processed_and_assign_monitor(self, item_no: int, assigned_monitor_id: str, event: Optional[EventSettings] = None):
+        """항목을 모니터에 할당(state=1)합니다."""
+        item = self.items.get(item_no)
+        if item is None or item.state == 1:
+            return False
+        item.state, item.adr, item.get_time = 1, assigned_monitor_id, self.clock.now()
+        self.assigned.setdefault(assigned_monitor_id, []).append(item_no)
+        # 변경 피드 tailer 역할 (CHANGEFEED_ENABLED 일 때 모니터가 큐를 다시 읽도록 표시)
+        if event is not None:
+            monitors.mark_monitor_stale(event, assigned_monitor_id)
+        return True
+
+    async def get_new_items_for_monitor(self, monitor_id: str, last_displayed_item_no: int = 0, limit: int = 10, should_log: bool = False, event: Optional[EventSettings] = None):
+        """모니터에 할당된 항목 중 마지막 표시 항목 이후의 항목을 할당 순으로 반환합니다."""
+        assigned = self.assigned.get(monitor_id, [])
+        start = self.assigned_start.get(monitor_id, 0)
+        # 시뮬레이션에서는 항목이 번호 순으로 할당되므로 이미 표시된 앞부분은 다시 볼 필요가 없음
+        while start < len(assigned) and assigned[start] <= last_displayed_item_no:
+            start += 1
+        self.assigned_start[monitor_id] = start
+        return [self._copy(self.items[no]) for no in assigned[start:start + limit] if no > last_displayed_item_no]
+
+    @staticmethod
+    def _copy(item: ItemRecord) -> ItemRecord:
+        """DB 조회처럼 매번 새 레코드를 반환합니다."""
+        return ItemRecord(item.no, item.text, item.update_time, item.get_time, item.adr, item.state)
+
+
+@contextmanager
+def simulated_environment(store: InMemoryItemStore, sim_clock: VirtualClock):
+    """워커/모니터 모듈의 DB 함수와 시계를 시뮬레이션용으로 교체하고, 끝나면 되돌립니다."""
+    replaced = [
+        (worker, "get_items_to_process", store.get_items_to_process),
+        (worker, "mark_item_processed_and_assign_monitor", store.mark_item_processed_and_assign_monitor),
+        (monitors, "get_new_items_for_monitor", store.get_new_items_for_monitor),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _ in replaced]
+    original_clock = clock.CLOCK
+    for module, name, replacement in replaced:
+        setattr(module, name, replacement)
+    clock.set_clock(sim_clock)
+    try:
+        yield
+    finally:
+        for module, name, original in originals:
+            setattr(module, name, original)
+        clock.set_clock(original_clock)
+
+
+def reset_monitor_state():
+    """모니터 모듈의 전역 상태를 비웁니다."""
+    for state in (monitors.MONITOR_QUEUES, monitors.CURRENT_ITEMS, monitors.DISPLAY_TIMES,
+                  monitors.LAST_DISPLAYED_ITEMS, monitors.LOG_COUNTERS, monitors.NO_ITEMS_LOG_COUNTERS,
+                  monitors.QUEUE_STALE):
+        state.clear()
+
+
+def load_trace(path: str) -> List[Tuple[float, str]]:
+    """
+    도착 기록 CSV 를 읽어 (시작 기준 초, 텍스트) 목록을 반환합니다.
+    첫 번째 열은 경과 초(숫자) 또는 update_time 시각이고, 두 번째 열(선택)은 텍스트입니다.
+    """
+    arrivals = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip():
+                continue
+            value = row[0].strip()
+            text = row[1] if len(row) > 1 else f"guest{len(arrivals) + 1}"
+            try:
+                arrivals.append((float(value), text))
+            except ValueError:
+                try:
+                    arrivals.append((datetime.datetime.fromisoformat(value).timestamp(), text))
+                except ValueError:
+                    continue  # 헤더 등 해석할 수 없는 행은 건너뜀
+    arrivals.sort(key=lambda arrival: arrival[0])
+    if arrivals:
+        first = arrivals[0][0]
+        arrivals = [(offset - first, text) for offset, text in arrivals]
+    return arrivals
+
+
+def synthetic_trace(rate_per_hour: float, hours: float, seed: Optional[int] = None) -> List[Tuple[float, str]]:
+    """시간당 rate_per_hour 건의 포아송 도착 기록을 만듭니다."""
+    rng = random.Random(seed)
+    arrivals = []
+    offset = 0.0
+    duration = hours * 3600
+    while True:
+        offset += rng.expovariate(rate_per_hour / 3600)
+        if offset >= duration:
+            break
+        arrivals.append((offset, f"guest{len(arrivals) + 1}"))
+    return arrivals
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _wait_summary(waits: List[float]) -> dict:
+    """대기 시간(초) 목록을 분 단위 분포로 요약합니다."""
+    waits = sorted(waits)
+    return {
+        "count": len(waits),
+        "p50_min": round(_percentile(waits, 50) / 60, 2),
+        "p90_min": round(_percentile(waits, 90) / 60, 2),
+        "p99_min": round(_percentile(waits, 99) / 60, 2),
+        "max_min": round(waits[-1] / 60, 2) if waits else 0.0,
+    }
+
+
+async def run_simulation(event: EventSettings, arrivals: List[Tuple[float, str]], check_interval: float = None, drain: bool = False) -> dict:
+    """
+    도착 기록을 가상 시계로 재생합니다.
+    SSE 업데이트 간격마다 모든 모니터의 프레임을 만들고, check_interval 마다 워커 할당을 실행합니다.
+    """
+    check_interval = check_interval or settings.CHECK_INTERVAL_SECONDS
+    tick = monitors.SSE_UPDATE_INTERVAL
+    sim_clock = VirtualClock(SIMULATION_START.timestamp())
+    store = InMemoryItemStore(sim_clock)
+
+    monitor_keys = [monitors.get_monitor_key(event, monitor_id) for monitor_id in range(1, event.monitor_count + 1)]
+    event_state = {"monitor_index": 0, "recently_processed_items": OrderedDict()}
+
+    arrival_times: Dict[int, float] = {}
+    display_starts: Dict[int, float] = {}
+    waits: Dict[str, List[float]] = {adr: [] for adr in (str(i) for i in range(1, event.monitor_count + 1))}
+    backlog_samples = []
+    max_backlog: Dict[str, int] = {adr: 0 for adr in waits}
+
+    trace_end = arrivals[-1][0] if arrivals else 0.0
+    end_offset = trace_end + (MAX_DRAIN_SECONDS if drain else 0)
+    next_arrival = 0
+    next_check = 0.0
+    check_count = 0
+    elapsed = 0.0
+
+    reset_monitor_state()
+    with simulated_environment(store, sim_clock):
+        while elapsed <= end_offset:
+            # 이번 틱까지 도착한 항목 삽입
+            while next_arrival < len(arrivals) and arrivals[next_arrival][0] <= elapsed:
+                no = store.insert(arrivals[next_arrival][1])
+                arrival_times[no] = elapsed
+                next_arrival += 1
+
+            # 워커 할당 주기
+            if elapsed >= next_check:
+                check_count += 1
+                await worker.assign_event_items(event, event_state, sim_clock.now(), check_count)
+                next_check += check_interval
+
+            # 모니터별 표시 상태 진행 (각 모니터에 SSE 클라이언트 하나가 연결된 것과 같음)
+            for key in monitor_keys:
+                frame = await monitors.build_monitor_frame(key)
+                item = frame["item"]
+                if item and item["no"] not in display_starts:
+                    display_starts[item["no"]] = elapsed
+                    waits[item["adr"]].append(elapsed - arrival_times[item["no"]])
+
+            # 모니터별 백로그 (할당되었지만 아직 표시되지 않은 항목 수)
+            backlog = {adr: len(store.assigned.get(adr, [])) - len(waits[adr]) for adr in waits}
+            for adr, count in backlog.items():
+                max_backlog[adr] = max(max_backlog[adr], count)
+            if elapsed % BACKLOG_SAMPLE_INTERVAL < tick:
+                backlog_samples.append({
+                    "minute": round(elapsed / 60, 1),
+                    "pending": len(store.pending),
+                    "backlog": backlog,
+                })
+
+            # 도착이 끝나고 모든 항목이 표시되면 종료
+            if drain and elapsed >= trace_end and len(display_starts) == len(arrival_times):
+                break
+
+            elapsed += tick
+            sim_clock.advance(tick)
+
+    all_waits = [wait for monitor_waits in waits.values() for wait in monitor_waits]
+    return {
+        "event": event.name,
+        "monitor_count": event.monitor_count,
+        "item_display_duration": (
+            f"{event.min_item_display_duration}~{event.max_item_display_duration}" if event.adaptive_display
+            else event.item_display_duration
+        ),
+        "old_data_threshold_minutes": event.old_data_threshold_minutes,
+        "check_interval_seconds": check_interval,
+        "simulated_minutes": round(elapsed / 60, 1),
+        "arrivals": len(arrival_times),
+        "displayed": len(display_starts),
+        "undisplayed": len(arrival_times) - len(display_starts),
+        "displayed_per_hour": round(len(display_starts) / (elapsed / 3600), 1) if elapsed else 0.0,
+        "wait": _wait_summary(all_waits),
+        "monitors": {
+            adr: {**_wait_summary(monitor_waits), "max_backlog": max_backlog[adr]}
+            for adr, monitor_waits in waits.items()
+        },
+        "backlog_samples": backlog_samples,
+    }
+
+
+def print_report(report: dict):
+    """시뮬레이션 결과를 표 형태로 출력합니다."""
+    print(f"=== 시뮬레이션 결과 (이벤트 '{report['event']}') ===")
+    print(f"모니터 {report['monitor_count']}대, 표시 {report['item_display_duration']}초, "
+          f"임계값 {report['old_data_threshold_minutes']}분, 체크 간격 {report['check_interval_seconds']}초")
+    print(f"가상 시간 {report['simulated_minutes']}분: 도착 {report['arrivals']}건, 표시 {report['displayed']}건 "
+          f"(미표시 {report['undisplayed']}건, 시간당 {report['displayed_per_hour']}건 표시)")
+    wait = report["wait"]
+    print(f"전체 대기 시간(분): p50 {wait['p50_min']}, p90 {wait['p90_min']}, p99 {wait['p99_min']}, max {wait['max_min']}")
+    print()
+    print(f"{'모니터':>6} {'표시':>6} {'p50':>7} {'p90':>7} {'p99':>7} {'max':>7} {'최대대기':>8}")
+    for adr, stats in report["monitors"].items():
+        print(f"{adr:>6} {stats['count']:>6} {stats['p50_min']:>7} {stats['p90_min']:>7} "
+              f"{stats['p99_min']:>7} {stats['max_min']:>7} {stats['max_backlog']:>8}")
+    print()
+    print("백로그 추이 (분: 미할당 / 모니터별 대기)")
+    for sample in report["backlog_samples"]:
+        per_monitor = ", ".join(f"{adr}:{count}" for adr, count in sample["backlog"].items())
+        print(f"{sample['minute']:>8}: {sample['pending']:>5} / {per_monitor}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="모니터 표시 스케줄러 시뮬레이터")
+    parser.add_argument("--trace", help="도착 기록 CSV (update_time 또는 경과 초[,text])")
+    parser.add_argument("--rate", type=float, default=300, help="무작위 도착: 시간당 건수 (기본 300)")
+    parser.add_argument("--hours", type=float, default=1, help="무작위 도착: 기간(시간, 기본 1)")
+    parser.add_argument("--seed", type=int, default=None, help="무작위 도착 시드")
+    parser.add_argument("--event", default=settings.DEFAULT_EVENT_NAME, help="설정을 가져올 이벤트 이름")
+    parser.add_argument("--monitors", type=int, help="모니터 수 (기본: 이벤트 설정)")
+    parser.add_argument("--display-duration", type=float, help="항목 표시 시간(초)")
+    parser.add_argument("--min-display-duration", type=float, help="적응형 표시 시간 최소값(초)")
+    parser.add_argument("--max-display-duration", type=float, help="적응형 표시 시간 최대값(초)")
+    parser.add_argument("--no-new-items-duration", type=float, help="새 항목이 없을 때 표시 시간(초)")
+    parser.add_argument("--threshold-minutes", type=float, help="할당 전 대기 임계값(분)")
+    parser.add_argument("--check-interval", type=float, help="워커 체크 간격(초)")
+    parser.add_argument("--drain", action="store_true", help="도착이 끝난 뒤 모든 항목이 표시될 때까지 진행")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    parser.add_argument("--verbose", action="store_true", help="워커/모니터 로그 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    event = settings.EVENTS.get(args.event)
+    if event is None:
+        parser.error(f"Unknown event '{args.event}'")
+    overrides = {
+        "monitor_count": args.monitors,
+        "item_display_duration": args.display_duration,
+        "min_item_display_duration": args.min_display_duration,
+        "max_item_display_duration": args.max_display_duration,
+        "no_new_items_display_duration": args.no_new_items_duration,
+        "old_data_threshold_minutes": args.threshold_minutes,
+    }
+    event = dataclasses.replace(event, **{key: value for key, value in overrides.items() if value is not None})
+    if args.display_duration is not None and not event.adaptive_display:
+        # 고정 표시 시간만 지정한 경우 범위도 같은 값으로 맞춤
+        event = dataclasses.replace(event, min_item_display_duration=event.item_display_duration,
+                                    max_item_display_duration=event.item_display_duration)
+    if event.monitor_count < 1:
+        parser.error("--monitors must be at least 1")
+    if not (0 < event.min_item_display_duration <= event.max_item_display_duration):
+        parser.error("display duration bounds must satisfy 0 < min <= max")
+
+    arrivals = load_trace(args.trace) if args.trace else synthetic_trace(args.rate, args.hours, args.seed)
+    report = asyncio.run(run_simulation(event, arrivals, args.check_interval, args.drain))
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
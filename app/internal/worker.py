@@ -1,36 +1,150 @@
 import asyncio
 import datetime
 import logging
+from collections import OrderedDict
 # DB 함수 임포트 변경: get_items_to_process와 mark_item_processed_and_assign_monitor 사용
-from ..database import get_items_to_process, mark_item_processed_and_assign_monitor
-from ..core.config import settings # settings 임포트
+from ..database import (
+    get_items_to_process,
+    mark_item_processed_and_assign_monitor,
+    try_acquire_worker_lock,
+    check_worker_lock,
+    release_worker_lock,
+    release_orphaned_claims,
+    get_last_assigned_monitor_id,
+)
+from ..core.config import settings, EventSettings # settings 임포트
+from .admission import background_db_slot
+from .clock import current_datetime
 
 logger = logging.getLogger(__name__)
 
+async def refresh_worker_leadership(is_leader: bool) -> bool:
+    """
+    DB 잠금으로 이 프로세스가 할당 워커의 리더인지 확인합니다.
+    리더이면 잠금이 유지되는지 확인하고, 아니면 잠금 획득을 시도합니다.
+    """
+    if is_leader:
+        if await check_worker_lock(settings.WORKER_LOCK_NAME):
+            return True
+        logger.warning(f"Worker leadership lost (lock '{settings.WORKER_LOCK_NAME}'). Standing by.")
+        return False
+
+    if await try_acquire_worker_lock(settings.WORKER_LOCK_NAME):
+        logger.info(f"Worker leadership acquired (lock '{settings.WORKER_LOCK_NAME}').")
+        return True
+    return False
+
+async def resume_assignment_state(event: EventSettings) -> int:
+    """
+    리더가 된 직후 이벤트별로 이전 리더의 상태를 이어받습니다.
+    처리 중으로 남은 항목을 되돌리고, 마지막으로 할당된 모니터 다음 순서의 인덱스를 반환합니다.
+    """
+    async with background_db_slot():
+        released_count = await release_orphaned_claims(event=event)
+    if released_count:
+        logger.info(f"[{event.name}] Released {released_count} orphaned claimed items (state=-1 -> 0)")
+
+    async with background_db_slot():
+        last_monitor_id = await get_last_assigned_monitor_id(event=event)
+    if last_monitor_id and str(last_monitor_id).isdigit():
+        # 모니터 ID는 1부터 시작하므로 ID 값이 곧 다음 모니터의 인덱스
+        return int(last_monitor_id) % event.monitor_count
+    return 0
+
+# 이미 처리한 항목 세트의 크기 제한 (메모리 사용 제한)
+MAX_RECENT_ITEMS = 1000
+
+async def assign_event_items(event: EventSettings, event_state: dict, now: datetime.datetime, check_count: int) -> int:
+    """
+    한 이벤트의 처리 대상 항목(state=0, 임계 시간 경과)을 조회하여 이벤트의 모니터들에 순환 할당합니다.
+    event_state 에는 이벤트별 monitor_index 와 recently_processed_items(처리 순서를 유지하는 OrderedDict)를 보관합니다.
+
+    Returns:
+        할당에 성공한 항목 수
+    """
+    num_monitors = event.monitor_count
+    recently_processed_items = event_state["recently_processed_items"]
+    threshold_time = now - datetime.timedelta(minutes=event.old_data_threshold_minutes)
+    processed_count = 0
+
+    # DB에서 처리할 항목 조회 (state=0, 5분 경과)
+    try:
+        async with background_db_slot():
+            items_to_process = await get_items_to_process(threshold_time, event=event)
+    except Exception as e:
+        logger.error(f"[{event.name}] Error fetching items to process: {e}")
+        items_to_process = []
+
+    if items_to_process:
+        logger.info(f"[{event.name}] Found {len(items_to_process)} items to process")
+    else:
+        # 30회 체크마다 한 번씩 로그 출력 (너무 많은 로그 방지)
+        if check_count % 30 == 0:
+            logger.info(f"[{event.name}] Worker check #{check_count}: No items found matching criteria (threshold_time: {threshold_time})")
+
+    # 조회된 각 항목에 대해 순환적으로 모니터 ID 할당 및 DB 업데이트
+    for item in items_to_process:
+        item_no = item.no
+        
+        # 이미 최근에 처리한 항목이면 건너뛰기
+        if item_no in recently_processed_items:
+            logger.info(f"[{event.name}] Skipping already processed item '{item_no}' (duplicate detection)")
+            continue
+        
+        item_update_time = item.update_time
+
+        # 다음 모니터 ID 선택 (순환)
+        # 모니터 ID는 1부터 시작한다고 가정
+        monitor_index = event_state["monitor_index"]
+        current_monitor_id = str((monitor_index % num_monitors) + 1)
+        event_state["monitor_index"] = (monitor_index + 1) % num_monitors # 다음 인덱스로 이동
+
+        logger.info(f"[{event.name}] Processing item '{item_no}' (update_time: {item_update_time}) and assigning to monitor {current_monitor_id}")
+
+        try:
+            # 데이터 처리 완료 및 모니터 ID 할당 상태로 DB 업데이트
+            async with background_db_slot():
+                success = await mark_item_processed_and_assign_monitor(item_no, current_monitor_id, event=event) # <--- DB 업데이트 함수 호출
+            
+            if not success:
+                logger.warning(f"[{event.name}] Item {item_no} could not be processed - skipping")
+                continue
+            
+            # 처리 성공 시 최근 처리 항목 목록에 추가
+            recently_processed_items[item_no] = None
+            # 크기 제한 (가장 오래 전에 처리한 항목부터 제거)
+            if len(recently_processed_items) > MAX_RECENT_ITEMS:
+                recently_processed_items.popitem(last=False)
+            
+            processed_count += 1
+            logger.info(f"✅ [{event.name}] Successfully assigned item '{item_no}' to monitor {current_monitor_id}")
+
+        except Exception as e:
+             logger.error(f"[{event.name}] An unexpected error occurred processing item '{item_no}' for monitor {current_monitor_id}: {e}")
+             # DB 업데이트 실패 시 state는 0으로 유지되어 다음 주기에서 다시 시도
+
+    return processed_count
+
 async def check_and_assign_data_worker(): # 함수 이름 변경 (전송 -> 할당)
     """
     주기적으로 DB를 확인하여 조건을 만족하는 데이터를 찾아 모니터에 할당하고 상태를 업데이트합니다.
+    설정된 모든 이벤트를 하나의 스케줄러 루프에서 차례로 처리합니다.
     """
-    logger.info(f"Background worker started (Assigning to Monitors). Checking every {settings.CHECK_INTERVAL_SECONDS} seconds.")
-
-    num_monitors = settings.MONITOR_COUNT
-    if num_monitors == 0:
-        logger.error("No monitor count configured. Background worker cannot assign data.")
-        return # 워커 실행 중지
+    logger.info(f"Background worker started (Assigning to Monitors). Checking every {settings.CHECK_INTERVAL_SECONDS} seconds for {len(settings.EVENTS)} event(s).")
 
-    # 모니터 순환을 위한 인덱스 (워커 실행마다 초기화)
-    # 여러 워커 인스턴스가 실행되지 않는다고 가정 (단일 프로세스)
-    monitor_index = 0
+    # 이벤트별 모니터 순환 인덱스와 최근 처리 항목 (워커 실행마다 초기화)
+    # 여러 프로세스가 실행되면 리더 잠금을 가진 하나만 할당하며, 리더가 되면 DB에서 순서를 이어받음
+    event_states = {
+        event.name: {"monitor_index": 0, "recently_processed_items": OrderedDict()}
+        for event in settings.EVENTS.values()
+    }
+    is_leader = not settings.WORKER_LEADER_LOCK_ENABLED
     
     # 워커 활동 추적을 위한 카운터 변수들
     check_count = 0
-    last_heartbeat_time = datetime.datetime.now()
+    last_heartbeat_time = current_datetime()
     total_items_processed = 0
     
-    # 이미 처리한 항목의 ID를 추적하기 위한 세트
-    recently_processed_items = set()
-    # 세트 크기 제한 (메모리 사용 제한)
-    MAX_RECENT_ITEMS = 1000
     # 하트비트 로그 간격 설정 (초)
     HEARTBEAT_INTERVAL = 300  # 5분마다 하트비트 로그 출력 (1분에서 5분으로 변경)
 
@@ -38,73 +152,36 @@ async def check_and_assign_data_worker(): # 함수 이름 변경 (전송 -> 할
         try:
             check_count += 1
             if settings.SERVER_TIMEZONE == "Asia/Seoul":
-                now = datetime.datetime.now()
+                now = current_datetime()
             else:
-                now = datetime.datetime.now() + datetime.timedelta(hours=9)
-            threshold_time = now - datetime.timedelta(minutes=settings.OLD_DATA_THRESHOLD_MINUTES)
+                now = current_datetime() + datetime.timedelta(hours=9)
 
             # 주기적으로 워커가 살아있음을 알리는 하트비트 로그 (5분마다)
             if (now - last_heartbeat_time).total_seconds() >= HEARTBEAT_INTERVAL:
-                logger.info(f"Worker heartbeat: Active for {check_count} checks, processed {total_items_processed} items so far {now}, threshold_time: {threshold_time}")
+                logger.info(f"Worker heartbeat: Active for {check_count} checks, processed {total_items_processed} items so far {now}")
                 last_heartbeat_time = now
 
-            # DB에서 처리할 항목 조회 (state=0, 5분 경과)
-            try:
-                items_to_process = await get_items_to_process(threshold_time)
-            except Exception as e:
-                logger.error(f"Error fetching items to process: {e}")
-                items_to_process = []
-
-            if items_to_process:
-                logger.info(f"Found {len(items_to_process)} items to process")
-            else:
-                # 30회 체크마다 한 번씩 로그 출력 (너무 많은 로그 방지)
-                if check_count % 30 == 0:
-                    logger.info(f"Worker check #{check_count}: No items found matching criteria")
-
-            # 조회된 각 항목에 대해 순환적으로 모니터 ID 할당 및 DB 업데이트
-            for item in items_to_process:
-                item_no = item["no"]
-                
-                # 이미 최근에 처리한 항목이면 건너뛰기
-                if item_no in recently_processed_items:
-                    logger.info(f"Skipping already processed item '{item_no}' (duplicate detection)")
+            # 리더 잠금 확인 (리더가 아니면 이번 주기는 건너뜀)
+            if settings.WORKER_LEADER_LOCK_ENABLED:
+                if not await refresh_worker_leadership(is_leader):
+                    is_leader = False
+                    await asyncio.sleep(settings.CHECK_INTERVAL_SECONDS)
                     continue
-                
-                item_update_time = item["update_time"]
-                item_text = item["text"] # text는 여기서 직접 사용되진 않지만 조회 결과에 포함됨
-
-                # 다음 모니터 ID 선택 (순환)
-                # 모니터 ID는 1부터 시작한다고 가정
-                current_monitor_id = str((monitor_index % num_monitors) + 1)
-                monitor_index = (monitor_index + 1) % num_monitors # 다음 인덱스로 이동
-
-                logger.info(f"Processing item '{item_no}' (update_time: {item_update_time}) and assigning to monitor {current_monitor_id}")
-
-                try:
-                    # 데이터 처리 완료 및 모니터 ID 할당 상태로 DB 업데이트
-                    success = await mark_item_processed_and_assign_monitor(item_no, current_monitor_id) # <--- DB 업데이트 함수 호출
-                    
-                    if not success:
-                        logger.warning(f"Item {item_no} could not be processed - skipping")
-                        continue
-                    
-                    # 처리 성공 시 최근 처리 항목 목록에 추가
-                    recently_processed_items.add(item_no)
-                    # 세트 크기 제한
-                    if len(recently_processed_items) > MAX_RECENT_ITEMS:
-                        # 가장 오래된 항목 제거 (세트에서는 순서가 없으므로 아무 항목이나 제거)
-                        recently_processed_items.pop()
-                    
-                    total_items_processed += 1
-                    logger.info(f"✅ Successfully assigned item '{item_no}' to monitor {current_monitor_id}")
-
-                except Exception as e:
-                     logger.error(f"An unexpected error occurred processing item '{item_no}' for monitor {current_monitor_id}: {e}")
-                     # DB 업데이트 실패 시 state는 0으로 유지되어 다음 주기에서 다시 시도
+                if not is_leader:
+                    # 상태 복구가 끝난 뒤에만 리더로 표시 (실패하면 다음 주기에 다시 복구)
+                    for event in settings.EVENTS.values():
+                        event_states[event.name]["monitor_index"] = await resume_assignment_state(event)
+                        event_states[event.name]["recently_processed_items"].clear()
+                    is_leader = True
+
+            # 이벤트별로 처리 대상 항목 할당
+            for event in settings.EVENTS.values():
+                total_items_processed += await assign_event_items(event, event_states[event.name], now, check_count)
 
         except asyncio.CancelledError:
             logger.info("Background worker cancelled (Assigning to Monitors).")
+            if is_leader and settings.WORKER_LEADER_LOCK_ENABLED:
+                await release_worker_lock(settings.WORKER_LOCK_NAME)
             break
         except Exception as e:
             logger.error(f"An error occurred in the background worker loop: {e}")
@@ -112,4 +189,4 @@ async def check_and_assign_data_worker(): # 함수 이름 변경 (전송 -> 할
             logger.error("⚠️ WORKER ERROR: Background worker encountered an error but will continue running")
 
         # 다음 확인까지 대기
-        await asyncio.sleep(settings.CHECK_INTERVAL_SECONDS)
\ No newline at end of file
+        await asyncio.sleep(settings.CHECK_INTERVAL_SECONDS)
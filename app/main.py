@@ -11,13 +11,25 @@ logger = logging.getLogger(__name__)
 
 # 모듈 임포트
 # database에서 create_items_table 임포트는 이제 불필요
-from .database import create_db_pool, close_db_pool # create_items_table 임포트 제거
+from .database import create_db_pool, close_db_pool, create_archive_table, create_changefeed_table, create_dedup_table # create_items_table 임포트 제거
 # 워커 함수 이름 변경되었으므로 임포트도 변경
 from .internal.worker import check_and_assign_data_worker # <-- 함수 이름 변경
-from .routers import items, status, monitors # ***monitors 라우터 임포트***
+from .internal.archiver import archive_old_items_worker
+from .internal.changefeed import changefeed_tailer
+from .internal.counters import set_monitor_backlog_source
+from .internal.dedup import dedup_cleanup_worker
+from .internal.push import start_push_dispatcher, stop_push_dispatcher
+from .internal.profiling import start_loop_watchdog, stop_loop_watchdog, route_timing_middleware
+from .routers import items, status, monitors, admin # ***monitors 라우터 임포트***
+from .routers.monitors import initialize_monitor_state
 
 # 백그라운드 작업 변수
 background_task = None
+archive_task = None
+changefeed_task = None
+dedup_task = None
+push_task = None
+loop_lag_task = None
 
 # FastAPI Lifespan 컨텍스트 매니저
 @asynccontextmanager
@@ -31,17 +43,60 @@ async def lifespan(app: FastAPI):
 
     # 2. 데이터베이스 테이블 확인/생성 단계 제거
     # await create_items_table() # <-- 이 줄을 제거합니다.
-    logger.info(f"Assuming database table '{settings.ITEMS_TABLE_NAME}' already exists.") # 로그 메시지 변경
+    for event in settings.EVENTS.values():
+        logger.info(f"Assuming database table '{event.table_name}' already exists (event '{event.name}').") # 로그 메시지 변경
+
+    # 모니터 상태 및 카운터 초기화
+    # (lifespan 을 사용하면 @app.on_event("startup") 핸들러는 호출되지 않으므로 여기서 수행)
+    await initialize_monitor_state()
+    logger.info("모니터 상태가 초기화되었습니다.")
+
+    # 할당 변경 피드 테이블 준비 (워커가 할당 트랜잭션에서 기록하므로 워커보다 먼저)
+    global changefeed_task
+    if settings.CHANGEFEED_ENABLED:
+        for event in settings.EVENTS.values():
+            await create_changefeed_table(event=event)
+        # 모니터별 대기 수는 모든 프로세스의 할당이 보이는 피드에서 갱신
+        set_monitor_backlog_source("changefeed")
+        changefeed_task = asyncio.create_task(changefeed_tailer())
+        logger.info("Changefeed tailer task started.")
+
+    # 중복 제출 병합 테이블 준비 및 정리 작업 시작
+    global dedup_task
+    if settings.DEDUP_ENABLED:
+        for event in settings.EVENTS.values():
+            await create_dedup_table(event=event)
+        dedup_task = asyncio.create_task(dedup_cleanup_worker())
+        logger.info("Dedup cleanup task started.")
+
+    # 푸시 전송 디스패처와 표시 스케줄러 시작 (모니터 상태 초기화 이후, 표시 차례가 된 항목을 전송)
+    global push_task
+    if settings.PUSH_DELIVERY_ENABLED:
+        push_task = start_push_dispatcher()
+        logger.info("Push dispatcher task started.")
 
     # 3. 백그라운드 작업 시작 (함수 이름 변경)
     global background_task
     background_task = asyncio.create_task(check_and_assign_data_worker()) # <-- 함수 이름 변경
     logger.info("Background worker task started.")
 
+    # 4. 아카이브 작업 시작 (설정된 경우에만)
+    global archive_task
+    if settings.ARCHIVE_ENABLED:
+        for event in settings.EVENTS.values():
+            await create_archive_table(event=event)
+        archive_task = asyncio.create_task(archive_old_items_worker())
+        logger.info("Archive worker task started.")
+
+    # 5. 이벤트 루프 지연 워치독 시작 (프로파일링 사용 시에만)
+    global loop_lag_task
+    if settings.PROFILING_ENABLED:
+        loop_lag_task = start_loop_watchdog()
+
     # 애플리케이션이 실행되는 동안 대기
     yield
 
-    # 4. 애플리케이션 종료 시 정리 작업
+    # 6. 애플리케이션 종료 시 정리 작업
     logger.info("App shutting down...")
 
     # 백그라운드 작업 취소 및 완료 대기
@@ -52,6 +107,49 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("Background worker task successfully cancelled.")
 
+    # 아카이브 작업 취소 및 완료 대기
+    if archive_task and not archive_task.done():
+        archive_task.cancel()
+        try:
+            await archive_task
+        except asyncio.CancelledError:
+            logger.info("Archive worker task successfully cancelled.")
+
+    # 변경 피드 tailer 취소 및 완료 대기
+    if changefeed_task and not changefeed_task.done():
+        changefeed_task.cancel()
+        try:
+            await changefeed_task
+        except asyncio.CancelledError:
+            logger.info("Changefeed tailer task successfully cancelled.")
+
+    # 중복 제출 정리 작업 취소 및 완료 대기
+    if dedup_task and not dedup_task.done():
+        dedup_task.cancel()
+        try:
+            await dedup_task
+        except asyncio.CancelledError:
+            logger.info("Dedup cleanup task successfully cancelled.")
+
+    # 푸시 전송 디스패처 취소 후 표시 스케줄러와 진행 중인 전송 정리 및 HTTP 클라이언트 종료
+    if push_task and not push_task.done():
+        push_task.cancel()
+        try:
+            await push_task
+        except asyncio.CancelledError:
+            logger.info("Push dispatcher task successfully cancelled.")
+    if settings.PUSH_DELIVERY_ENABLED:
+        await stop_push_dispatcher()
+
+    # 루프 지연 워치독 종료
+    if loop_lag_task and not loop_lag_task.done():
+        loop_lag_task.cancel()
+        try:
+            await loop_lag_task
+        except asyncio.CancelledError:
+            pass
+        stop_loop_watchdog()
+
     # MariaDB 연결 풀 종료
     await close_db_pool()
     logger.info("MariaDB pool closed.")
@@ -62,6 +160,11 @@ async def lifespan(app: FastAPI):
 # FastAPI 애플리케이션 인스턴스 생성 (lifespan 적용)
 app = FastAPI(lifespan=lifespan)
 
+# 라우트별 처리 시간 측정 미들웨어 및 관리자 라우터 (프로파일링 사용 시에만)
+if settings.PROFILING_ENABLED:
+    app.middleware("http")(route_timing_middleware)
+    app.include_router(admin.router)
+
 # 정적 파일 마운트
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -69,11 +172,5 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 app.include_router(status.router) # 상태 확인 및 모의 엔드포인트
 app.include_router(items.router)  # 데이터 추가/조회 엔드포인트
 app.include_router(monitors.router) # ***새 라우터 포함***
-
-# 모니터 라우터 초기화 함수 호출
-@app.on_event("startup")
-async def app_startup():
-    """애플리케이션 시작 시 모니터 초기화를 수행합니다."""
-    from .routers.monitors import initialize_monitor_state
-    await initialize_monitor_state()
-    logger.info("모니터 상태가 초기화되었습니다.")
\ No newline at end of file
+app.include_router(items.event_router)  # 이벤트별 데이터 추가/조회 엔드포인트
+app.include_router(monitors.event_router) # 이벤트별 모니터 엔드포인트
\ No newline at end of file
@@ -0,0 +1,45 @@
+import logging
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from ..core.config import settings
+from ..dependencies import require_admin_token
+from ..internal.profiling import capture_profile, get_loop_lag_snapshot, get_route_timings_snapshot
+
+logger = logging.getLogger(__name__)
+
+# PROFILING_ENABLED 일 때만 main 에서 포함되는 관리자용 라우터
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+# pstats 에서 허용하는 정렬 기준
+PROFILE_SORT_KEYS = ("cumulative", "tottime", "calls", "ncalls")
+
+@router.get("/loop-lag")
+async def read_loop_lag():
+    """이벤트 루프 지연 통계와 최근 멈춤 구간의 스택을 반환합니다."""
+    return get_loop_lag_snapshot()
+
+@router.get("/route-timings")
+async def read_route_timings():
+    """라우트별 호출 수와 평균/최대 처리 시간을 반환합니다."""
+    return get_route_timings_snapshot()
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def run_profile(seconds: float = 5, sort: str = "cumulative", limit: int = 40):
+    """
+    지정한 시간(초) 동안 cProfile 로 이벤트 루프를 측정하고 pstats 보고서를 반환합니다.
+    측정 중에는 서버가 다소 느려지므로 짧게 사용합니다.
+    """
+    if sort not in PROFILE_SORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {PROFILE_SORT_KEYS}")
+    seconds = max(0.1, min(seconds, settings.PROFILE_MAX_SECONDS))
+    limit = max(1, min(limit, 200))
+
+    logger.info(f"Profiling event loop for {seconds} seconds (sort={sort})")
+    try:
+        return await capture_profile(seconds, sort_by=sort, limit=limit)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
@@ -1,12 +1,25 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+import math
 import re # 정규식 임포트 추가
-from ..database import insert_item_db, get_all_items_db # DB 함수 임포트
+from typing import Optional
+from ..database import insert_item_db, insert_item_deduplicated_db, get_all_items_db, get_archived_items_db # DB 함수 임포트
+from ..core.config import settings, EventSettings
+from ..dependencies import ingest_rate_limit, get_event_or_404
+from ..internal.admission import AdmissionRejected, ingest_db_slot
+from ..internal.circuit_breaker import CircuitOpenError
+from ..internal.dedup import text_hash, find_recent_submission, remember_submission
 
 router = APIRouter(
     prefix="/items",
     tags=["items"],
 )
 
+# 이벤트별 항목 라우터 (예: /event/hall_b/items/add_test/)
+event_router = APIRouter(
+    prefix="/event/{event_name}/items",
+    tags=["items"],
+)
+
 # 텍스트 유효성 검사 함수 추가
 def validate_text(text: str) -> str:
     """
@@ -31,31 +44,97 @@ def validate_text(text: str) -> str:
     return text
 
 # --- add_test_item 함수 수정: no 인자 제거, 반환 값 변경, 텍스트 유효성 검사 추가 ---
-@router.post("/add_test/")
-# no: str 파라미터를 제거합니다.
-async def add_test_item(text: str):
+async def add_item(text: str, event: Optional[EventSettings] = None):
     """
     테스트용 데이터를 DB에 추가합니다 (no 자동 생성, 모니터 주소는 나중에 결정).
     """
     # 텍스트 유효성 검사
     validated_text = validate_text(text)
+    event = event or settings.DEFAULT_EVENT
+
+    # 중복 제출 확인: 최근 같은 텍스트가 메모리 색인에 있으면 DB 작업 없이 기존 no 반환
+    if settings.DEDUP_ENABLED:
+        submission_key = text_hash(validated_text)
+        existing_no = find_recent_submission(event.name, submission_key)
+        if existing_no is not None:
+            return {"message": "Duplicate item ignored", "no": existing_no, "duplicate": True}
     
     # insert_item_db 함수는 이제 text만 받습니다.
     try:
-        inserted_no = await insert_item_db(text=validated_text) # 삽입된 no 값을 반환받음
+        # 수집 경로용 DB 연결 슬롯을 확보한 뒤 삽입 (모니터 표시 경로용 연결은 예약되어 있음)
+        async with ingest_db_slot():
+            if settings.DEDUP_ENABLED:
+                # 다른 프로세스에서 먼저 저장된 같은 텍스트는 DB 해시 테이블로 확인
+                inserted_no, duplicate = await insert_item_deduplicated_db(
+                    validated_text, submission_key, settings.DEDUP_WINDOW_SECONDS, event=event
+                )
+                remember_submission(event.name, submission_key, inserted_no)
+            else:
+                inserted_no = await insert_item_db(text=validated_text, event=event) # 삽입된 no 값을 반환받음
+                duplicate = False
+        if duplicate:
+            return {"message": "Duplicate item ignored", "no": inserted_no, "duplicate": True}
         # 성공 응답에 자동 생성된 no 포함
-        return {"message": "Item added successfully", "no": inserted_no}
+        return {"message": "Item added successfully", "no": inserted_no, "duplicate": False}
+    except AdmissionRejected as e:
+        # 대기열 포화 시 빠르게 거절
+        raise HTTPException(status_code=429, detail=f"요청이 너무 많습니다: {e.reason}", headers={"Retry-After": str(e.retry_after)})
+    except CircuitOpenError as e:
+        # DB 장애 중에는 DB 오류(500) 대신 재시도 가능한 503 으로 다음 시험 요청 시각까지 기다리게 함
+        raise HTTPException(status_code=503, detail="데이터베이스를 일시적으로 사용할 수 없습니다", headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))})
     except Exception as e:
         # 데이터베이스 오류 처리
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {str(e)}")
 
+@router.post("/add_test/", dependencies=[Depends(ingest_rate_limit)])
+# no: str 파라미터를 제거합니다.
+async def add_test_item(text: str):
+    """기본 이벤트에 테스트용 데이터를 추가합니다."""
+    return await add_item(text)
+
+@event_router.post("/add_test/", dependencies=[Depends(ingest_rate_limit)])
+async def add_event_test_item(text: str, event: EventSettings = Depends(get_event_or_404)):
+    """이벤트별 테이블에 테스트용 데이터를 추가합니다."""
+    return await add_item(text, event)
+
 # --- list_items 함수는 동일 ---
 @router.get("/")
 async def list_items():
     """DB의 모든 항목을 조회합니다."""
+    return await list_event_items(settings.DEFAULT_EVENT)
+
+@event_router.get("/")
+async def list_event_items(event: EventSettings = Depends(get_event_or_404)):
+    """이벤트 테이블의 모든 항목을 조회합니다."""
+    try:
+        items = await get_all_items_db(event=event)
+        return [item.to_dict() for item in items]
+    except Exception as e:
+        # 데이터베이스 오류 처리
+        raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {str(e)}")
+
+# --- list_archived_items 함수 추가 ---
+@router.get("/history")
+async def list_archived_items(limit: int = 100, before_no: int = 0, monitor_id: Optional[str] = None):
+    """
+    아카이브 테이블로 옮겨진 지난 항목을 조회합니다.
+    다음 페이지는 응답의 마지막 no 값을 before_no 로 전달해 조회합니다.
+    """
+    return await list_event_archived_items(limit, before_no, monitor_id, settings.DEFAULT_EVENT)
+
+@event_router.get("/history")
+async def list_event_archived_items(limit: int = 100, before_no: int = 0, monitor_id: Optional[str] = None,
+                                    event: EventSettings = Depends(get_event_or_404)):
+    """이벤트의 아카이브 테이블에서 지난 항목을 조회합니다."""
+    if not settings.ARCHIVE_ENABLED:
+        raise HTTPException(status_code=404, detail="아카이브가 활성화되지 않았습니다")
+
+    # 한 번에 조회할 수 있는 최대 개수 제한
+    limit = max(1, min(limit, 1000))
+
     try:
-        items = await get_all_items_db()
-        return items
+        items = await get_archived_items_db(limit=limit, before_no=before_no, monitor_id=monitor_id, event=event)
+        return [item.to_dict() for item in items]
     except Exception as e:
         # 데이터베이스 오류 처리
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {str(e)}")
\ No newline at end of file
@@ -3,11 +3,19 @@ import logging
 from fastapi import APIRouter, Request, HTTPException
 from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
-from ..database import get_latest_processed_item_by_monitor_id, get_latest_two_processed_items_by_monitor_id, get_assigned_items_queue, get_new_items_for_monitor, get_latest_item_no # get_latest_item_no 함수 추가
-from ..core.config import settings # settings 임포트
+from starlette.background import BackgroundTask
+from ..database import get_latest_processed_item_by_monitor_id, get_latest_two_processed_items_by_monitor_id, get_assigned_items_queue, get_new_items_for_monitor, get_latest_item_no, get_item_state_counts # get_latest_item_no 함수 추가
+from ..internal import counters
+from ..internal.circuit_breaker import CircuitOpenError
+from ..internal.layout import attach_layout
+from ..internal.records import ItemRecord
+from ..internal.clock import current_time as clock_time
+from ..core.config import settings, EventSettings # settings 임포트
+from ..dependencies import get_event_or_404
 import json
 import asyncio
 import time
+from collections import deque
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -18,13 +26,23 @@ logger = logging.getLogger(__name__)
 templates = Jinja2Templates(directory="monitor_templates")
 
 router = APIRouter(
-    prefix="/monitor", # 예: /monitor/1, /monitor/2, /monitor/3
+    prefix="/monitor", # 예: /monitor/1, /monitor/2, /monitor/3 (기본 이벤트)
     tags=["monitors"],
 )
 
+# 이벤트별 모니터 라우터 (예: /event/hall_b/monitor/1)
+event_router = APIRouter(
+    prefix="/event/{event_name}/monitor",
+    tags=["monitors"],
+)
+
+# 모니터별 상태 딕셔너리의 키 -> (이벤트 설정, 이벤트 내 모니터 ID)
+# 기본 이벤트는 모니터 ID 그대로("1"), 다른 이벤트는 "이벤트이름/모니터ID" 를 키로 사용
+MONITOR_REFS: Dict[str, tuple] = {}
+
 # 모니터별 현재 표시 중인 항목과 큐를 저장하는 전역 변수
-MONITOR_QUEUES: Dict[str, List[dict]] = {}  # 모니터별 표시할 항목 큐
-CURRENT_ITEMS: Dict[str, Optional[dict]] = {}  # 모니터별 현재 표시 중인 항목
+MONITOR_QUEUES: Dict[str, List[ItemRecord]] = {}  # 모니터별 표시할 항목 큐
+CURRENT_ITEMS: Dict[str, Optional[ItemRecord]] = {}  # 모니터별 현재 표시 중인 항목
 DISPLAY_TIMES: Dict[str, float] = {}  # 모니터별 항목 표시 시작 시간
 LAST_DISPLAYED_ITEMS: Dict[str, int] = {}  # 모니터별 마지막으로 표시된 항목의 no값
 
@@ -32,54 +50,138 @@ LAST_DISPLAYED_ITEMS: Dict[str, int] = {}  # 모니터별 마지막으로 표시
 LOG_COUNTERS: Dict[str, int] = {}  # 모니터별 로그 카운터
 NO_ITEMS_LOG_COUNTERS: Dict[str, int] = {}  # 새 항목이 없을 때의 로그 카운터
 
-# 항목 표시 시간(초)
-ITEM_DISPLAY_DURATION = 20  # 각 항목이 표시되는 시간(초)
-NO_NEW_ITEMS_DISPLAY_DURATION = 5  # 새 항목이 없을 때 표시 시간(초)
+# 항목 표시 시간(초)은 이벤트별 설정(item_display_duration, no_new_items_display_duration)을 사용
 SSE_UPDATE_INTERVAL = 1  # SSE 업데이트 간격(초)
 LOG_INTERVAL = 120  # 로그 출력 간격(초) - 120초로 증가 (60초에서 120초로 변경)
 NO_ITEMS_LOG_INTERVAL = 600  # 새 항목이 없을 때 로그 출력 간격(초) - 10분 간격
+SSE_RETRY_AFTER_SECONDS = 5  # 연결 수 제한 초과 시 클라이언트에 안내할 재시도 대기 시간(초)
+
+# 모니터별 활성 SSE 연결 수 (프로세스 단위)
+ACTIVE_STREAMS: Dict[str, int] = {}
+
+# 변경 피드 사용 시 모니터별로 큐를 DB에서 다시 읽어야 하는지 여부 (없으면 읽어야 함)
+# 피드 tailer 가 새 할당을 발견하면 True 로 표시하고, 큐를 다시 읽으면 False 로 되돌림
+QUEUE_STALE: Dict[str, bool] = {}
+# 모니터별로 tailer 가 큐를 다시 읽도록 표시한 횟수 (조회 중에 들어온 표시를 지우지 않기 위해 사용)
+QUEUE_GENERATIONS: Dict[str, int] = {}
+# 모니터별로 큐를 DB에서 마지막으로 읽은 시각 (monotonic, 피드를 놓쳤을 때의 주기적 갱신용)
+QUEUE_REFRESHED_AT: Dict[str, float] = {}
+
+# SSE 프레임 id 와 재연결용 최근 프레임 버퍼 (모니터별)
+# id 는 "프로세스 시작 시각-순번" 형식이라 서버가 재시작되면 이전 id 로는 이어받지 않음
+STREAM_EPOCH = str(int(time.time()))
+FRAME_SEQUENCES: Dict[str, int] = {}  # 모니터별 마지막 프레임 순번
+FRAME_HISTORY: Dict[str, deque] = {}  # 모니터별 최근 (순번, 프레임 데이터, 생성 시각) 링 버퍼
+
+def get_monitor_key(event: EventSettings, monitor_id: int) -> str:
+    """이벤트와 모니터 ID로 모니터별 상태 딕셔너리의 키를 만들고 등록합니다."""
+    if event.name == settings.DEFAULT_EVENT_NAME:
+        monitor_key = str(monitor_id)
+    else:
+        monitor_key = f"{event.name}/{monitor_id}"
+    MONITOR_REFS[monitor_key] = (event, str(monitor_id))
+    return monitor_key
+
+def get_monitor_ref(monitor_key: str) -> tuple:
+    """상태 키에 해당하는 (이벤트 설정, 이벤트 내 모니터 ID)를 반환합니다."""
+    return MONITOR_REFS.get(monitor_key) or (settings.DEFAULT_EVENT, monitor_key)
+
+def validate_monitor_id(event: EventSettings, monitor_id: int):
+    """모니터 ID가 이벤트의 모니터 범위 안에 있는지 검사합니다."""
+    if not (1 <= monitor_id <= event.monitor_count):
+         raise HTTPException(status_code=404, detail=f"Monitor ID {monitor_id} not found. Valid IDs are 1 to {event.monitor_count}.")
 
 # 모듈 초기화 함수
 async def initialize_monitor_state():
     """
-    서버 시작 시 모든 모니터의 상태를 초기화합니다.
-    DB의 마지막 항목 번호를 가져와 각 모니터의 마지막 표시 항목으로 설정합니다.
+    서버 시작 시 모든 이벤트의 모니터 상태를 초기화합니다.
+    DB에서 카운터(최신 항목 번호, 상태별 항목 수, 모니터별 대기 수)를 한 번 채우고,
+    마지막 항목 번호를 각 모니터의 마지막 표시 항목으로 설정합니다.
     """
-    try:
-        # DB에서 최신 항목의 번호 가져오기
-        latest_item_no = await get_latest_item_no()
-        
-        # 모든 모니터의 마지막 표시 항목 번호를 최신 항목으로 설정
-        for monitor_id in range(1, settings.MONITOR_COUNT + 1):
-            LAST_DISPLAYED_ITEMS[str(monitor_id)] = latest_item_no
-        
-        logger.info(f"모니터 초기화 완료: 서버 시작 시점의 마지막 항목 번호({latest_item_no}) 이후의 항목부터 표시합니다.")
-    except Exception as e:
-        logger.error(f"모니터 상태 초기화 중 오류 발생: {e}")
-        # 오류 발생 시에도 계속 진행 (기본값 0으로 작동)
+    for event in settings.EVENTS.values():
+        try:
+            # DB에서 최신 항목 번호와 상태별 항목 수를 가져와 카운터 초기화
+            state_counts = await get_item_state_counts(event=event)
+            counters.seed_counters(event.name, **state_counts)
+            latest_item_no = counters.get_latest_item_no(event.name)
+            
+            # 모든 모니터의 마지막 표시 항목 번호를 최신 항목으로 설정
+            for monitor_id in range(1, event.monitor_count + 1):
+                LAST_DISPLAYED_ITEMS[get_monitor_key(event, monitor_id)] = latest_item_no
+            
+            logger.info(f"[{event.name}] 모니터 초기화 완료: 서버 시작 시점의 마지막 항목 번호({latest_item_no}) 이후의 항목부터 표시합니다.")
+        except Exception as e:
+            logger.error(f"[{event.name}] 모니터 상태 초기화 중 오류 발생: {e}")
+            # 오류 발생 시에도 계속 진행 (기본값 0으로 작동)
 
-@router.get("/{monitor_id}/", response_class=HTMLResponse)
-async def display_for_monitor(monitor_id: int, request: Request): # monitor_id를 int로 받음
+def render_monitor_display(event: EventSettings, monitor_id: int, request: Request, base_path: str):
     """
     특정 모니터 ID에 할당된 최신 데이터를 HTML 페이지로 표시합니다.
     """
     # 모니터 ID 유효성 검사
-    if not (1 <= monitor_id <= settings.MONITOR_COUNT):
-         raise HTTPException(status_code=404, detail=f"Monitor ID {monitor_id} not found. Valid IDs are 1 to {settings.MONITOR_COUNT}.")
+    validate_monitor_id(event, monitor_id)
 
     try:
         # 템플릿을 바로 사용하여 HTML 렌더링
         return templates.TemplateResponse(
             "display.html", 
-            {"request": request, "monitor_id": monitor_id}
+            {
+                "request": request,
+                "monitor_id": monitor_id,
+                "event_name": event.name,
+                "stream_url": f"{base_path}/{monitor_id}/stream",
+                "ping_url": f"{base_path}/{monitor_id}/ping",
+            }
         )
     except Exception as e:
          logger.error(f"Error rendering monitor display for {monitor_id}: {e}")
          # 실제 에러 메시지를 클라이언트에 노출하지 않도록 주의
          raise HTTPException(status_code=500, detail="Internal Server Error while fetching data")
 
+@router.get("/{monitor_id}/", response_class=HTMLResponse)
+async def display_for_monitor(monitor_id: int, request: Request): # monitor_id를 int로 받음
+    """기본 이벤트의 모니터 디스플레이 페이지"""
+    return render_monitor_display(settings.DEFAULT_EVENT, monitor_id, request, "/monitor")
+
+@event_router.get("/{monitor_id}/", response_class=HTMLResponse)
+async def display_for_event_monitor(event_name: str, monitor_id: int, request: Request):
+    """이벤트별 모니터 디스플레이 페이지"""
+    event = get_event_or_404(event_name)
+    return render_monitor_display(event, monitor_id, request, f"/event/{event.name}/monitor")
+
+def get_item_display_duration(event: EventSettings, queue_length: int) -> float:
+    """
+    현재 항목의 표시 시간(초)을 결정합니다.
+    적응형 표시 시간이 설정된 경우 현재 항목 뒤에 대기 중인 항목 수에 따라
+    max(대기 없음) ~ min(adaptive_backlog_high 개 이상) 사이에서 선형으로 줄입니다.
+    """
+    if not event.adaptive_display:
+        return event.item_display_duration
+    waiting = max(0, queue_length - 1)  # 큐의 첫 항목은 현재 표시 중인 항목
+    load = min(1.0, waiting / event.adaptive_backlog_high)
+    return event.max_item_display_duration - (event.max_item_display_duration - event.min_item_display_duration) * load
+
+def mark_monitor_stale(event: EventSettings, adr: str):
+    """변경 피드에서 새 할당을 발견한 모니터의 큐를 다음 기회에 DB에서 다시 읽도록 표시합니다."""
+    monitor_key = get_monitor_key(event, adr)
+    QUEUE_GENERATIONS[monitor_key] = QUEUE_GENERATIONS.get(monitor_key, 0) + 1
+    QUEUE_STALE[monitor_key] = True
+
+def should_refresh_queue(monitor_id: str) -> bool:
+    """
+    큐를 DB에서 다시 읽어야 하는지 반환합니다. 변경 피드를 사용하지 않으면 항상 True 입니다.
+    피드를 사용하더라도 마지막으로 읽은 지 CHANGEFEED_SAFETY_REFRESH_SECONDS 가 지났으면
+    (현재 항목 표시 여부와 관계없이) 다시 읽어 피드에서 놓친 할당을 반영합니다.
+    """
+    if not settings.CHANGEFEED_ENABLED:
+        return True
+    if time.monotonic() - QUEUE_REFRESHED_AT.get(monitor_id, 0) >= settings.CHANGEFEED_SAFETY_REFRESH_SECONDS:
+        return True
+    return QUEUE_STALE.get(monitor_id, True)
+
 async def update_monitor_queue(monitor_id: str):
-    """모니터의 항목 큐를 업데이트합니다"""
+    """모니터의 항목 큐를 업데이트합니다 (monitor_id 는 모니터 상태 키)"""
+    event, adr = get_monitor_ref(monitor_id)
     try:
         # 마지막으로 표시된 항목의 no 값 가져오기 (없으면 0으로 기본값 설정)
         last_item_no = LAST_DISPLAYED_ITEMS.get(monitor_id, 0)
@@ -91,10 +193,19 @@ async def update_monitor_queue(monitor_id: str):
             should_log = (counter <= 2 or counter % LOG_INTERVAL == 0)
         
         # DB에서 마지막으로 표시된 항목 이후의 항목들만 가져오기
-        items = await get_new_items_for_monitor(monitor_id, last_item_no, limit=20, should_log=should_log)
+        # 적응형 표시 시간이 대기 항목 수를 판단할 수 있도록 최소 adaptive_backlog_high 개까지 조회
+        limit = max(20, event.adaptive_backlog_high + 1)
+        generation = QUEUE_GENERATIONS.get(monitor_id, 0)
+        items = await get_new_items_for_monitor(adr, last_item_no, limit=limit, should_log=should_log, event=event)
+        # 조회 결과가 limit 만큼이면 뒤에 항목이 더 있을 수 있으므로 계속 다시 읽어야 하는 상태로 둠
+        # 조회 중에 tailer 가 새 할당을 표시했으면 이번 결과에 없을 수 있으므로 표시를 유지
+        if QUEUE_GENERATIONS.get(monitor_id, 0) == generation:
+            QUEUE_STALE[monitor_id] = len(items) >= limit
+        QUEUE_REFRESHED_AT[monitor_id] = time.monotonic()
         
         if items:
-            MONITOR_QUEUES[monitor_id] = items
+            # 큐에 들어올 때 레이아웃 힌트를 붙여 둠 (같은 텍스트는 캐시된 계산 결과 사용)
+            MONITOR_QUEUES[monitor_id] = [attach_layout(item) for item in items]
             if should_log:
                 logger.info(f"Updated queue for monitor {monitor_id} with {len(items)} items (after item no: {last_item_no})")
         else:
@@ -102,14 +213,19 @@ async def update_monitor_queue(monitor_id: str):
             # 로그 카운터를 확인하여 로그 표시 여부 결정
             if should_log:
                 logger.info(f"No new items found for monitor {monitor_id}")
+    except CircuitOpenError:
+        # DB 차단 중: 메모리의 기존 큐와 현재 항목으로 계속 표시하고, 복구 후 다시 읽도록 표시
+        QUEUE_STALE[monitor_id] = True
     except Exception as e:
+        # 조회 실패 시에도 기존 큐를 비우지 않음 (화면이 빈 상태로 돌아가지 않도록)
+        QUEUE_STALE[monitor_id] = True
         logger.error(f"Error updating queue for monitor {monitor_id}: {e}")
 
-async def get_next_item_for_monitor(monitor_id: str) -> Optional[dict]:
+async def get_next_item_for_monitor(monitor_id: str) -> Optional[ItemRecord]:
     """모니터의 큐에서 다음 항목을 가져옵니다"""
     
-    # 큐가 없거나 비어있으면 업데이트
-    if monitor_id not in MONITOR_QUEUES or not MONITOR_QUEUES[monitor_id]:
+    # 큐가 없거나 비어있으면 업데이트 (변경 피드 사용 시 새 할당이 있을 때만)
+    if (monitor_id not in MONITOR_QUEUES or not MONITOR_QUEUES[monitor_id]) and should_refresh_queue(monitor_id):
         await update_monitor_queue(monitor_id)
     
     # 큐에 항목이 있으면 첫 번째 항목 반환
@@ -123,8 +239,8 @@ async def advance_monitor_queue(monitor_id: str):
     if monitor_id in MONITOR_QUEUES and MONITOR_QUEUES[monitor_id]:
         # 현재 항목의 no 값을 저장 (마지막으로 표시된 항목으로 기록)
         current_item = MONITOR_QUEUES[monitor_id][0]
-        if current_item and 'no' in current_item:
-            LAST_DISPLAYED_ITEMS[monitor_id] = current_item['no']
+        if current_item:
+            LAST_DISPLAYED_ITEMS[monitor_id] = current_item.no
             # 로그 출력 여부 결정
             should_log = False
             if monitor_id in LOG_COUNTERS:
@@ -132,7 +248,7 @@ async def advance_monitor_queue(monitor_id: str):
                 should_log = (counter <= 2 or counter % LOG_INTERVAL == 0)
             
             if should_log:
-                logger.info(f"Recorded last displayed item for monitor {monitor_id}: item no {current_item['no']}")
+                logger.info(f"Recorded last displayed item for monitor {monitor_id}: item no {current_item.no}")
         
         # 첫 번째 항목 제거
         MONITOR_QUEUES[monitor_id].pop(0)
@@ -147,159 +263,306 @@ async def advance_monitor_queue(monitor_id: str):
             logger.info(f"Advanced queue for monitor {monitor_id}, {len(MONITOR_QUEUES[monitor_id])} items left")
         
         # 큐가 비었으면 다시 로드
-        if not MONITOR_QUEUES[monitor_id]:
+        if not MONITOR_QUEUES[monitor_id] and should_refresh_queue(monitor_id):
             await update_monitor_queue(monitor_id)
 
-@router.get("/{monitor_id}/stream")
-async def stream_monitor_updates(monitor_id: int):
-    """모니터 데이터의 실시간 업데이트를 위한 SSE 스트림"""
-    monitor_id_str = str(monitor_id)
+async def build_monitor_frame(monitor_id_str: str) -> dict:
+    """
+    모니터의 표시 상태를 한 단계 진행시키고, 클라이언트에 보낼 현재 상태를 반환합니다.
+    SSE 연결 수와 관계없이 모니터 상태(큐, 현재 항목, 표시 시간)는 전역으로 공유됩니다.
+    """
+    event, adr = get_monitor_ref(monitor_id_str)
+    current_time = clock_time()
     
-    # 모니터가 아직 초기화되지 않았거나 마지막 표시 항목이 0인 경우
-    # DB 최신 항목 번호를 다시 확인하여 설정
-    if monitor_id_str not in LAST_DISPLAYED_ITEMS or LAST_DISPLAYED_ITEMS[monitor_id_str] == 0:
-        try:
-            latest_no = await get_latest_item_no()
-            LAST_DISPLAYED_ITEMS[monitor_id_str] = latest_no
-            logger.info(f"Stream 연결 시 모니터 {monitor_id_str} 초기화: 마지막 항목 번호 {latest_no}로 설정")
-        except Exception as e:
-            logger.error(f"Stream 연결 시 모니터 {monitor_id_str} 초기화 오류: {e}")
+    # 현재 항목이 표시된 시간을 가져옴
+    display_time = DISPLAY_TIMES.get(monitor_id_str, 0)
     
-    # 모니터 큐 초기화
-    if monitor_id_str not in MONITOR_QUEUES:
-        await update_monitor_queue(monitor_id_str)
+    # 현재 표시 중인 항목이 새 항목이 없는 경우인지 확인
+    is_no_new_items = (monitor_id_str in CURRENT_ITEMS and 
+                      not MONITOR_QUEUES.get(monitor_id_str, []))
     
-    # 새 항목 없음 로그 카운터 초기화
-    if monitor_id_str not in NO_ITEMS_LOG_COUNTERS:
-        NO_ITEMS_LOG_COUNTERS[monitor_id_str] = 0
+    # 적용할 표시 시간 결정 (대기 항목 수에 따라 조절)
+    queue_length = len(MONITOR_QUEUES.get(monitor_id_str, []))
+    display_duration = event.no_new_items_display_duration if is_no_new_items else get_item_display_duration(event, queue_length)
     
-    async def event_generator():
-        while True:
-            current_time = time.time()
+    # 현재 항목이 지정된 시간을 초과했는지 확인
+    if (monitor_id_str in CURRENT_ITEMS and 
+        monitor_id_str in DISPLAY_TIMES and 
+        current_time - display_time >= display_duration):
+        
+        # 다음 항목으로 이동 (항상 큐를 진행)
+        await advance_monitor_queue(monitor_id_str)
+        
+        # 새 항목을 검색하기 위해 큐 업데이트
+        if should_refresh_queue(monitor_id_str):
+            await update_monitor_queue(monitor_id_str)
+        
+        # 큐가 비어있고 현재 항목이 있으면 현재 항목을 유지 (새 항목이 없을 때)
+        if not MONITOR_QUEUES.get(monitor_id_str, []) and monitor_id_str in CURRENT_ITEMS and CURRENT_ITEMS[monitor_id_str]:
+            # 표시 시간만 리셋
+            DISPLAY_TIMES[monitor_id_str] = current_time
             
-            # 현재 항목이 표시된 시간을 가져옴
-            display_time = DISPLAY_TIMES.get(monitor_id_str, 0)
+            # 새 항목이 없을 때의 로그 카운터 증가
+            NO_ITEMS_LOG_COUNTERS[monitor_id_str] += 1
             
-            # 현재 표시 중인 항목이 새 항목이 없는 경우인지 확인
-            is_no_new_items = (monitor_id_str in CURRENT_ITEMS and 
-                              not MONITOR_QUEUES.get(monitor_id_str, []))
+            # 로그 출력 여부 결정 (초기 2회와 NO_ITEMS_LOG_INTERVAL 간격으로만 출력)
+            should_log_no_items = (NO_ITEMS_LOG_COUNTERS[monitor_id_str] <= 2 or 
+                                 NO_ITEMS_LOG_COUNTERS[monitor_id_str] % NO_ITEMS_LOG_INTERVAL == 0)
             
-            # 적용할 표시 시간 결정
-            display_duration = NO_NEW_ITEMS_DISPLAY_DURATION if is_no_new_items else ITEM_DISPLAY_DURATION
+            if should_log_no_items:
+                logger.info(f"No new items for monitor {monitor_id_str}, continuing to display current item {CURRENT_ITEMS[monitor_id_str].no} for {event.no_new_items_display_duration} seconds")
+        else:
+            # 대기열에 항목이 있으면 현재 항목 초기화 (다음 항목을 표시하기 위해)
+            CURRENT_ITEMS[monitor_id_str] = None
+            # 새 항목이 생겼으므로 로그 카운터 리셋
+            NO_ITEMS_LOG_COUNTERS[monitor_id_str] = 0
+    
+    # 표시할 항목이 없으면 다음 항목 가져오기
+    if monitor_id_str not in CURRENT_ITEMS or CURRENT_ITEMS[monitor_id_str] is None:
+        # 다음 항목을 가져오기 전 마지막 표시 항목 번호 확인
+        # 로그 카운터 관리
+        if monitor_id_str not in LOG_COUNTERS:
+            LOG_COUNTERS[monitor_id_str] = 0
+        
+        LOG_COUNTERS[monitor_id_str] += 1
+        
+        # 로그 간격에 맞게 출력
+        should_log = LOG_COUNTERS[monitor_id_str] <= 2 or LOG_COUNTERS[monitor_id_str] % LOG_INTERVAL == 0
+        
+        if should_log:
+            last_no = LAST_DISPLAYED_ITEMS.get(monitor_id_str, 0)
+            logger.info(f"모니터 {monitor_id_str}의 현재 마지막 표시 항목 번호: {last_no}, 다음 항목 가져오는 중...")
+        
+        next_item = await get_next_item_for_monitor(monitor_id_str)
+        
+        if next_item:
+            CURRENT_ITEMS[monitor_id_str] = next_item
+            DISPLAY_TIMES[monitor_id_str] = current_time
+            counters.record_displayed(event.name, adr)
+            # 새 항목이 생겼으므로 로그 카운터 리셋
+            NO_ITEMS_LOG_COUNTERS[monitor_id_str] = 0
             
-            # 현재 항목이 지정된 시간을 초과했는지 확인
-            if (monitor_id_str in CURRENT_ITEMS and 
-                monitor_id_str in DISPLAY_TIMES and 
-                current_time - display_time >= display_duration):
-                
-                # 다음 항목으로 이동 (항상 큐를 진행)
-                await advance_monitor_queue(monitor_id_str)
-                
-                # 새 항목을 검색하기 위해 큐 업데이트
-                await update_monitor_queue(monitor_id_str)
-                
-                # 큐가 비어있고 현재 항목이 있으면 현재 항목을 유지 (새 항목이 없을 때)
-                if not MONITOR_QUEUES.get(monitor_id_str, []) and monitor_id_str in CURRENT_ITEMS and CURRENT_ITEMS[monitor_id_str]:
-                    # 표시 시간만 리셋
-                    DISPLAY_TIMES[monitor_id_str] = current_time
-                    
-                    # 새 항목이 없을 때의 로그 카운터 증가
-                    NO_ITEMS_LOG_COUNTERS[monitor_id_str] += 1
-                    
-                    # 로그 출력 여부 결정 (초기 2회와 NO_ITEMS_LOG_INTERVAL 간격으로만 출력)
-                    should_log_no_items = (NO_ITEMS_LOG_COUNTERS[monitor_id_str] <= 2 or 
-                                         NO_ITEMS_LOG_COUNTERS[monitor_id_str] % NO_ITEMS_LOG_INTERVAL == 0)
-                    
-                    if should_log_no_items:
-                        logger.info(f"No new items for monitor {monitor_id_str}, continuing to display current item {CURRENT_ITEMS[monitor_id_str]['no']} for {NO_NEW_ITEMS_DISPLAY_DURATION} seconds")
-                else:
-                    # 대기열에 항목이 있으면 현재 항목 초기화 (다음 항목을 표시하기 위해)
-                    CURRENT_ITEMS[monitor_id_str] = None
-                    # 새 항목이 생겼으므로 로그 카운터 리셋
-                    NO_ITEMS_LOG_COUNTERS[monitor_id_str] = 0
+            # 현재 항목을 표시할 때 즉시 마지막 표시 항목으로 기록
+            LAST_DISPLAYED_ITEMS[monitor_id_str] = next_item.no
+            if should_log:
+                logger.info(f"모니터 {monitor_id_str}에 항목 {next_item.no} 표시 및 마지막 표시 항목으로 기록. 이전: {LAST_DISPLAYED_ITEMS.get(monitor_id_str, 0)}")
             
-            # 표시할 항목이 없으면 다음 항목 가져오기
-            if monitor_id_str not in CURRENT_ITEMS or CURRENT_ITEMS[monitor_id_str] is None:
-                # 다음 항목을 가져오기 전 마지막 표시 항목 번호 확인
-                # 로그 카운터 관리
-                if monitor_id_str not in LOG_COUNTERS:
-                    LOG_COUNTERS[monitor_id_str] = 0
-                
-                LOG_COUNTERS[monitor_id_str] += 1
-                
-                # 로그 간격에 맞게 출력
-                should_log = LOG_COUNTERS[monitor_id_str] <= 2 or LOG_COUNTERS[monitor_id_str] % LOG_INTERVAL == 0
-                
-                if should_log:
-                    last_no = LAST_DISPLAYED_ITEMS.get(monitor_id_str, 0)
-                    logger.info(f"모니터 {monitor_id_str}의 현재 마지막 표시 항목 번호: {last_no}, 다음 항목 가져오는 중...")
-                
-                next_item = await get_next_item_for_monitor(monitor_id_str)
-                
-                if next_item:
-                    CURRENT_ITEMS[monitor_id_str] = next_item
-                    DISPLAY_TIMES[monitor_id_str] = current_time
-                    # 새 항목이 생겼으므로 로그 카운터 리셋
-                    NO_ITEMS_LOG_COUNTERS[monitor_id_str] = 0
-                    
-                    # 현재 항목을 표시할 때 즉시 마지막 표시 항목으로 기록
-                    if 'no' in next_item:
-                        LAST_DISPLAYED_ITEMS[monitor_id_str] = next_item['no']
-                        if should_log:
-                            logger.info(f"모니터 {monitor_id_str}에 항목 {next_item['no']} 표시 및 마지막 표시 항목으로 기록. 이전: {LAST_DISPLAYED_ITEMS.get(monitor_id_str, 0)}")
-                    
-                    if should_log:
-                        logger.info(f"Now displaying item {next_item['no']} on monitor {monitor_id_str}")
-                else:
-                    # 표시할 항목이 없을 때 주기적으로 큐 새로고침
-                    # 로그 카운터는 이미 위에서 증가시켰으므로 다시 증가시키지 않음
-                    
-                    # LOG_INTERVAL초마다 한 번씩 로그 출력 (초기 몇 번은 항상 출력)
-                    if should_log:
-                        last_no = LAST_DISPLAYED_ITEMS.get(monitor_id_str, 0)
-                        logger.info(f"모니터 {monitor_id_str}에 표시할 항목 없음. 마지막 표시 항목 번호: {last_no} (로그 카운트: {LOG_COUNTERS[monitor_id_str]})")
-                    
-                    # 항목이 없을 때도 정기적으로 큐 업데이트 (LOG_INTERVAL초마다)
-                    if current_time % LOG_INTERVAL < 1 or LOG_COUNTERS[monitor_id_str] <= 3:  # 처음 3번은 매번 업데이트
-                        await update_monitor_queue(monitor_id_str)
+            if should_log:
+                logger.info(f"Now displaying item {next_item.no} on monitor {monitor_id_str}")
+        else:
+            # 표시할 항목이 없을 때 주기적으로 큐 새로고침
+            # 로그 카운터는 이미 위에서 증가시켰으므로 다시 증가시키지 않음
             
-            # SSE 이벤트로 현재 항목 전송
-            current_item = CURRENT_ITEMS.get(monitor_id_str)
+            # LOG_INTERVAL초마다 한 번씩 로그 출력 (초기 몇 번은 항상 출력)
+            if should_log:
+                last_no = LAST_DISPLAYED_ITEMS.get(monitor_id_str, 0)
+                logger.info(f"모니터 {monitor_id_str}에 표시할 항목 없음. 마지막 표시 항목 번호: {last_no} (로그 카운트: {LOG_COUNTERS[monitor_id_str]})")
             
-            if current_item:
-                # 현재 표시 중인 항목이 새 항목이 없는 경우인지 다시 확인
-                is_no_new_items = not MONITOR_QUEUES.get(monitor_id_str, [])
-                # 적용할 표시 시간 결정
-                display_duration = NO_NEW_ITEMS_DISPLAY_DURATION if is_no_new_items else ITEM_DISPLAY_DURATION
-                
-                # 남은 표시 시간 계산
-                elapsed_time = current_time - DISPLAY_TIMES.get(monitor_id_str, current_time)
-                remaining_time = max(0, display_duration - elapsed_time)
-                
-                response_data = {
-                    "item": current_item,
-                    "remaining_time": remaining_time,
-                    "queue_length": len(MONITOR_QUEUES.get(monitor_id_str, []))
-                }
-            else:
-                response_data = {
-                    "item": None,
-                    "remaining_time": 0,
-                    "queue_length": len(MONITOR_QUEUES.get(monitor_id_str, []))
-                }
-                
-            yield f"data: {json.dumps(response_data, default=str)}\n\n"
-            await asyncio.sleep(SSE_UPDATE_INTERVAL)  # SSE_UPDATE_INTERVAL 간격으로 업데이트
+            # 항목이 없을 때도 정기적으로 큐 업데이트 (LOG_INTERVAL초마다)
+            if current_time % LOG_INTERVAL < 1 or LOG_COUNTERS[monitor_id_str] <= 3:  # 처음 3번은 매번 업데이트
+                await update_monitor_queue(monitor_id_str)
+    
+    # SSE 이벤트로 현재 항목 전송
+    current_item = CURRENT_ITEMS.get(monitor_id_str)
     
+    if current_item:
+        # 현재 표시 중인 항목이 새 항목이 없는 경우인지 다시 확인
+        queue_length = len(MONITOR_QUEUES.get(monitor_id_str, []))
+        is_no_new_items = queue_length == 0
+        # 적용할 표시 시간 결정 (대기 항목 수에 따라 조절)
+        display_duration = event.no_new_items_display_duration if is_no_new_items else get_item_display_duration(event, queue_length)
+        
+        # 남은 표시 시간 계산
+        elapsed_time = current_time - DISPLAY_TIMES.get(monitor_id_str, current_time)
+        remaining_time = max(0, display_duration - elapsed_time)
+        
+        response_data = {
+            "item": current_item.to_json_dict(),
+            "remaining_time": remaining_time,
+            "queue_length": queue_length,
+            "display_duration": display_duration
+        }
+    else:
+        response_data = {
+            "item": None,
+            "remaining_time": 0,
+            "queue_length": len(MONITOR_QUEUES.get(monitor_id_str, [])),
+            "display_duration": 0
+        }
+
+    return response_data
+
+def format_frame(seq: int, response_data: dict) -> str:
+    """프레임 데이터를 순번 id 가 붙은 SSE 형식 문자열로 만듭니다."""
+    return f"id: {STREAM_EPOCH}-{seq}\ndata: {json.dumps(response_data, default=str)}\n\n"
+
+def record_frame(monitor_id_str: str, response_data: dict) -> str:
+    """프레임에 모니터별 순번 id 를 붙이고 링 버퍼에 보관한 뒤 SSE 형식 문자열을 반환합니다."""
+    seq = FRAME_SEQUENCES.get(monitor_id_str, 0) + 1
+    FRAME_SEQUENCES[monitor_id_str] = seq
+
+    history = FRAME_HISTORY.get(monitor_id_str)
+    if history is None:
+        history = FRAME_HISTORY[monitor_id_str] = deque(maxlen=settings.SSE_REPLAY_BUFFER_SIZE)
+    # 다시 보낼 때 남은 표시 시간을 현재 시각 기준으로 고칠 수 있도록 데이터와 생성 시각을 보관
+    history.append((seq, response_data, clock_time()))
+    return format_frame(seq, response_data)
+
+def find_resume_frames(monitor_id_str: str, last_event_id: str) -> Optional[List[str]]:
+    """
+    Last-Event-ID 이후에 클라이언트가 받지 못한 프레임을 링 버퍼에서 찾습니다.
+    프레임은 모니터 상태 전체를 담으므로 그중 가장 최신 프레임 하나만 반환하며,
+    remaining_time 은 프레임을 만든 뒤 지난 시간만큼 줄여 현재 시각 기준으로 다시 계산합니다.
+    이어받을 수 없으면(다른 프로세스/재시작 이전 id, 버퍼보다 오래된 id) None 을 반환합니다.
+    """
+    epoch, _, seq = last_event_id.partition("-")
+    history = FRAME_HISTORY.get(monitor_id_str)
+    if epoch != STREAM_EPOCH or not seq.isdigit() or not history:
+        return None
+    seq = int(seq)
+    if seq < history[0][0] - 1 or seq > history[-1][0]:
+        return None
+    if seq == history[-1][0]:
+        return []
+    latest_seq, response_data, built_at = history[-1]
+    if response_data.get("item"):
+        elapsed_time = clock_time() - built_at
+        response_data = {**response_data, "remaining_time": max(0, response_data["remaining_time"] - elapsed_time)}
+    return [format_frame(latest_seq, response_data)]
+
+def _offer_latest_frame(send_buffer: asyncio.Queue, frame: Optional[str]):
+    """
+    송신 버퍼에 최신 프레임만 남깁니다.
+    클라이언트가 아직 가져가지 않은 이전 프레임은 최신 상태로 대체되므로 버립니다.
+    """
+    while not send_buffer.empty():
+        send_buffer.get_nowait()
+    send_buffer.put_nowait(frame)
+
+async def open_monitor_stream(event: EventSettings, monitor_id: int, request: Request, last_event_id: Optional[str] = None):
+    """
+    모니터 데이터의 실시간 업데이트를 위한 SSE 스트림
+    Last-Event-ID 가 메모리의 최근 프레임과 이어지면 DB 조회 없이 메모리 상태에서 이어서 보냅니다.
+    """
+    validate_monitor_id(event, monitor_id)
+    monitor_id_str = get_monitor_key(event, monitor_id)
+
+    # 프로세스 단위 연결 수 제한 확인
+    if (sum(ACTIVE_STREAMS.values()) >= settings.SSE_MAX_CONNECTIONS or
+            ACTIVE_STREAMS.get(monitor_id_str, 0) >= settings.SSE_MAX_CONNECTIONS_PER_MONITOR):
+        logger.warning(f"모니터 {monitor_id_str} SSE 연결 거부: 연결 수 제한 초과 (현재 {ACTIVE_STREAMS.get(monitor_id_str, 0)}개)")
+        raise HTTPException(
+            status_code=503,
+            detail="SSE 연결 수 제한을 초과했습니다",
+            headers={"Retry-After": str(SSE_RETRY_AFTER_SECONDS)},
+        )
+    
+    # 응답을 반환하기 전에 슬롯을 예약 (아래 초기화 중 대기하는 동안 다른 요청이 같은 빈자리로 제한을 통과하지 않도록)
+    ACTIVE_STREAMS[monitor_id_str] = ACTIVE_STREAMS.get(monitor_id_str, 0) + 1
+    slot_released = False
+
+    async def release_stream_slot():
+        """예약한 슬롯을 한 번만 반환합니다 (생성기 종료, 응답 후 작업, 초기화 오류 중 먼저 실행되는 쪽에서)."""
+        nonlocal slot_released
+        if not slot_released:
+            slot_released = True
+            ACTIVE_STREAMS[monitor_id_str] -= 1
+
+    try:
+        # 재연결이면 링 버퍼에서 이어받을 프레임 확인 (모니터 상태가 메모리에 있을 때만)
+        resume_frames = None
+        if last_event_id and monitor_id_str in MONITOR_QUEUES:
+            resume_frames = find_resume_frames(monitor_id_str, last_event_id)
+        if resume_frames is not None:
+            logger.info(f"모니터 {monitor_id_str} SSE 재연결: {last_event_id} 이후부터 메모리 상태로 이어서 전송")
+
+        # 모니터가 아직 초기화되지 않았거나 마지막 표시 항목이 0인 경우 최신 항목 번호로 설정 (이어받기면 생략)
+        # 프로세스 내 카운터는 다른 프로세스의 삽입을 반영하지 않으므로 DB에서 조회하고 카운터도 갱신
+        if resume_frames is None and (monitor_id_str not in LAST_DISPLAYED_ITEMS or LAST_DISPLAYED_ITEMS[monitor_id_str] == 0):
+            try:
+                latest_no = await get_latest_item_no(event=event)
+                counters.record_latest_item_no(event.name, latest_no)
+                LAST_DISPLAYED_ITEMS[monitor_id_str] = latest_no
+                logger.info(f"Stream 연결 시 모니터 {monitor_id_str} 초기화: 마지막 항목 번호 {latest_no}로 설정")
+            except Exception as e:
+                logger.error(f"Stream 연결 시 모니터 {monitor_id_str} 초기화 오류: {e}")
+    
+        # 모니터 큐 초기화
+        if monitor_id_str not in MONITOR_QUEUES:
+            await update_monitor_queue(monitor_id_str)
+    
+        # 새 항목 없음 로그 카운터 초기화
+        if monitor_id_str not in NO_ITEMS_LOG_COUNTERS:
+            NO_ITEMS_LOG_COUNTERS[monitor_id_str] = 0
+    except BaseException:
+        await release_stream_slot()
+        raise
+
+    async def produce_frames(send_buffer: asyncio.Queue):
+        """SSE_UPDATE_INTERVAL마다 프레임을 만들어 송신 버퍼에 넣습니다. 연결이 끊기면 중단합니다."""
+        try:
+            while True:
+                # 연결이 끊긴 경우 즉시 중단 (쓰기 실패를 기다리지 않음)
+                if await request.is_disconnected():
+                    logger.info(f"모니터 {monitor_id_str} SSE 클라이언트 연결 종료 감지")
+                    break
+
+                response_data = await build_monitor_frame(monitor_id_str)
+                _offer_latest_frame(send_buffer, record_frame(monitor_id_str, response_data))
+                await asyncio.sleep(SSE_UPDATE_INTERVAL)  # SSE_UPDATE_INTERVAL 간격으로 업데이트
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"모니터 {monitor_id_str} SSE 프레임 생성 오류: {e}")
+        # 스트림 종료 신호
+        _offer_latest_frame(send_buffer, None)
+
+    async def event_generator():
+        # 송신 버퍼는 최신 프레임 1개만 보관 (느린 클라이언트의 오래된 프레임이 메모리에 쌓이지 않음)
+        send_buffer: asyncio.Queue = asyncio.Queue(maxsize=1)
+        producer = asyncio.create_task(produce_frames(send_buffer))
+        try:
+            # 재연결한 클라이언트가 놓친 최신 프레임을 먼저 전송
+            for frame in resume_frames or []:
+                yield frame
+            while True:
+                frame = await send_buffer.get()
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            producer.cancel()
+            await release_stream_slot()
+    
+    # 생성기가 시작되기 전에 연결이 끊겨도 응답 후 작업으로 슬롯을 반환
     return StreamingResponse(
         event_generator(),
-        media_type="text/event-stream"
+        media_type="text/event-stream",
+        background=BackgroundTask(release_stream_slot),
     )
 
+@router.get("/{monitor_id}/stream")
+async def stream_monitor_updates(monitor_id: int, request: Request, last_event_id: Optional[str] = None):
+    """기본 이벤트 모니터의 SSE 스트림 (Last-Event-ID 헤더 또는 last_event_id 쿼리로 이어받기)"""
+    last_event_id = request.headers.get("last-event-id") or last_event_id
+    return await open_monitor_stream(settings.DEFAULT_EVENT, monitor_id, request, last_event_id)
+
+@event_router.get("/{monitor_id}/stream")
+async def stream_event_monitor_updates(event_name: str, monitor_id: int, request: Request, last_event_id: Optional[str] = None):
+    """이벤트별 모니터의 SSE 스트림 (Last-Event-ID 헤더 또는 last_event_id 쿼리로 이어받기)"""
+    last_event_id = request.headers.get("last-event-id") or last_event_id
+    return await open_monitor_stream(get_event_or_404(event_name), monitor_id, request, last_event_id)
+
 @router.get("/{monitor_id}/ping")
 async def ping_monitor(monitor_id: int):
     """
     클라이언트의 핑 요청을 처리하는 엔드포인트.
     SSE 연결을 유지하기 위한 더미 요청을 처리합니다.
     """
-    return JSONResponse({"status": "ok", "monitor_id": monitor_id, "timestamp": datetime.now().isoformat()})
\ No newline at end of file
+    return JSONResponse({"status": "ok", "monitor_id": monitor_id, "timestamp": datetime.now().isoformat()})
+
+@event_router.get("/{monitor_id}/ping")
+async def ping_event_monitor(event_name: str, monitor_id: int):
+    """이벤트별 모니터의 핑 요청을 처리하는 엔드포인트"""
+    event = get_event_or_404(event_name)
+    return JSONResponse({"status": "ok", "event": event.name, "monitor_id": monitor_id, "timestamp": datetime.now().isoformat()})
\ No newline at end of file
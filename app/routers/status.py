@@ -1,6 +1,10 @@
 import logging
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
+from ..core.config import settings
+from ..internal.counters import get_counters_snapshot, get_query_timeouts_snapshot
+from ..internal.circuit_breaker import DB_BREAKER, REPLICA_BREAKER
+from ..internal import push  # 모듈로 임포트 (push 가 monitors 라우터를 임포트하므로 순환 방지)
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +17,32 @@ async def read_root():
     """서버 상태 확인용 루트 엔드포인트"""
     return {"message": "Monitor Data Server is running"}
 
+@router.get("/status/counters")
+async def read_counters():
+    """
+    프로세스 내 카운터(최신 항목 번호, 상태별 항목 수, 모니터별 대기 항목 수)를 반환합니다.
+    DB를 조회하지 않으므로 자주 호출해도 부담이 없습니다.
+    """
+    return get_counters_snapshot()
+
+@router.get("/status/db")
+async def read_db_status():
+    """
+    DB 상태를 반환합니다: 주 DB 차단기 상태(healthy 가 false 면 모니터는 메모리의 마지막 큐로 표시 중),
+    복제본 차단기 상태(열려 있으면 조회를 주 DB로 보내는 중)와 작업별 마감 시간 초과 횟수 (연결 대기 / 쿼리 실행)
+    """
+    return {
+        "healthy": DB_BREAKER.healthy,
+        "circuit_breaker": DB_BREAKER.snapshot(),
+        "replica_circuit_breaker": REPLICA_BREAKER.snapshot() if settings.DB_REPLICA_HOST else None,
+        "query_timeouts": get_query_timeouts_snapshot(),
+    }
+
+@router.get("/status/push")
+async def read_push_status():
+    """푸시 전송 대기/진행 중인 수와 모니터별 전송·실패·재시도 수, 지연 시간(ms)을 반환합니다."""
+    return push.get_push_stats_snapshot()
+
 @router.post("/mock_monitor_endpoint/")
 async def mock_monitor_endpoint(request: Request):
     """
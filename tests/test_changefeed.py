@@ -0,0 +1,99 @@
+import unittest
+from unittest import mock
+
+from app.core.config import settings
+from app.internal import changefeed, counters
+
+EVENT = settings.DEFAULT_EVENT
+
+
+class ChangefeedGapTest(unittest.IsolatedAsyncioTestCase):
+    """늦게 커밋되어 건너뛴 seq 를 다시 조회해 반영하고, 유예 시간이 지나면 포기하는지 확인합니다."""
+
+    async def asyncSetUp(self):
+        self.now = 1000.0
+        self.visible = {}  # 커밋되어 피드에서 보이는 기록 (seq -> 모니터 ID)
+        self.marked = []
+        self.patches = [
+            mock.patch.object(settings, "CHANGEFEED_BATCH_SIZE", 10),
+            mock.patch.object(settings, "CHANGEFEED_GAP_GRACE_SECONDS", 15),
+            mock.patch.object(changefeed, "get_changefeed_since", mock.AsyncMock(side_effect=self.fetch_since)),
+            mock.patch.object(changefeed, "note_assignment_write"),
+            mock.patch.object(changefeed, "mark_monitor_stale", side_effect=lambda event, adr: self.marked.append(adr)),
+            # 이벤트 루프의 시계는 그대로 두고 tailer 가 보는 monotonic 만 교체
+            mock.patch.object(changefeed, "time", mock.Mock(monotonic=lambda: self.now)),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        changefeed.LAST_SEQ[EVENT.name] = 0
+        changefeed.PENDING_GAPS.pop(EVENT.name, None)
+        counters.MONITOR_BACKLOG.pop(EVENT.name, None)
+
+    async def asyncTearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def fetch_since(self, after_seq: int, batch_size: int, event=None) -> list:
+        seqs = sorted(seq for seq in self.visible if seq > after_seq)[:batch_size]
+        return [{"seq": seq, "item_no": seq * 10, "monitor_id": self.visible[seq]} for seq in seqs]
+
+    async def poll(self):
+        self.marked.clear()
+        await changefeed.poll_changefeed(EVENT)
+        return list(self.marked)
+
+    async def test_gap_filled_on_rescan(self):
+        self.visible = {1: "1", 3: "3"}
+        self.assertEqual(await self.poll(), ["1", "3"])
+        self.assertEqual(changefeed.PENDING_GAPS[EVENT.name], {2: 1000.0})
+
+        # seq 2 가 늦게 커밋됨: 빈 번호부터 다시 읽고 이미 반영한 3 은 건너뜀
+        self.visible[2] = "2"
+        self.now += 5
+        self.assertEqual(await self.poll(), ["2"])
+        self.assertEqual(changefeed.get_changefeed_since.await_args.args[0], 1)
+        self.assertEqual(changefeed.PENDING_GAPS[EVENT.name], {})
+        self.assertEqual(changefeed.LAST_SEQ[EVENT.name], 3)
+        self.assertEqual(counters.get_monitor_backlog(EVENT.name, "2"), 1)
+
+    async def test_gap_expires_after_grace(self):
+        self.visible = {1: "1", 3: "3"}
+        await self.poll()
+
+        self.now += settings.CHANGEFEED_GAP_GRACE_SECONDS + 1
+        self.assertEqual(await self.poll(), [])
+        self.assertEqual(changefeed.get_changefeed_since.await_args.args[0], 3)
+        self.assertEqual(changefeed.PENDING_GAPS[EVENT.name], {})
+
+        # 포기한 뒤에 보인 번호는 더 이상 조회 범위에 들어오지 않음
+        self.visible[2] = "2"
+        self.assertEqual(await self.poll(), [])
+
+    async def test_cursor_never_moves_backwards(self):
+        self.visible = {1: "1", 4: "1", 5: "2"}
+        await self.poll()
+        self.assertEqual(changefeed.LAST_SEQ[EVENT.name], 5)
+
+        # 빈 번호를 다시 읽을 때 작은 seq 가 보여도 커서는 그대로
+        self.visible[2] = "2"
+        self.now += 1
+        self.assertEqual(await self.poll(), ["2"])
+        self.assertEqual(changefeed.LAST_SEQ[EVENT.name], 5)
+        self.assertEqual(changefeed.PENDING_GAPS[EVENT.name], {3: 1000.0})
+
+        self.visible[6] = "3"
+        self.visible[3] = "3"
+        self.assertEqual(await self.poll(), ["3", "3"])
+        self.assertEqual(changefeed.LAST_SEQ[EVENT.name], 6)
+        self.assertEqual(changefeed.PENDING_GAPS[EVENT.name], {})
+
+    async def test_reads_following_batches_when_batch_is_full(self):
+        self.visible = {seq: "1" for seq in range(1, 26)}
+        await self.poll()
+        self.assertEqual(changefeed.LAST_SEQ[EVENT.name], 25)
+        self.assertEqual(changefeed.get_changefeed_since.await_count, 3)
+        self.assertEqual(counters.get_monitor_backlog(EVENT.name, "1"), 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
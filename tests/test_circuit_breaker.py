@@ -0,0 +1,103 @@
+import unittest
+from unittest import mock
+
+from app.internal.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    """연속 실패로 열리고, 대기 시간마다 시험 요청 하나로 복구 여부를 확인하는지 확인합니다."""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.patches = [
+            mock.patch("time.monotonic", side_effect=lambda: self.now),
+            # 지터 없이 기본 대기 시간을 그대로 사용
+            mock.patch("random.uniform", return_value=1.0),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.breaker = CircuitBreaker("Test", failure_threshold=3, base_backoff=2.0, max_backoff=60.0)
+        self.error = ConnectionError("db down")
+
+    def tearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+
+    def open_breaker(self):
+        for _ in range(self.breaker.failure_threshold):
+            self.breaker.record_failure(self.error)
+
+    def test_opens_at_failure_threshold(self):
+        for _ in range(self.breaker.failure_threshold - 1):
+            self.breaker.record_failure(self.error)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_failure(self.error)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.retry_after(), 2.0)
+
+    def test_success_resets_consecutive_failures(self):
+        self.breaker.record_failure(self.error)
+        self.breaker.record_failure(self.error)
+        self.breaker.record_success()
+        self.breaker.record_failure(self.error)
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_one_probe_per_backoff_window(self):
+        self.open_breaker()
+
+        self.now += 2.0
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        # 시험 요청 결과가 오기 전에는 같은 대기 시간 동안 다른 요청을 막음
+        self.assertFalse(self.breaker.allow_request())
+        self.now += 1.9
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.probe_count, 1)
+
+        # 결과가 보고되지 않은 채 대기 시간이 지나면 다음 시험 요청을 허용
+        self.now += 0.1
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.probe_count, 2)
+
+    def test_failed_probe_doubles_backoff(self):
+        self.open_breaker()
+        self.now += 2.0
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_failure(self.error)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.retry_after(), 4.0)
+
+        self.now += 4.0
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure(self.error)
+        self.assertEqual(self.breaker.retry_after(), 8.0)
+
+    def test_backoff_is_capped(self):
+        self.breaker.max_backoff = 5.0
+        self.open_breaker()
+        for _ in range(5):
+            self.now += self.breaker.retry_after()
+            self.assertTrue(self.breaker.allow_request())
+            self.breaker.record_failure(self.error)
+        self.assertEqual(self.breaker.retry_after(), 5.0)
+
+    def test_successful_probe_closes(self):
+        self.open_breaker()
+        self.now += 2.0
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+        # 복구 뒤에는 다시 임계값만큼 실패해야 열리고, 대기 시간도 처음 값부터 시작
+        self.open_breaker()
+        self.assertEqual(self.breaker.retry_after(), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import dataclasses
+import unittest
+
+from app.core.config import settings
+from app.routers import monitors
+
+
+class ItemDisplayDurationTest(unittest.TestCase):
+    """대기 항목 수에 따라 표시 시간이 max ~ min 사이에서 줄어드는지 확인합니다."""
+
+    def setUp(self):
+        self.event = dataclasses.replace(
+            settings.DEFAULT_EVENT,
+            item_display_duration=20,
+            min_item_display_duration=10,
+            max_item_display_duration=30,
+            adaptive_backlog_high=4,
+        )
+
+    def test_empty_queue_uses_max_duration(self):
+        self.assertEqual(monitors.get_item_display_duration(self.event, 0), 30)
+
+    def test_only_current_item_uses_max_duration(self):
+        # 큐의 첫 항목은 현재 표시 중인 항목이므로 대기 항목이 없는 것과 같음
+        self.assertEqual(monitors.get_item_display_duration(self.event, 1), 30)
+
+    def test_backlog_between_bounds_is_linear(self):
+        self.assertEqual(monitors.get_item_display_duration(self.event, 3), 20)
+
+    def test_backlog_at_or_above_high_uses_min_duration(self):
+        high = self.event.adaptive_backlog_high
+        self.assertEqual(monitors.get_item_display_duration(self.event, high + 1), 10)
+        self.assertEqual(monitors.get_item_display_duration(self.event, high * 10), 10)
+
+    def test_fixed_duration_when_adaptive_disabled(self):
+        event = dataclasses.replace(self.event, min_item_display_duration=30)
+        self.assertEqual(monitors.get_item_display_duration(event, 100), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+from fastapi import FastAPI, Request, Response
+
+from app.core.config import settings
+from app.internal import clock, push
+from app.internal.records import ItemRecord
+from app.routers import monitors
+
+MONITOR_KEY = "1"
+MONITOR_URL = "http://monitor-1/receive"
+
+
+def build_receiver(received: list, fail_first: int = 0) -> FastAPI:
+    """푸시를 받는 모니터 역할의 앱. 처음 fail_first 번은 503 으로 응답합니다."""
+    receiver = FastAPI()
+    attempts = {"count": 0}
+
+    @receiver.post("/receive")
+    async def receive(request: Request):
+        attempts["count"] += 1
+        if attempts["count"] <= fail_first:
+            return Response(status_code=503)
+        received.append({
+            "seq": int(request.headers["x-push-seq"]),
+            "item_no": int(request.headers["x-item-no"]),
+            "body": (await request.body()).decode("utf-8"),
+        })
+        return {"status": "received"}
+
+    return receiver
+
+
+class PushDeliveryTest(unittest.IsolatedAsyncioTestCase):
+    """표시 스케줄러가 진행시킨 항목이 실제 HTTP 요청으로 모니터에 전달되는지 확인합니다."""
+
+    async def asyncSetUp(self):
+        self.received = []
+        self.sim_clock = clock.VirtualClock(1_000_000.0)
+        clock.set_clock(self.sim_clock)
+        self.patches = [
+            mock.patch.object(settings, "PUSH_MONITOR_URLS", {MONITOR_KEY: MONITOR_URL}),
+            mock.patch.object(settings, "PUSH_RETRY_BASE_SECONDS", 0.01),
+            mock.patch.object(monitors, "SSE_UPDATE_INTERVAL", 0.01),
+            # 큐가 비었을 때 DB를 조회하지 않도록 함 (큐는 테스트에서 직접 채움)
+            mock.patch.object(monitors, "update_monitor_queue", mock.AsyncMock()),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        for state in (push.DELIVERY_STATS, push.PUSH_SEQUENCES, push.LAST_PUSHED_ITEMS):
+            state.clear()
+        for state in (monitors.MONITOR_QUEUES, monitors.CURRENT_ITEMS, monitors.DISPLAY_TIMES):
+            state.pop(MONITOR_KEY, None)
+        monitors.LAST_DISPLAYED_ITEMS[MONITOR_KEY] = 0
+        self.dispatcher_task = None
+
+    async def asyncTearDown(self):
+        if self.dispatcher_task:
+            self.dispatcher_task.cancel()
+            await asyncio.gather(self.dispatcher_task, return_exceptions=True)
+        await push.stop_push_dispatcher()
+        for patcher in self.patches:
+            patcher.stop()
+        clock.set_clock(clock.SystemClock())
+
+    def start(self, fail_first: int = 0):
+        receiver = build_receiver(self.received, fail_first)
+        self.dispatcher_task = push.start_push_dispatcher(transport=httpx.ASGITransport(app=receiver))
+
+    async def wait_for_deliveries(self, count: int):
+        for _ in range(200):
+            if len(self.received) >= count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f"expected {count} deliveries, got {len(self.received)}")
+
+    async def test_pushes_each_item_when_its_display_turn_comes(self):
+        monitors.MONITOR_QUEUES[MONITOR_KEY] = [
+            ItemRecord(1, "first", adr=MONITOR_KEY, state=1),
+            ItemRecord(2, "second", adr=MONITOR_KEY, state=1),
+        ]
+        self.start()
+
+        await self.wait_for_deliveries(1)
+        # 표시 시간이 지나기 전에는 다음 항목을 보내지 않음
+        await asyncio.sleep(0.1)
+        self.assertEqual([(d["seq"], d["item_no"]) for d in self.received], [(1, 1)])
+        self.assertIn("first", self.received[0]["body"])
+
+        event = settings.DEFAULT_EVENT
+        self.sim_clock.advance(max(event.item_display_duration, event.max_item_display_duration) + 1)
+        await self.wait_for_deliveries(2)
+        # 큐가 빈 뒤 같은 항목을 계속 표시하는 동안에는 다시 보내지 않음
+        await asyncio.sleep(0.1)
+        self.assertEqual([(d["seq"], d["item_no"]) for d in self.received], [(1, 1), (2, 2)])
+        self.assertIn("second", self.received[1]["body"])
+        self.assertEqual(push.DELIVERY_STATS[MONITOR_KEY]["delivered"], 2)
+
+    async def test_retries_retryable_status(self):
+        monitors.MONITOR_QUEUES[MONITOR_KEY] = [ItemRecord(7, "retry me", adr=MONITOR_KEY, state=1)]
+        self.start(fail_first=1)
+
+        await self.wait_for_deliveries(1)
+        stats = push.DELIVERY_STATS[MONITOR_KEY]
+        self.assertEqual(self.received[0]["item_no"], 7)
+        self.assertEqual((stats["delivered"], stats["retries"], stats["failed"]), (1, 1, 0))
+
+    async def test_newer_item_supersedes_older_item_waiting_to_retry(self):
+        monitors.MONITOR_QUEUES[MONITOR_KEY] = []
+        # 재시도 대기를 고정해 그사이에 새 항목을 넣을 수 있도록 함
+        with mock.patch.object(push.random, "uniform", return_value=0.3):
+            self.start(fail_first=1)
+            push.enqueue_item_delivery(MONITOR_KEY, ItemRecord(1, "older", adr=MONITOR_KEY, state=1))
+            await asyncio.sleep(0.1)
+            push.enqueue_item_delivery(MONITOR_KEY, ItemRecord(2, "newer", adr=MONITOR_KEY, state=1))
+
+            await self.wait_for_deliveries(1)
+            await asyncio.sleep(0.1)
+
+        # 이전 항목은 새 항목보다 늦게 도착하지 않고 버려짐
+        self.assertEqual([(d["seq"], d["item_no"]) for d in self.received], [(2, 2)])
+        stats = push.DELIVERY_STATS[MONITOR_KEY]
+        self.assertEqual((stats["delivered"], stats["superseded"], stats["failed"]), (1, 1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import unittest
+from unittest import mock
+
+from app.core.config import settings
+from app.internal import clock
+from app.routers import monitors
+
+MONITOR_KEY = "1"
+
+
+def frame_data(item_no: int, remaining_time: float) -> dict:
+    return {"item": {"no": item_no, "text": f"item {item_no}"}, "remaining_time": remaining_time}
+
+
+def parse_frame(frame: str) -> tuple:
+    """SSE 프레임 문자열에서 (id, data) 를 꺼냅니다."""
+    id_line, data_line = frame.strip().split("\n")
+    return id_line[len("id: "):], json.loads(data_line[len("data: "):])
+
+
+class FindResumeFramesTest(unittest.TestCase):
+    """Last-Event-ID 로 재연결할 때 링 버퍼에서 이어받을 프레임을 찾는지 확인합니다."""
+
+    def setUp(self):
+        self.sim_clock = clock.VirtualClock(1_000_000.0)
+        clock.set_clock(self.sim_clock)
+        self.patch = mock.patch.object(settings, "SSE_REPLAY_BUFFER_SIZE", 3)
+        self.patch.start()
+        monitors.FRAME_HISTORY.pop(MONITOR_KEY, None)
+        monitors.FRAME_SEQUENCES.pop(MONITOR_KEY, None)
+
+    def tearDown(self):
+        self.patch.stop()
+        clock.set_clock(clock.SystemClock())
+
+    def event_id(self, seq: int) -> str:
+        return f"{monitors.STREAM_EPOCH}-{seq}"
+
+    def record(self, count: int):
+        for item_no in range(1, count + 1):
+            monitors.record_frame(MONITOR_KEY, frame_data(item_no, 20))
+
+    def test_missed_frames_resume_from_latest_with_elapsed_time(self):
+        self.record(3)
+        self.sim_clock.advance(5)
+
+        frames = monitors.find_resume_frames(MONITOR_KEY, self.event_id(1))
+
+        self.assertEqual(len(frames), 1)
+        frame_id, data = parse_frame(frames[0])
+        self.assertEqual(frame_id, self.event_id(3))
+        self.assertEqual(data["item"]["no"], 3)
+        self.assertEqual(data["remaining_time"], 15)
+
+    def test_id_equal_to_latest_frame_needs_nothing(self):
+        self.record(3)
+        self.assertEqual(monitors.find_resume_frames(MONITOR_KEY, self.event_id(3)), [])
+
+    def test_id_older_than_buffer_cannot_resume(self):
+        # 버퍼 크기 3 이므로 4, 5, 6 만 남음 (3 은 4 바로 앞이라 이어받을 수 있음)
+        self.record(6)
+        self.assertIsNone(monitors.find_resume_frames(MONITOR_KEY, self.event_id(2)))
+        self.assertIsNotNone(monitors.find_resume_frames(MONITOR_KEY, self.event_id(3)))
+
+    def test_unknown_monitor_cannot_resume(self):
+        self.assertIsNone(monitors.find_resume_frames("unknown", self.event_id(1)))
+
+    def test_id_from_other_process_cannot_resume(self):
+        self.record(3)
+        self.assertIsNone(monitors.find_resume_frames(MONITOR_KEY, "0-2"))
+        self.assertIsNone(monitors.find_resume_frames(MONITOR_KEY, self.event_id(4)))
+
+
+if __name__ == "__main__":
+    unittest.main()